@@ -6,18 +6,23 @@ from libs.ddd.domain_event import DomainEvent
 
 
 class Aggregate[TId](ABC, BaseEntity[TId], AggregateRoot[TId]):
+    __slots__ = ("_domain_events",)
+
     def __init__(self, id_: TId | None = None) -> None:
         super().__init__(id_)
-        self._domain_events: list[DomainEvent] = []
+        # Большинство агрегатов событий не порождает, список создается при первом событии.
+        self._domain_events: list[DomainEvent] | None = None
 
     def get_id(self) -> TId:
         return self.id_  # type: ignore[override,return-value]
 
     def get_domain_events(self) -> list[DomainEvent]:
-        return self._domain_events.copy()
+        return self._domain_events.copy() if self._domain_events else []
 
     def clear_domain_events(self) -> None:
-        self._domain_events.clear()
+        self._domain_events = None
 
     def raise_domain_event(self, domain_event: DomainEvent) -> None:
+        if self._domain_events is None:
+            self._domain_events = []
         self._domain_events.append(domain_event)
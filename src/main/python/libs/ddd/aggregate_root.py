@@ -4,6 +4,8 @@ from libs.ddd.domain_event import DomainEvent
 
 
 class AggregateRoot[ID](typing.Protocol):
+    __slots__ = ()
+
     def get_id(self) -> ID: ...
 
     def get_domain_events(self) -> list[DomainEvent]: ...
@@ -1,14 +1,57 @@
 from typing import Any
 
+# Порядок полей снимка по классам сущностей, см. `BaseEntity._restore_snapshot`.
+_SNAPSHOT_FIELDS: dict[type, tuple[str, ...]] = {}
+
 
 class BaseEntity[TId: Any]:
+    # Слоты во всей иерархии сущностей: у экземпляров нет `__dict__`, наследники объявляют свои поля в `__slots__`.
+    __slots__ = ("_id", "_snapshot")
+
     def __init__(self, id_: TId | None = None) -> None:
         self._id = id_
+        # Значения `_persistent_state` на момент `mark_clean`, в порядке его ключей: кортеж компактнее словаря.
+        self._snapshot: tuple[Any, ...] | None = None
 
     @property
     def id_(self) -> TId | None:
         return self._id
 
+    @property
+    def is_new(self) -> bool:
+        # Сущность еще ни разу не загружалась из хранилища и не сохранялась в него.
+        return self._snapshot is None
+
+    def mark_clean(self) -> None:
+        # Запоминает текущее состояние как сохраненное, следующие изменения считаются относительно него.
+        self._snapshot = tuple(self._persistent_state().values())
+
+    def _restore_snapshot(self, fields: tuple[str, ...], values: tuple[Any, ...]) -> None:
+        # Снимок из сохраненных значений для доверенного `restore`, без вызова `_persistent_state` на каждую
+        # сущность. `fields` называет поля `values`; если они разошлись с ключами `_persistent_state` (поле
+        # добавлено или переставлено), `get_changes` сравнивал бы не те значения, поэтому это ошибка.
+        expected = _SNAPSHOT_FIELDS.get(type(self))
+        if expected is None:
+            expected = _SNAPSHOT_FIELDS[type(self)] = tuple(self._persistent_state())
+        if fields != expected:
+            msg = f"Restored fields {fields} do not match persistent state {expected}"
+            raise ValueError(msg)
+        self._snapshot = values
+
+    def get_changes(self) -> dict[str, Any]:
+        # Поля, изменившиеся с последнего `mark_clean`. У новой сущности изменено все состояние.
+        state = self._persistent_state()
+        if self._snapshot is None:
+            return state
+
+        return {
+            name: value for (name, value), saved in zip(state.items(), self._snapshot, strict=True) if saved != value
+        }
+
+    def _persistent_state(self) -> dict[str, Any]:
+        # Поля, изменения которых отслеживаются. Наследники перечисляют свое сохраняемое состояние.
+        return {}
+
     def _is_transient(self) -> bool:
         return self._id is None or self._id == self._default_value()
 
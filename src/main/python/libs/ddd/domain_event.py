@@ -4,7 +4,21 @@ from typing import Any
 
 
 class DomainEvent:
-    def __init__(self, source: Any = None) -> None:  # noqa: ANN401
-        self._event_id = uuid.uuid4()
-        self._occurred_on_utc = datetime.now(tz=UTC)
+    def __init__(
+        self,
+        source: Any = None,  # noqa: ANN401
+        event_id: uuid.UUID | None = None,
+        occurred_on_utc: datetime | None = None,
+    ) -> None:
+        # `event_id` и `occurred_on_utc` передаются при восстановлении события из хранилища.
+        self._event_id = event_id or uuid.uuid4()
+        self._occurred_on_utc = occurred_on_utc or datetime.now(tz=UTC)
         self.source = source
+
+    @property
+    def event_id(self) -> uuid.UUID:
+        return self._event_id
+
+    @property
+    def occurred_on_utc(self) -> datetime:
+        return self._occurred_on_utc
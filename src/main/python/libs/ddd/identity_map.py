@@ -0,0 +1,30 @@
+import typing
+from collections.abc import Iterator
+
+from libs.ddd.base_entity import BaseEntity
+
+
+class IdentityMap[TId, TEntity: BaseEntity]:
+    # Хранит по одному экземпляру сущности на идентификатор. Повторная загрузка той же сущности
+    # возвращает уже известный экземпляр вместе со всеми его несохраненными изменениями.
+
+    def __init__(self) -> None:
+        self._entities: dict[TId, TEntity] = {}
+
+    def get(self, id_: TId) -> TEntity | None:
+        return self._entities.get(id_)
+
+    def add(self, entity: TEntity) -> TEntity:
+        return self._entities.setdefault(typing.cast("TId", entity.id_), entity)
+
+    def clear(self) -> None:
+        self._entities.clear()
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self._entities
+
+    def __iter__(self) -> Iterator[TEntity]:
+        return iter(self._entities.values())
+
+    def __len__(self) -> int:
+        return len(self._entities)
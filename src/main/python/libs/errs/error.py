@@ -1,14 +1,24 @@
+import uuid
 from typing import Final
 
 MIN_LEN_PARTS: Final = 2
+# Аргументы сообщения этих типов не меняются после создания ошибки, их можно форматировать позже.
+_IMMUTABLE_ARG_TYPES: Final = frozenset({str, int, float, bool, type(None), uuid.UUID})
 
 
 class Error:
+    __slots__ = ("_code", "_message", "_message_args")
+
     SEPARATOR = "||"
 
-    def __init__(self, code: str, message: str) -> None:
+    def __init__(self, code: str, message: str, *message_args: object) -> None:
+        # С аргументами `message` - шаблон для `str.format` с позиционными `{}`. Сообщение собирается при первом
+        # обращении к нему, поэтому ошибки, у которых проверяют только код, не тратят время на форматирование.
+        # Аргументы других типов сразу превращаются в строку: иначе ошибка держала бы ссылку на изменяемый объект,
+        # и сообщение показывало бы его состояние на момент чтения, а не на момент ошибки.
         self._code = code
         self._message = message
+        self._message_args = tuple(arg if type(arg) in _IMMUTABLE_ARG_TYPES else str(arg) for arg in message_args)
 
     @property
     def code(self) -> str:
@@ -16,10 +26,13 @@ class Error:
 
     @property
     def message(self) -> str:
+        if self._message_args:
+            self._message = self._message.format(*self._message_args)
+            self._message_args = ()
         return self._message
 
     def serialize(self) -> str:
-        return f"{self._code}{self.SEPARATOR}{self._message}"
+        return f"{self._code}{self.SEPARATOR}{self.message}"
 
     @classmethod
     def deserialize(cls, serialized: str) -> "Error":
@@ -45,13 +58,13 @@ class Error:
         if self is other:
             return True
 
-        return self._code == other._code and self._message == other._message
+        return self._code == other._code and self.message == other.message
 
     def __hash__(self) -> int:
-        return hash((self._code, self._message))
+        return hash((self._code, self.message))
 
     def __repr__(self) -> str:
-        return f"Error{{code='{self._code}', message='{self._message}'}}"
+        return f"Error{{code='{self._code}', message='{self.message}'}}"
 
 
 class DomainInvariantError[**P](Exception):
@@ -65,41 +78,45 @@ class GeneralErrors[T]:
         if GeneralErrors._is_null_or_empty(name):
             raise ValueError("Name must not be null or empty")
 
-        return Error("record.not.found", f"Record not found. Name: {name}, id: {id_}")
+        return Error("record.not.found", "Record not found. Name: {}, id: {}", name, id_)
 
     @staticmethod
     def value_is_invalid(name: str, value: T) -> Error:
         if GeneralErrors._is_null_or_empty(name):
             raise ValueError("Name must not be null or empty")
 
-        return Error("value.is.invalid", f"Value '{value}' is invalid for {name}")
+        return Error("value.is.invalid", "Value '{}' is invalid for {}", value, name)
 
     @staticmethod
     def value_is_required(name: str) -> Error:
         if GeneralErrors._is_null_or_empty(name):
             raise ValueError("Name must not be null or empty")
 
-        return Error("value.is.required", f"Value is required for {name}")
+        return Error("value.is.required", "Value is required for {}", name)
 
     @staticmethod
     def invalid_length(name: str) -> Error:
         if GeneralErrors._is_null_or_empty(name):
             raise ValueError("Name must not be null or empty")
 
-        return Error("invalid.string.length", f"Invalid {name} length")
+        return Error("invalid.string.length", "Invalid {} length", name)
 
     @staticmethod
     def collection_is_too_small(min_size: int, current_size: int) -> Error:
         return Error(
             "collection.is.too.small",
-            f"The collection must contain {min_size} items or more. It contains {current_size} items.",
+            "The collection must contain {} items or more. It contains {} items.",
+            min_size,
+            current_size,
         )
 
     @staticmethod
     def collection_is_too_large(max_size: int, current_size: int) -> Error:
         return Error(
             "collection.is.too.large",
-            f"The collection must contain {max_size} items or fewer. It contains {current_size} items.",
+            "The collection must contain {} items or fewer. It contains {} items.",
+            max_size,
+            current_size,
         )
 
     @staticmethod
@@ -107,8 +124,8 @@ class GeneralErrors[T]:
         if GeneralErrors._is_null_or_empty(name):
             raise ValueError("Name must not be null or empty")
 
-        message = f"Value {value} for {name} is out of range. Min value is {min_value}, max value is {max_value}."
-        return Error("value.is.out.of.range", message)
+        message = "Value {} for {} is out of range. Min value is {}, max value is {}."
+        return Error("value.is.out.of.range", message, value, name, min_value, max_value)
 
     @staticmethod
     def value_must_be_greater_than(name: str, value: T, min_value: T) -> Error:
@@ -117,7 +134,10 @@ class GeneralErrors[T]:
 
         return Error(
             "value.must.be.greater.than",
-            f"The value of {name} ({value}) must be greater than {min_value}.",
+            "The value of {} ({}) must be greater than {}.",
+            name,
+            value,
+            min_value,
         )
 
     @staticmethod
@@ -127,7 +147,10 @@ class GeneralErrors[T]:
 
         return Error(
             "value.must.be.greater.or.equal",
-            f"The value of {name} ({value}) must be greater than or equal to {min_value}.",
+            "The value of {} ({}) must be greater than or equal to {}.",
+            name,
+            value,
+            min_value,
         )
 
     @staticmethod
@@ -137,7 +160,10 @@ class GeneralErrors[T]:
 
         return Error(
             "value.must.be.less.than",
-            f"The value of {name} ({value}) must be less than {max_value}.",
+            "The value of {} ({}) must be less than {}.",
+            name,
+            value,
+            max_value,
         )
 
     @staticmethod
@@ -147,7 +173,10 @@ class GeneralErrors[T]:
 
         return Error(
             "value.must.be.less.or.equal",
-            f"The value of {name} ({value}) must be less than or equal to {max_value}.",
+            "The value of {} ({}) must be less than or equal to {}.",
+            name,
+            value,
+            max_value,
         )
 
     @staticmethod
@@ -5,6 +5,8 @@ from libs.errs import DomainInvariantError, Error
 
 
 class Result[T, E: Error]:
+    __slots__ = ("_error", "_is_success", "_value")
+
     def __init__(self, value: T | None, error: E | None, is_success: bool) -> None:
         self._value = value
         self._error = error
@@ -18,7 +20,7 @@ class Result[T, E: Error]:
 
     @classmethod
     def success_void(cls) -> "Result[None, Any]":
-        return cls(value=None, error=None, is_success=True)  # type: ignore[return-value]
+        return _SUCCESS_VOID
 
     @classmethod
     def failure(cls, error: E) -> "Result[Any, E]":
@@ -73,7 +75,7 @@ class Result[T, E: Error]:
 
     def map_error[F: Error](self, mapper: Callable[[E], F]) -> "Result[T, F]":
         if self._is_success:
-            return Result.success(self._value)  # type: ignore[arg-type]
+            return cast("Result[T, F]", self)
         return Result.failure(mapper(cast("E", self._error)))
 
     def get_value_or_throw(self) -> T:
@@ -88,3 +90,7 @@ class Result[T, E: Error]:
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+# Результат неизменяем, поэтому успех без значения - один общий экземпляр.
+_SUCCESS_VOID: "Result[None, Any]" = Result(value=None, error=None, is_success=True)
@@ -6,13 +6,15 @@ from .result import Result
 
 
 class UnitResult[E: Error]:
+    __slots__ = ("_error", "_is_success")
+
     def __init__(self, is_success: bool, error: E | None) -> None:
         self._is_success = is_success
         self._error = error
 
     @classmethod
     def success(cls) -> "UnitResult[Any]":
-        return cls(is_success=True, error=None)
+        return _SUCCESS
 
     @classmethod
     def failure(cls, error: E) -> "UnitResult[E]":
@@ -83,3 +85,7 @@ class UnitResult[E: Error]:
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+# Результат неизменяем, поэтому успех - один общий экземпляр, и успешные операции ничего не выделяют.
+_SUCCESS: "UnitResult[Any]" = UnitResult(is_success=True, error=None)
@@ -0,0 +1,59 @@
+import datetime
+import json
+import typing
+import uuid
+
+from libs.ddd.domain_event import DomainEvent
+
+from microarch.delivery.core.domain.model.order import OrderAssignedDomainEvent, OrderCompletedDomainEvent
+
+# События топика заказов - интеграционные события из orders_events.proto в JSON представлении proto3,
+# так же, как события корзин, которые читает `basket_events_consumer`. Тип события в поле eventType - имя
+# proto сообщения, occurredAt - google.protobuf.Timestamp в формате RFC 3339.
+type OrderDomainEvent = OrderAssignedDomainEvent | OrderCompletedDomainEvent
+
+# Доменное событие -> proto сообщение.
+_EVENT_TYPES: typing.Final[dict[type[OrderDomainEvent], str]] = {
+    OrderAssignedDomainEvent: "OrderAssignedIntegrationEvent",
+    OrderCompletedDomainEvent: "OrderCompletedIntegrationEvent",
+}
+_EVENT_CLASSES: typing.Final = {event_type: event_class for event_class, event_type in _EVENT_TYPES.items()}
+
+_TIMESTAMP_FORMAT: typing.Final = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def encode_event(event: DomainEvent) -> bytes:
+    event_type = _EVENT_TYPES.get(typing.cast("type[OrderDomainEvent]", type(event)))
+    if event_type is None:
+        raise ValueError(f"No integration event for event type: '{type(event).__name__}'")
+    event = typing.cast("OrderDomainEvent", event)
+    return json.dumps(
+        {
+            "eventId": str(event.event_id),
+            "eventType": event_type,
+            "occurredAt": event.occurred_on_utc.astimezone(datetime.UTC).strftime(_TIMESTAMP_FORMAT),
+            "orderId": str(event.order_id),
+            "courierId": str(event.courier_id),
+        },
+        separators=(",", ":"),
+    ).encode()
+
+
+def decode_event(data: bytes) -> DomainEvent:
+    try:
+        message = json.loads(data)
+        event_type = message.get("eventType")
+    except (AttributeError, ValueError) as e:
+        raise ValueError(f"Invalid order event: {e}") from e
+    event_class = _EVENT_CLASSES.get(event_type)
+    if event_class is None:
+        raise ValueError(f"Unsupported event type: '{event_type}'")
+    try:
+        return event_class(
+            uuid.UUID(message["orderId"]),
+            uuid.UUID(message["courierId"]),
+            event_id=uuid.UUID(message["eventId"]),
+            occurred_on_utc=datetime.datetime.fromisoformat(message["occurredAt"]),
+        )
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid order event: {e}") from e
@@ -0,0 +1,36 @@
+import asyncio
+import typing
+
+from libs.ddd.domain_event import DomainEvent
+
+from microarch.delivery.adapters.out.kafla.event_codec import encode_event
+from microarch.delivery.core.domain.model.order import OrderAssignedDomainEvent, OrderCompletedDomainEvent
+from microarch.delivery.core.ports.message_bus_producer import IMessageBusProducer
+
+
+class IKafkaProducer(typing.Protocol):
+    # Подмножество API асинхронного Kafka продьюсера (как у aiokafka.AIOKafkaProducer). `send` ставит сообщение
+    # в буфер клиента и возвращает future, который завершается, когда брокер подтвердил запись.
+    async def send(self, topic: str, value: bytes, key: bytes | None = ...) -> asyncio.Future[typing.Any]: ...
+
+
+class KafkaMessageBusProducer(IMessageBusProducer):
+    # Публикует доменные события в топик заказов как интеграционные события orders_events.proto (`event_codec`).
+    # Ключ сообщения - идентификатор заказа, поэтому события одного заказа читаются в порядке возникновения.
+    # Пачка отправляется целиком, а `publish` возвращается, только когда брокер подтвердил все ее сообщения.
+
+    def __init__(self, producer: IKafkaProducer, topic: str) -> None:
+        self._producer = producer
+        self._topic = topic
+
+    async def publish(self, events: typing.Sequence[DomainEvent]) -> None:
+        deliveries = [
+            await self._producer.send(self._topic, encode_event(event), key=self._key(event)) for event in events
+        ]
+        await asyncio.gather(*deliveries)
+
+    @staticmethod
+    def _key(event: DomainEvent) -> bytes | None:
+        if isinstance(event, OrderAssignedDomainEvent | OrderCompletedDomainEvent):
+            return event.order_id.bytes
+        return None
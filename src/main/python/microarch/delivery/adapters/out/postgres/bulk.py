@@ -0,0 +1,84 @@
+import itertools
+import typing
+from collections import defaultdict
+from collections.abc import Sequence
+
+from sqlalchemy import Table, bindparam, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# PostgreSQL принимает не больше 65535 параметров в одном запросе.
+MAX_BIND_PARAMETERS: typing.Final = 65535
+DEFAULT_BATCH_SIZE: typing.Final = 1000
+
+type Row = dict[str, typing.Any]
+
+
+async def upsert(
+    session: AsyncSession,
+    table: Table,
+    rows: Sequence[Row],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    # INSERT ... ON CONFLICT (pk) DO UPDATE одним запросом на пачку строк. Обновляются только колонки,
+    # переданные в строках, остальные (например, заполняемые БД по умолчанию) не трогаются.
+    # PostgreSQL не дает одному запросу обновить строку дважды, поэтому из строк с одинаковым первичным ключом
+    # остается последняя.
+    if not rows:
+        return
+
+    pk_names = [column.name for column in table.primary_key.columns]
+    rows = list({tuple(row[name] for name in pk_names): row for row in rows}.values())
+
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(table.primary_key.columns),
+        set_={
+            column.name: stmt.excluded[column.name]
+            for column in table.columns
+            if not column.primary_key and column.name in rows[0]
+        },
+    )
+
+    batch_size = max(1, min(batch_size, MAX_BIND_PARAMETERS // len(table.columns)))
+    for batch in itertools.batched(rows, batch_size, strict=False):
+        await session.execute(stmt.values(list(batch)))
+
+
+async def insert_if_absent(
+    session: AsyncSession,
+    table: Table,
+    rows: Sequence[Row],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[typing.Any]:
+    # INSERT ... ON CONFLICT DO NOTHING одним запросом на пачку строк. Существующие строки не меняются,
+    # возвращаются первичные ключи только вставленных строк.
+    if not rows:
+        return []
+
+    [pk] = table.primary_key.columns
+    stmt = insert(table).on_conflict_do_nothing().returning(pk)
+
+    inserted: list[typing.Any] = []
+    batch_size = max(1, min(batch_size, MAX_BIND_PARAMETERS // len(table.columns)))
+    for batch in itertools.batched(rows, batch_size, strict=False):
+        inserted.extend(await session.scalars(stmt.values(list(batch))))
+    return inserted
+
+
+async def update_changed(session: AsyncSession, table: Table, rows: Sequence[Row]) -> None:
+    # UPDATE ... SET только колонок, переданных в строке, поиск по "id". Строки с одинаковым
+    # набором колонок отправляются одним executemany.
+    groups: defaultdict[tuple[str, ...], list[Row]] = defaultdict(list)
+    for row in rows:
+        groups[tuple(sorted(row.keys() - {"id"}))].append(row)
+
+    for columns, group in groups.items():
+        if not columns:
+            continue
+
+        stmt = update(table).where(table.c.id == bindparam("_id"))
+        await session.execute(
+            stmt,
+            [{"_id": row["id"], **{column: row[column] for column in columns}} for row in group],
+        )
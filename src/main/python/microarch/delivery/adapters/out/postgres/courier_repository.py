@@ -1,30 +1,212 @@
+import typing
 import uuid
 
-from sqlalchemy import select
+from libs.ddd.identity_map import IdentityMap
+from sqlalchemy import ColumnElement, Float, Integer, Select, Table, any_, cast, func, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from microarch.delivery.adapters.out.postgres import bulk
 from microarch.delivery.adapters.out.postgres.models import CourierModel, StoragePlaceModel
 from microarch.delivery.core.domain.model.courier.courier import Courier
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.kernel.volume import Volume
 from microarch.delivery.core.ports.courier_repository import ICourierRepository
 
+DEFAULT_BATCH_SIZE: typing.Final = bulk.DEFAULT_BATCH_SIZE
+
 
 class SqlAlchemyCourierRepository(ICourierRepository):
-    def __init__(self, async_session: AsyncSession) -> None:
+    def __init__(
+        self,
+        async_session: AsyncSession,
+        identity_map: IdentityMap[uuid.UUID, Courier] | None = None,
+    ) -> None:
+        # С `identity_map` репозиторий возвращает один и тот же экземпляр курьера на идентификатор
+        # и не читает из БД курьеров, которые уже в нем есть.
         self._async_session = async_session
+        self._identity_map = identity_map
 
     async def save(self, courier: Courier) -> None:
-        courier_model = CourierModel.from_entity(courier)
-        await self._async_session.merge(courier_model)
-        await self._async_session.flush()
+        await self.save_many([courier])
+
+    async def save_many(self, couriers: typing.Iterable[Courier]) -> None:
+        couriers = list(couriers)
+        await self.write_many(couriers)
+        await self.write_storage_places(couriers)
+        for courier in couriers:
+            courier.mark_clean()
+            for sp in courier.storage_places:
+                sp.mark_clean()
+
+    async def write_many(self, couriers: typing.Iterable[Courier]) -> None:
+        # Новые курьеры записываются пачками через INSERT ... ON CONFLICT DO UPDATE. У загруженных обновляются
+        # только колонки, изменившиеся у этой сущности, нетронутые агрегаты не пишутся вовсе. Колонки,
+        # не измененные у сущности, не пишутся даже ради общего executemany: такт движения и диспетчер меняют
+        # разные поля одних и тех же курьеров, и запись прочитанных ранее значений откатила бы изменения,
+        # зафиксированные другим обработчиком.
+        # Места хранения пишет `write_storage_places`, а снимки сущностей не обновляются: это делает `save_many`
+        # или единица работы после коммита, когда записаны и заказы, на которые ссылаются места хранения.
+        rows: list[bulk.Row] = []
+        changes: list[bulk.Row] = []
+        for courier in couriers:
+            self._track(courier)
+            if courier.is_new:
+                rows.append(CourierModel.row_from_entity(courier))
+            elif courier_changes := courier.get_changes():
+                changes.append(CourierModel.changed_row_from_entity(courier, courier_changes))
+
+        await self._write(CourierModel.__table__, rows, changes)  # type: ignore[arg-type]
+
+    async def write_storage_places(self, couriers: typing.Iterable[Courier]) -> None:
+        rows: list[bulk.Row] = []
+        changes: list[bulk.Row] = []
+        for courier in couriers:
+            courier_id = typing.cast("uuid.UUID", courier.id_)
+            for sp in courier.storage_places:
+                if sp.is_new:
+                    rows.append(StoragePlaceModel.row_from_entity(sp, courier_id))
+                elif sp_changes := sp.get_changes():
+                    changes.append(StoragePlaceModel.changed_row_from_entity(sp, courier_id, sp_changes))
+
+        await self._write(StoragePlaceModel.__table__, rows, changes)  # type: ignore[arg-type]
 
     async def get_by_id(self, id_: uuid.UUID) -> Courier | None:
+        if self._identity_map is not None and (courier := self._identity_map.get(id_)) is not None:
+            return courier
+
         courier_model = await self._async_session.scalar(select(CourierModel).where(CourierModel.id_ == id_))
 
-        return courier_model.to_entity() if courier_model else None
+        return self._track(courier_model.to_entity()) if courier_model else None
+
+    async def get_by_ids(self, ids: typing.Iterable[uuid.UUID]) -> list[Courier]:
+        # Один запрос `id = ANY(:ids)` вместо запроса на каждого курьера; уже известные курьеры не читаются.
+        known: list[Courier] = []
+        missing: list[uuid.UUID] = []
+        for id_ in dict.fromkeys(ids):
+            courier = self._identity_map.get(id_) if self._identity_map is not None else None
+            if courier is not None:
+                known.append(courier)
+            else:
+                missing.append(id_)
+
+        if not missing:
+            return known
+
+        query = select(CourierModel).where(CourierModel.id_ == any_(cast(missing, ARRAY(UUID))))
+        models = await self._async_session.scalars(query)
+
+        return known + [self._track(model.to_entity()) for model in models.all()]
+
+    async def claim_by_ids(self, ids: typing.Iterable[uuid.UUID]) -> list[Courier]:
+        # Курьеры с этими идентификаторами, заблокированные до конца транзакции. Захваченные другой транзакцией,
+        # например диспетчером, пропускаются.
+        query = (
+            select(CourierModel)
+            .where(CourierModel.id_ == any_(cast(list(dict.fromkeys(ids)), ARRAY(UUID))))
+            .with_for_update(skip_locked=True)
+        )
+        models = await self._async_session.scalars(query)
+
+        return [self._track(model.to_entity()) for model in models.all()]
 
     async def get_free_couriers(self) -> list[Courier]:
-        query = select(CourierModel).where(~CourierModel.storage_places.any(StoragePlaceModel.order_id.isnot(None)))
+        models = await self._async_session.scalars(self._free_couriers_query())
+
+        return [self._track(model.to_entity()) for model in models.all()]
+
+    async def iter_free_couriers(self, batch_size: int = DEFAULT_BATCH_SIZE) -> typing.AsyncIterator[Courier]:
+        # Строки читаются серверным курсором пачками по `batch_size`, в памяти одновременно только одна пачка.
+        query = self._free_couriers_query().execution_options(yield_per=batch_size)
+
+        # Прочитанные курьеры не добавляются в identity map, иначе вся таблица оставалась бы в памяти до конца
+        # единицы работы. Курьер, который в ней уже есть, возвращается тем же экземпляром.
+        async for model in await self._async_session.stream_scalars(query):
+            courier = self._identity_map.get(model.id_) if self._identity_map is not None else None
+            yield courier if courier is not None else model.to_entity()
+
+    async def get_couriers_able_to_take(self, volume: Volume, near: Location, limit: int) -> list[Courier]:
+        # Не больше `limit` курьеров со свободным местом под `volume`, ближайших по времени пути до `near`.
+        # Проверка вместимости и сортировка выполняются в БД; при равном времени порядок задает id.
+        # Курьеры блокируются до конца транзакции, а захваченные другой транзакцией пропускаются:
+        # параллельные диспетчеры не положат два заказа в одно и то же место хранения.
+        models = await self._async_session.scalars(self._able_to_take_query(volume, near, limit))
+
+        return [self._track(model.to_entity()) for model in models.all()]
 
+    async def get_couriers_able_to_take_many(
+        self,
+        requests: typing.Iterable[tuple[Volume, Location, int]],
+    ) -> list[Courier]:
+        # То же, что `get_couriers_able_to_take` для каждого запроса (объем, адрес, limit), но одним запросом:
+        # запросы разворачиваются через unnest, кандидаты каждого выбираются LATERAL подзапросом со своим LIMIT.
+        # Курьер, подходящий под несколько запросов, возвращается один раз; курьеры упорядочены по id.
+        requests = list(requests)
+        if not requests:
+            return []
+
+        keys = (
+            func.unnest(
+                cast([volume.value for volume, _, _ in requests], ARRAY(Integer)),
+                cast([near.x for _, near, _ in requests], ARRAY(Integer)),
+                cast([near.y for _, near, _ in requests], ARRAY(Integer)),
+                cast([limit for _, _, limit in requests], ARRAY(Integer)),
+            )
+            .table_valued("volume", "x", "y", "limit")
+            .render_derived(name="keys")
+        )
+        candidates = (
+            select(CourierModel.id_.label("courier_id"))
+            .where(CourierModel.free_capacity >= keys.c.volume)
+            .order_by(self._time_to(keys.c.x, keys.c.y), CourierModel.id_)
+            .limit(keys.c.limit)
+            .with_for_update(skip_locked=True)
+            .lateral("candidates")
+        )
+        query = (
+            select(CourierModel)
+            .where(
+                CourierModel.id_.in_(select(candidates.c.courier_id).select_from(keys).join(candidates, true())),
+            )
+            .order_by(CourierModel.id_)
+        )
         models = await self._async_session.scalars(query)
 
-        return [model.to_entity() for model in models.all()]
+        return [self._track(model.to_entity()) for model in models.all()]
+
+    async def _write(self, table: Table, rows: list[bulk.Row], changes: list[bulk.Row]) -> None:
+        if not (rows or changes):
+            return
+        await bulk.upsert(self._async_session, table, rows)
+        await bulk.update_changed(self._async_session, table, changes)
+        # Запись идет мимо ORM, поэтому уже загруженные в сессию модели нужно перечитать.
+        self._async_session.expire_all()
+
+    def _track(self, courier: Courier) -> Courier:
+        return self._identity_map.add(courier) if self._identity_map is not None else courier
+
+    @staticmethod
+    def _time_to(x: ColumnElement[int] | int, y: ColumnElement[int] | int) -> ColumnElement[float]:
+        # Время пути курьера до точки (x, y), как у `Courier.calculate_time_to_location`.
+        distance = func.abs(CourierModel.location_x - x) + func.abs(CourierModel.location_y - y)
+        return cast(distance, Float) / CourierModel.speed
+
+    @classmethod
+    def _able_to_take_query(cls, volume: Volume, near: Location, limit: int) -> Select[tuple[CourierModel]]:
+        return (
+            select(CourierModel)
+            .where(CourierModel.free_capacity >= volume.value)
+            .order_by(cls._time_to(near.x, near.y), CourierModel.id_)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+    @staticmethod
+    def _free_couriers_query() -> Select[tuple[CourierModel]]:
+        # У свободного курьера все места хранения свободны, а значит `free_capacity` больше нуля. Условие по
+        # `free_capacity` само по себе не достаточно (у курьера с двумя местами одно может быть занято), но по нему
+        # индекс отсекает занятых курьеров с одним местом до проверки мест хранения.
+        return select(CourierModel).where(
+            CourierModel.free_capacity > 0,
+            ~CourierModel.storage_places.any(StoragePlaceModel.order_id.isnot(None)),
+        )
@@ -0,0 +1,73 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from microarch.delivery.application_properties import DBProperties
+
+
+class PoolMetrics:
+    def __init__(self, pool: QueuePool) -> None:
+        self._pool = pool
+        self.checkouts = 0
+        # Выдачи, которым пришлось ждать возврата соединения: пул и overflow исчерпаны.
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.timeouts = 0
+
+    @property
+    def checked_out(self) -> int:
+        return self._pool.checkedout()
+
+    def record_wait(self, wait_time: float) -> None:
+        self.waits += 1
+        self.wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    # Стандартный пул асинхронного движка, который дополнительно собирает `PoolMetrics`.
+    # Используется только публичный API пула: `connect`, `size`, `checkedout`.
+
+    def __init__(self, creator: object, *, max_overflow: int = 10, **kwargs: object) -> None:
+        super().__init__(creator, max_overflow=max_overflow, **kwargs)  # type: ignore[arg-type]
+        # Отрицательный `max_overflow` - overflow не ограничен, выдача соединения никогда не ждет.
+        self._capacity = self.size() + max_overflow if max_overflow >= 0 else None
+        self.metrics = PoolMetrics(self)
+
+    def connect(self) -> PoolProxiedConnection:
+        saturated = self._capacity is not None and self.checkedout() >= self._capacity
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            if saturated:
+                self.metrics.record_wait(time.perf_counter() - started)
+
+        self.metrics.checkouts += 1
+        return connection
+
+
+def create_engine(properties: DBProperties) -> AsyncEngine:
+    # Движок создается один раз на время жизни приложения и переиспользует соединения между запросами.
+    return create_async_engine(
+        properties.dsn,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=properties.pool_size,
+        max_overflow=properties.max_overflow,
+        pool_timeout=properties.pool_timeout,
+        pool_pre_ping=properties.pool_pre_ping,
+        pool_recycle=properties.pool_recycle,
+        query_cache_size=properties.query_cache_size,
+        connect_args={"prepare_threshold": properties.prepare_threshold},
+    )
+
+
+def get_pool_metrics(engine: AsyncEngine) -> PoolMetrics | None:
+    pool = engine.pool
+    return pool.metrics if isinstance(pool, InstrumentedAsyncQueuePool) else None
@@ -0,0 +1,38 @@
+import typing
+import uuid
+
+from sqlalchemy import any_, cast, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from microarch.delivery.adapters.out.postgres.models import InboxModel
+from microarch.delivery.core.ports.inbox_repository import IInboxRepository
+
+
+class SqlAlchemyInboxRepository(IInboxRepository):
+    def __init__(self, async_session: AsyncSession) -> None:
+        self._async_session = async_session
+
+    async def add_new(self, message_ids: typing.Collection[uuid.UUID]) -> set[uuid.UUID]:
+        # Вся пачка проверяется и записывается одним запросом, идентификаторы передаются одним массивом.
+        # Если то же сообщение одновременно обрабатывает другая транзакция, запрос ждет ее завершения:
+        # после коммита сообщение считается обработанным, после отката - новым.
+        if not message_ids:
+            return set()
+
+        inserted = await self._async_session.scalars(
+            insert(InboxModel)
+            .from_select(["message_id"], select(func.unnest(cast(list(message_ids), ARRAY(UUID)))))
+            .on_conflict_do_nothing()
+            .returning(InboxModel.message_id),
+        )
+        return set(inserted)
+
+    async def get_processed(self, message_ids: typing.Collection[uuid.UUID]) -> set[uuid.UUID]:
+        if not message_ids:
+            return set()
+
+        processed = await self._async_session.scalars(
+            select(InboxModel.message_id).where(InboxModel.message_id == any_(cast(list(message_ids), ARRAY(UUID)))),
+        )
+        return set(processed)
@@ -0,0 +1,172 @@
+# Версионированные миграции схемы БД. Каждая миграция применяется один раз, примененные версии
+# хранятся в таблице `schema_version`. Схема, получаемая миграциями, должна совпадать с `BaseModel.metadata`.
+# Запуск: PYTHONPATH=src/main/python python -m microarch.delivery.adapters.out.postgres.migrations
+import asyncio
+import typing
+
+from sqlalchemy import Connection, text
+
+from microarch.delivery.adapters.out.postgres.engine import create_engine
+from microarch.delivery.application_properties import DBProperties
+
+
+class Migration(typing.NamedTuple):
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+MIGRATIONS: typing.Final = (
+    Migration(
+        1,
+        "initial schema",
+        (
+            """
+            DO $$ BEGIN
+                CREATE TYPE orderstatusenum AS ENUM ('CREATED', 'ASSIGNED', 'COMPLETED');
+            EXCEPTION WHEN duplicate_object THEN NULL;
+            END $$
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS courier (
+                id UUID PRIMARY KEY,
+                name VARCHAR NOT NULL,
+                speed INTEGER NOT NULL,
+                location_x INTEGER NOT NULL,
+                location_y INTEGER NOT NULL
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS "order" (
+                id UUID PRIMARY KEY,
+                status orderstatusenum NOT NULL,
+                volume INTEGER NOT NULL,
+                location_x INTEGER NOT NULL,
+                location_y INTEGER NOT NULL,
+                courier_id UUID REFERENCES courier (id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS storage_place (
+                id UUID PRIMARY KEY,
+                name VARCHAR NOT NULL,
+                volume INTEGER NOT NULL,
+                order_id UUID REFERENCES "order" (id),
+                courier_id UUID NOT NULL REFERENCES courier (id)
+            )
+            """,
+        ),
+    ),
+    Migration(
+        2,
+        "indexes for free courier lookup, courier free capacity",
+        (
+            "CREATE INDEX IF NOT EXISTS ix_storage_place_courier_id ON storage_place (courier_id)",
+            """
+            CREATE INDEX IF NOT EXISTS ix_storage_place_occupied_courier_id
+                ON storage_place (courier_id) WHERE order_id IS NOT NULL
+            """,
+            'CREATE INDEX IF NOT EXISTS ix_order_status ON "order" (status)',
+            "ALTER TABLE courier ADD COLUMN IF NOT EXISTS free_capacity INTEGER NOT NULL DEFAULT 0",
+            """
+            UPDATE courier SET free_capacity = coalesce(
+                (SELECT max(sp.volume) FROM storage_place sp WHERE sp.courier_id = courier.id AND sp.order_id IS NULL),
+                0
+            )
+            """,
+        ),
+    ),
+    Migration(
+        3,
+        "index for capacity-aware courier lookup",
+        ("CREATE INDEX IF NOT EXISTS ix_courier_free_capacity ON courier (free_capacity)",),
+    ),
+    Migration(
+        4,
+        "order creation time and queue of created orders",
+        (
+            'ALTER TABLE "order" ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now()',
+            """
+            CREATE INDEX IF NOT EXISTS ix_order_created_queue
+                ON "order" (created_at, id) WHERE status = 'CREATED'
+            """,
+        ),
+    ),
+    Migration(
+        5,
+        "transactional outbox",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                id UUID PRIMARY KEY,
+                type VARCHAR NOT NULL,
+                payload JSONB NOT NULL,
+                occurred_at TIMESTAMPTZ NOT NULL,
+                processed_at TIMESTAMPTZ
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS ix_outbox_unprocessed
+                ON outbox (occurred_at, id) WHERE processed_at IS NULL
+            """,
+        ),
+    ),
+    Migration(
+        6,
+        "inbox of processed messages",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS inbox (
+                message_id UUID PRIMARY KEY,
+                processed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+            """,
+        ),
+    ),
+)
+
+# Ключ advisory-блокировки: реплики, стартующие одновременно, применяют миграции по очереди.
+_MIGRATIONS_LOCK_ID: typing.Final = 7_305_118_271
+
+
+def migrate(connection: Connection, migrations: typing.Sequence[Migration] = MIGRATIONS) -> list[int]:
+    # Применяет недостающие миграции в транзакции `connection` и возвращает их версии.
+    connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": _MIGRATIONS_LOCK_ID})
+    connection.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description VARCHAR NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+            """,
+        ),
+    )
+    applied = set(connection.scalars(text("SELECT version FROM schema_version")))
+
+    new_versions = []
+    for migration in sorted(migrations):
+        if migration.version in applied:
+            continue
+
+        for statement in migration.statements:
+            connection.execute(text(statement))
+        connection.execute(
+            text("INSERT INTO schema_version (version, description) VALUES (:version, :description)"),
+            {"version": migration.version, "description": migration.description},
+        )
+        new_versions.append(migration.version)
+
+    return new_versions
+
+
+async def main() -> None:
+    engine = create_engine(DBProperties())
+    async with engine.begin() as conn:
+        await conn.run_sync(migrate)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
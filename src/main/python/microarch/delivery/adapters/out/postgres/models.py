@@ -1,7 +1,10 @@
+import datetime
 import typing
 import uuid
+from collections.abc import Iterable, Mapping
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from microarch.delivery.core.domain.model.courier import Courier, StoragePlace
@@ -14,8 +17,22 @@ from microarch.delivery.core.domain.model.order import Order, OrderStatusEnum
 class BaseModel(DeclarativeBase): ...
 
 
+def _changed_row(
+    row: dict[str, typing.Any],
+    changes: Iterable[str],
+    columns: Mapping[str, tuple[str, ...]],
+) -> dict[str, typing.Any]:
+    # Из полной строки оставляет идентификатор и колонки, в которые отображаются измененные поля сущности.
+    return {"id": row["id"]} | {column: row[column] for field in changes for column in columns[field]}
+
+
 class OrderModel(BaseModel):
     __tablename__ = "order"
+    __table_args__ = (
+        Index("ix_order_status", "status"),
+        # Очередь заказов на распределение: только CREATED, в порядке создания.
+        Index("ix_order_created_queue", "created_at", "id", postgresql_where=text("status = 'CREATED'")),
+    )
 
     id_: Mapped[uuid.UUID] = mapped_column("id", primary_key=True)
     status: Mapped[OrderStatusEnum]
@@ -24,12 +41,22 @@ class OrderModel(BaseModel):
     location_y: Mapped[int]
 
     courier_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("courier.id"))
+    # Заполняется БД при вставке и дальше не меняется, задает очередность распределения заказов.
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    # Поле сущности -> колонки, в которых оно хранится.
+    FIELD_COLUMNS: typing.ClassVar[dict[str, tuple[str, ...]]] = {
+        "location": ("location_x", "location_y"),
+        "volume": ("volume",),
+        "status": ("status",),
+        "courier_id": ("courier_id",),
+    }
 
     def to_entity(self) -> Order:
-        return Order(
+        return Order.restore(
             id_=self.id_,
-            location=Location(self.location_x, self.location_y),
-            volume=Volume(self.volume),
+            location=Location.of(self.location_x, self.location_y),
+            volume=Volume.of(self.volume),
             status=self.status,
             courier_id=self.courier_id,
         )
@@ -45,9 +72,29 @@ class OrderModel(BaseModel):
             courier_id=entity.courier_id,
         )
 
+    @staticmethod
+    def row_from_entity(entity: Order) -> dict[str, typing.Any]:
+        return {
+            "id": entity.id_,
+            "status": entity.status,
+            "volume": entity.volume.value,
+            "location_x": entity.location.x,
+            "location_y": entity.location.y,
+            "courier_id": entity.courier_id,
+        }
+
+    @classmethod
+    def changed_row_from_entity(cls, entity: Order, changes: Iterable[str]) -> dict[str, typing.Any]:
+        return _changed_row(cls.row_from_entity(entity), changes, cls.FIELD_COLUMNS)
+
 
 class StoragePlaceModel(BaseModel):
     __tablename__ = "storage_place"
+    __table_args__ = (
+        Index("ix_storage_place_courier_id", "courier_id"),
+        # Занятых мест немного, поэтому частичный индекс по ним мал и быстро отвечает на вопрос "курьер занят?".
+        Index("ix_storage_place_occupied_courier_id", "courier_id", postgresql_where=text("order_id IS NOT NULL")),
+    )
 
     id_: Mapped[uuid.UUID] = mapped_column("id", primary_key=True)
     name: Mapped[str]
@@ -57,11 +104,17 @@ class StoragePlaceModel(BaseModel):
     courier_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("courier.id"))
     courier: Mapped["CourierModel"] = relationship(back_populates="storage_places")
 
+    FIELD_COLUMNS: typing.ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("name",),
+        "total_volume": ("volume",),
+        "order_id": ("order_id",),
+    }
+
     def to_entity(self) -> StoragePlace:
-        return StoragePlace(
+        return StoragePlace.restore(
             id_=self.id_,
             name=self.name,
-            total_volume=Volume(self.volume),
+            total_volume=Volume.of(self.volume),
             order_id=self.order_id,
         )
 
@@ -69,25 +122,55 @@ class StoragePlaceModel(BaseModel):
     def from_entity(cls, entity: StoragePlace) -> typing.Self:
         return cls(id_=entity.id_, name=entity.name, volume=entity.total_volume.value, order_id=entity.order_id)
 
+    @staticmethod
+    def row_from_entity(entity: StoragePlace, courier_id: uuid.UUID) -> dict[str, typing.Any]:
+        return {
+            "id": entity.id_,
+            "name": entity.name,
+            "volume": entity.total_volume.value,
+            "order_id": entity.order_id,
+            "courier_id": courier_id,
+        }
+
+    @classmethod
+    def changed_row_from_entity(
+        cls,
+        entity: StoragePlace,
+        courier_id: uuid.UUID,
+        changes: Iterable[str],
+    ) -> dict[str, typing.Any]:
+        return _changed_row(cls.row_from_entity(entity, courier_id), changes, cls.FIELD_COLUMNS)
+
 
 class CourierModel(BaseModel):
     __tablename__ = "courier"
+    __table_args__ = (Index("ix_courier_free_capacity", "free_capacity"),)
 
     id_: Mapped[uuid.UUID] = mapped_column("id", primary_key=True)
     name: Mapped[str]
     speed: Mapped[int]
     location_x: Mapped[int]
     location_y: Mapped[int]
+    # Денормализованный `Courier.free_capacity`, пересчитывается при каждом сохранении курьера.
+    free_capacity: Mapped[int] = mapped_column(server_default="0")
 
     storage_places: Mapped[list["StoragePlaceModel"]] = relationship(back_populates="courier", lazy="selectin")
 
+    FIELD_COLUMNS: typing.ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("name",),
+        "speed": ("speed",),
+        "location": ("location_x", "location_y"),
+        "free_capacity": ("free_capacity",),
+    }
+
     def to_entity(self) -> Courier:
-        return Courier(
+        return Courier.restore(
             id_=self.id_,
             name=self.name,
-            speed=Speed(self.speed),
-            location=Location(self.location_x, self.location_y),
+            speed=Speed.of(self.speed),
+            location=Location.of(self.location_x, self.location_y),
             storage_places=[storage_place.to_entity() for storage_place in self.storage_places],
+            free_capacity=self.free_capacity,
         )
 
     @classmethod
@@ -98,5 +181,44 @@ class CourierModel(BaseModel):
             speed=entity.speed.value,
             location_x=entity.location.x,
             location_y=entity.location.y,
+            free_capacity=entity.free_capacity,
             storage_places=[StoragePlaceModel.from_entity(storage_place) for storage_place in entity.storage_places],
         )
+
+    @staticmethod
+    def row_from_entity(entity: Courier) -> dict[str, typing.Any]:
+        return {
+            "id": entity.id_,
+            "name": entity.name,
+            "speed": entity.speed.value,
+            "location_x": entity.location.x,
+            "location_y": entity.location.y,
+            "free_capacity": entity.free_capacity,
+        }
+
+    @classmethod
+    def changed_row_from_entity(cls, entity: Courier, changes: Iterable[str]) -> dict[str, typing.Any]:
+        return _changed_row(cls.row_from_entity(entity), changes, cls.FIELD_COLUMNS)
+
+
+class OutboxModel(BaseModel):
+    # Доменные события, записанные в той же транзакции, что и породившие их агрегаты. Их публикует `OutboxRelayWorker`.
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # Очередь неопубликованных событий в порядке возникновения.
+        Index("ix_outbox_unprocessed", "occurred_at", "id", postgresql_where=text("processed_at IS NULL")),
+    )
+
+    id_: Mapped[uuid.UUID] = mapped_column("id", primary_key=True)
+    event_type: Mapped[str] = mapped_column("type")
+    payload: Mapped[dict[str, typing.Any]] = mapped_column(JSONB)
+    occurred_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
+    processed_at: Mapped[datetime.datetime | None] = mapped_column(DateTime(timezone=True))
+
+
+class InboxModel(BaseModel):
+    # Идентификаторы уже обработанных входящих сообщений: повторно доставленное сообщение не обрабатывается.
+    __tablename__ = "inbox"
+
+    message_id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    processed_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -1,33 +1,135 @@
+import datetime
+import typing
 import uuid
 
-from sqlalchemy import select
+from libs.ddd.identity_map import IdentityMap
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from microarch.delivery.adapters.out.postgres import bulk
 from microarch.delivery.adapters.out.postgres.models import OrderModel
 from microarch.delivery.core.domain.model.order.enums import OrderStatusEnum
 from microarch.delivery.core.domain.model.order.order import Order
 from microarch.delivery.core.ports.order_repository import IOrderRepository
 
+DEFAULT_BATCH_SIZE: typing.Final = bulk.DEFAULT_BATCH_SIZE
+
 
 class SqlAlchemyOrderRepository(IOrderRepository):
-    def __init__(self, async_session: AsyncSession) -> None:
+    def __init__(
+        self,
+        async_session: AsyncSession,
+        identity_map: IdentityMap[uuid.UUID, Order] | None = None,
+    ) -> None:
+        # С `identity_map` репозиторий возвращает один и тот же экземпляр заказа на идентификатор
+        # и не читает из БД заказы, которые уже в нем есть.
         self._async_session = async_session
+        self._identity_map = identity_map
 
     async def save(self, order: Order) -> None:
-        order_model = OrderModel.from_entity(order)
-        await self._async_session.merge(order_model)
-        await self._async_session.flush()
+        await self.save_many([order])
+
+    async def save_many(self, orders: typing.Iterable[Order]) -> None:
+        orders = list(orders)
+        await self.write_many(orders)
+        for order in orders:
+            order.mark_clean()
+
+    async def write_many(self, orders: typing.Iterable[Order]) -> None:
+        # Новые заказы записываются пачками через INSERT ... ON CONFLICT DO UPDATE, у загруженных
+        # обновляются только колонки, изменившиеся у этого заказа, нетронутые заказы не пишутся вовсе.
+        # Снимки заказов не обновляются: это делает `save_many` или единица работы после коммита.
+        rows: list[bulk.Row] = []
+        changed_rows: list[bulk.Row] = []
+        for order in orders:
+            self._track(order)
+            if order.is_new:
+                rows.append(OrderModel.row_from_entity(order))
+            elif changes := order.get_changes():
+                changed_rows.append(OrderModel.changed_row_from_entity(order, changes))
+
+        if not (rows or changed_rows):
+            return
+
+        await bulk.upsert(self._async_session, OrderModel.__table__, rows)  # type: ignore[arg-type]
+        await bulk.update_changed(self._async_session, OrderModel.__table__, changed_rows)  # type: ignore[arg-type]
+        # Запись идет мимо ORM, поэтому уже загруженные в сессию модели нужно перечитать.
+        self._async_session.expire_all()
+
+    async def add_many_if_absent(self, orders: typing.Iterable[Order]) -> list[Order]:
+        # В отличие от `save_many`, заказ, который уже есть в БД, не перезаписывается: повторное создание
+        # заказа из того же сообщения не вернет назначенный заказ в CREATED. Возвращаются вставленные заказы.
+        orders = list(orders)
+        inserted_ids = set(
+            await bulk.insert_if_absent(
+                self._async_session,
+                OrderModel.__table__,  # type: ignore[arg-type]
+                [OrderModel.row_from_entity(order) for order in orders],
+            ),
+        )
+
+        inserted = [order for order in orders if order.id_ in inserted_ids]
+        for order in inserted:
+            order.mark_clean()
+            self._track(order)
+        self._async_session.expire_all()
+        return inserted
 
     async def get_by_id(self, id_: uuid.UUID) -> Order | None:
+        if self._identity_map is not None and (order := self._identity_map.get(id_)) is not None:
+            return order
+
         model = await self._async_session.scalar(select(OrderModel).where(OrderModel.id_ == id_))
-        return model.to_entity() if model else None
+        return self._track(model.to_entity()) if model else None
 
     async def get_created_order(self) -> Order | None:
         model = await self._async_session.scalar(select(OrderModel).where(OrderModel.status == OrderStatusEnum.CREATED))
-        return model.to_entity() if model else None
+        return self._track(model.to_entity()) if model else None
+
+    async def claim_created_orders(self, limit: int) -> list[Order]:
+        # До `limit` самых ранних CREATED заказов, заблокированных до конца транзакции. Заказы, уже
+        # захваченные другой транзакцией, пропускаются, поэтому параллельные диспетчеры не делят один заказ.
+        models = await self._async_session.scalars(self._claim_created_orders_query(limit))
+        return [self._track(model.to_entity()) for model in models.all()]
+
+    async def get_oldest_created_at(self) -> datetime.datetime | None:
+        # Время создания самого старого нераспределенного заказа, по нему считается отставание очереди.
+        return await self._async_session.scalar(
+            select(func.min(OrderModel.created_at)).where(OrderModel.status == OrderStatusEnum.CREATED),
+        )
 
     async def get_assigned_orders(self) -> list[Order]:
-        models = await self._async_session.scalars(
-            select(OrderModel).where(OrderModel.status == OrderStatusEnum.ASSIGNED),
+        models = await self._async_session.scalars(self._assigned_orders_query())
+        return [self._track(model.to_entity()) for model in models.all()]
+
+    async def iter_assigned_orders(self, batch_size: int = DEFAULT_BATCH_SIZE) -> typing.AsyncIterator[Order]:
+        # Строки читаются серверным курсором пачками по `batch_size`, в памяти одновременно только одна пачка.
+        query = self._assigned_orders_query().execution_options(yield_per=batch_size)
+
+        # Прочитанные заказы не добавляются в identity map, иначе все назначенные заказы оставались бы в памяти
+        # до конца единицы работы. Заказ, который в ней уже есть, возвращается тем же экземпляром.
+        async for model in await self._async_session.stream_scalars(query):
+            order = self._identity_map.get(model.id_) if self._identity_map is not None else None
+            yield order if order is not None else model.to_entity()
+
+    def _track(self, order: Order) -> Order:
+        return self._identity_map.add(order) if self._identity_map is not None else order
+
+    @staticmethod
+    def _claim_created_orders_query(limit: int) -> Select[tuple[OrderModel]]:
+        return (
+            select(OrderModel)
+            .where(OrderModel.status == OrderStatusEnum.CREATED)
+            .order_by(OrderModel.created_at, OrderModel.id_)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+    @staticmethod
+    def _assigned_orders_query() -> Select[tuple[OrderModel]]:
+        # Порядок постоянен между тактами: курьер с несколькими заказами везет их по очереди, не переключаясь.
+        return (
+            select(OrderModel)
+            .where(OrderModel.status == OrderStatusEnum.ASSIGNED)
+            .order_by(OrderModel.created_at, OrderModel.id_)
         )
-        return [model.to_entity() for model in models.all()]
@@ -0,0 +1,101 @@
+import typing
+import uuid
+from collections.abc import Callable
+
+from libs.ddd.domain_event import DomainEvent
+from sqlalchemy import Select, any_, cast, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from microarch.delivery.adapters.out.postgres.models import OutboxModel
+from microarch.delivery.core.domain.model.order import OrderAssignedDomainEvent, OrderCompletedDomainEvent
+from microarch.delivery.core.ports.outbox_repository import IOutboxRepository
+
+if typing.TYPE_CHECKING:
+    import datetime
+
+type Payload = dict[str, typing.Any]
+type OrderEvent = OrderAssignedDomainEvent | OrderCompletedDomainEvent
+
+
+def _order_payload(event: OrderEvent) -> Payload:
+    return {"order_id": str(event.order_id), "courier_id": str(event.courier_id)}
+
+
+def _order_event_reader(
+    event_class: type[OrderEvent],
+) -> Callable[[Payload, uuid.UUID, "datetime.datetime"], OrderEvent]:
+    def read(payload: Payload, event_id: uuid.UUID, occurred_at: "datetime.datetime") -> OrderEvent:
+        return event_class(
+            uuid.UUID(payload["order_id"]),
+            uuid.UUID(payload["courier_id"]),
+            event_id=event_id,
+            occurred_on_utc=occurred_at,
+        )
+
+    return read
+
+
+# Тип события в outbox -> класс события, функция записи и функция чтения его полей.
+_EVENT_TYPES: typing.Final[dict[str, tuple[type[DomainEvent], Callable[..., Payload], Callable[..., DomainEvent]]]] = {
+    "OrderAssigned": (
+        OrderAssignedDomainEvent,
+        _order_payload,
+        _order_event_reader(OrderAssignedDomainEvent),
+    ),
+    "OrderCompleted": (
+        OrderCompletedDomainEvent,
+        _order_payload,
+        _order_event_reader(OrderCompletedDomainEvent),
+    ),
+}
+_EVENT_TYPE_NAMES: typing.Final = {event_class: name for name, (event_class, _, _) in _EVENT_TYPES.items()}
+
+
+class SqlAlchemyOutboxRepository(IOutboxRepository):
+    def __init__(self, async_session: AsyncSession) -> None:
+        self._async_session = async_session
+
+    async def add_many(self, events: typing.Iterable[DomainEvent]) -> None:
+        rows = []
+        for event in events:
+            event_type = _EVENT_TYPE_NAMES[type(event)]
+            rows.append(
+                {
+                    "id_": event.event_id,
+                    "event_type": event_type,
+                    "payload": _EVENT_TYPES[event_type][1](event),
+                    "occurred_at": event.occurred_on_utc,
+                },
+            )
+
+        if rows:
+            await self._async_session.execute(insert(OutboxModel), rows)
+
+    async def claim_unprocessed(self, limit: int) -> list[DomainEvent]:
+        # Строки блокируются до конца транзакции, а уже заблокированные другим ретранслятором пропускаются:
+        # параллельные ретрансляторы разбирают очередь, не публикуя одно событие дважды.
+        rows = await self._async_session.execute(self._claim_unprocessed_query(limit))
+        return [_EVENT_TYPES[row.event_type][2](row.payload, row.id_, row.occurred_at) for row in rows]
+
+    async def mark_processed(self, event_ids: typing.Sequence[uuid.UUID]) -> None:
+        if not event_ids:
+            return
+
+        await self._async_session.execute(
+            update(OutboxModel)
+            .where(OutboxModel.id_ == any_(cast(list(event_ids), ARRAY(UUID))))
+            .values(processed_at=func.now()),
+        )
+
+    @staticmethod
+    def _claim_unprocessed_query(
+        limit: int,
+    ) -> Select[tuple[uuid.UUID, str, Payload, "datetime.datetime"]]:
+        return (
+            select(OutboxModel.id_, OutboxModel.event_type, OutboxModel.payload, OutboxModel.occurred_at)
+            .where(OutboxModel.processed_at.is_(None))
+            .order_by(OutboxModel.occurred_at, OutboxModel.id_)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
@@ -0,0 +1,151 @@
+import json
+import logging
+import time
+import typing
+import uuid
+
+from microarch.delivery.application_properties import KafkaConsumerProperties
+from microarch.delivery.core.application.create_orders import (
+    CreateOrderCommand,
+    CreateOrdersHandler,
+    CreateOrdersResult,
+)
+from microarch.delivery.periodic_worker import PeriodicWorker, WorkerMetrics
+
+logger = logging.getLogger(__name__)
+
+BASKET_CONFIRMED_EVENT_TYPE: typing.Final = "BasketConfirmedIntegrationEvent"
+
+
+class TopicPartition(typing.NamedTuple):
+    topic: str
+    partition: int
+
+
+class ConsumerRecord(typing.Protocol):
+    @property
+    def offset(self) -> int: ...
+
+    @property
+    def value(self) -> bytes | None: ...
+
+
+class IKafkaConsumer(typing.Protocol):
+    # Подмножество API асинхронного Kafka консьюмера (как у aiokafka.AIOKafkaConsumer) с выключенным автокоммитом.
+    # `commit` принимает смещение следующего непрочитанного сообщения в каждой партиции.
+    async def getmany(
+        self,
+        timeout_ms: int = ...,
+        max_records: int | None = ...,
+    ) -> typing.Mapping[TopicPartition, typing.Sequence[ConsumerRecord]]: ...
+
+    async def commit(self, offsets: typing.Mapping[TopicPartition, int]) -> None: ...
+
+    def seek(self, partition: TopicPartition, offset: int) -> None: ...
+
+
+def parse_basket_confirmed(value: bytes | None) -> CreateOrderCommand | None:
+    # Сообщения - BasketConfirmedIntegrationEvent из baskets_events.proto в JSON представлении proto3.
+    # Другие события топика пропускаются, для них возвращается None. Некорректное сообщение - ValueError.
+    try:
+        message = json.loads(value or b"")
+        if message.get("eventType") != BASKET_CONFIRMED_EVENT_TYPE:
+            return None
+        return CreateOrderCommand(
+            message_id=uuid.UUID(message["eventId"]),
+            basket_id=uuid.UUID(message["basketId"]),
+            street=message["address"]["street"],
+            volume=int(message["volume"]),
+        )
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid basket event: {e}") from e
+
+
+class BasketEventsConsumerMetrics(WorkerMetrics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = 0
+        self.messages = 0
+        self.orders_created = 0
+        # Повторно доставленные сообщения, по которым заказ уже создан.
+        self.messages_duplicate = 0
+        # Сообщения, по которым заказ не создан: некорректные и отклоненные доменной моделью.
+        self.messages_rejected = 0
+        self.last_batch_duration = 0.0
+
+    def record(self, messages: int, malformed: int, result: CreateOrdersResult, duration: float) -> None:
+        self.batches += 1
+        self.messages += messages
+        self.orders_created += result.created
+        self.messages_duplicate += result.duplicates
+        self.messages_rejected += malformed + len(result.rejected)
+        self.last_batch_duration = duration
+
+
+class BasketEventsConsumer(PeriodicWorker[BasketEventsConsumerMetrics]):
+    # Фоновый цикл чтения топика корзин. Каждая пачка сообщений создает заказы одной транзакцией, смещения
+    # коммитятся только после коммита в БД. Если пачку обработать не удалось, консьюмер возвращается к ее началу
+    # и читает ее снова после паузы. Повторное чтение безопасно: `CreateOrdersHandler` пропускает уже
+    # обработанные сообщения. Так же повторяется пачка, для которой сервис геолокации недоступен.
+    # Отклоненные заказы не повторяются, каждый из них пишется в лог.
+
+    _failure_message = "Basket events batch failed"
+
+    def __init__(
+        self,
+        consumer: IKafkaConsumer,
+        handler: CreateOrdersHandler,
+        properties: KafkaConsumerProperties,
+    ) -> None:
+        super().__init__(BasketEventsConsumerMetrics())
+        self._consumer = consumer
+        self._handler = handler
+        self._max_poll_records = properties.max_poll_records
+        self._poll_timeout_ms = properties.poll_timeout_ms
+
+    async def _step(self) -> float:
+        # Пауза не нужна: `getmany` сам ждет сообщения до `poll_timeout_ms`.
+        started = time.perf_counter()
+        records = await self._consumer.getmany(timeout_ms=self._poll_timeout_ms, max_records=self._max_poll_records)
+        if not records:
+            return 0
+
+        try:
+            commands, messages, malformed = self._parse(records)
+            result = await self._handler.handle(commands)
+            await self._consumer.commit(
+                {partition: batch[-1].offset + 1 for partition, batch in records.items() if batch},
+            )
+        except Exception:
+            for partition, batch in records.items():
+                if batch:
+                    self._consumer.seek(partition, batch[0].offset)
+            raise
+
+        for command, error in result.rejected:
+            logger.warning("Basket %s rejected: %s", command.basket_id, error.serialize())
+        self.metrics.record(messages, malformed, result, time.perf_counter() - started)
+        return 0
+
+    def _pause_after_error(self) -> float:
+        return self._poll_timeout_ms / 1000
+
+    @staticmethod
+    def _parse(
+        records: typing.Mapping[TopicPartition, typing.Sequence[ConsumerRecord]],
+    ) -> tuple[list[CreateOrderCommand], int, int]:
+        commands: list[CreateOrderCommand] = []
+        messages = malformed = 0
+        for partition, batch in records.items():
+            for record in batch:
+                messages += 1
+                try:
+                    command = parse_basket_confirmed(record.value)
+                except ValueError:
+                    # Некорректное сообщение не исправится при повторном чтении, поэтому оно пропускается.
+                    logger.exception("Skipping basket event at %s:%s", partition, record.offset)
+                    malformed += 1
+                    continue
+                if command is not None:
+                    commands.append(command)
+        return commands, messages, malformed
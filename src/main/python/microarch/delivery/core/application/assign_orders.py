@@ -0,0 +1,48 @@
+import collections
+import datetime
+import typing
+
+from microarch.delivery.core.domain.services.order_dispatcher import IOrderDispatcher
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+
+
+class AssignOrdersResult(typing.NamedTuple):
+    claimed: int
+    assigned: int
+    # Возраст самого старого нераспределенного заказа на момент начала пачки, None - очередь пуста.
+    lag: datetime.timedelta | None
+
+
+class AssignOrdersHandler:
+    # Распределяет пачку CREATED заказов по курьерам в одной транзакции. Заказы и курьеры-кандидаты захватываются
+    # с SKIP LOCKED, поэтому несколько обработчиков могут работать параллельно, не деля ни заказы, ни курьеров.
+
+    def __init__(self, uow: DeliveryUnitOfWork, dispatcher: IOrderDispatcher, candidates_per_order: int = 5) -> None:
+        self._uow = uow
+        self._dispatcher = dispatcher
+        self._candidates_per_order = candidates_per_order
+
+    async def handle(self, limit: int) -> AssignOrdersResult:
+        async with self._uow as uow:
+            oldest_created_at = await uow.orders.get_oldest_created_at()
+            if oldest_created_at is None:
+                return AssignOrdersResult(claimed=0, assigned=0, lag=None)
+            lag = datetime.datetime.now(tz=datetime.UTC) - oldest_created_at
+
+            orders = await uow.orders.claim_created_orders(limit)
+            if not orders:
+                return AssignOrdersResult(claimed=0, assigned=0, lag=lag)
+
+            # Кандидаты одинаковы для заказов с одинаковыми объемом и адресом, поэтому они загружаются одним запросом
+            # на пачку, по одному набору на каждую пару. Каждый из n заказов пары может занять одного курьера,
+            # поэтому набор больше на n - 1: последнему заказу остается столько же кандидатов, сколько первому.
+            orders_per_key = collections.Counter((order.volume, order.location) for order in orders)
+            couriers = await uow.couriers.get_couriers_able_to_take_many(
+                (volume, location, self._candidates_per_order + count - 1)
+                for (volume, location), count in orders_per_key.items()
+            )
+
+            results = self._dispatcher.dispatch_many(orders, couriers)
+            await uow.commit()
+
+        return AssignOrdersResult(claimed=len(orders), assigned=sum(result.is_success for result in results), lag=lag)
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import typing
+import uuid
+
+from libs.errs import Error
+
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.kernel.volume import Volume
+from microarch.delivery.core.domain.model.order import Order
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from microarch.delivery.core.ports.geo_client import IGeoClient
+
+logger = logging.getLogger(__name__)
+
+
+class CreateOrderCommand(typing.NamedTuple):
+    # `message_id` - идентификатор входящего сообщения, `basket_id` становится идентификатором заказа.
+    message_id: uuid.UUID
+    basket_id: uuid.UUID
+    street: str
+    volume: int
+
+
+class CreateOrdersResult(typing.NamedTuple):
+    received: int
+    created: int
+    # Повторы: сообщения, уже обработанные раньше или повторенные в пачке, и заказы, которые уже существуют.
+    duplicates: int
+    # Команды, по которым заказ не создан и не будет создан при повторе: невалидный объем или идентификатор,
+    # либо сервис геолокации не знает улицу.
+    rejected: list[tuple[CreateOrderCommand, Error]]
+
+
+class CreateOrdersHandler:
+    # Создает заказы по пачке команд. Повторы одной корзины внутри пачки схлопываются в первую команду,
+    # координаты запрашиваются по разу на улицу, заказы пишутся одним пакетным INSERT.
+    # Обработка идемпотентна: уже обработанные сообщения отсеиваются одним запросом к inbox, а существующие
+    # заказы не перезаписываются. Поэтому повторная доставка пачки, например после ребалансировки
+    # консьюмеров, стоит одного запроса и не меняет заказы.
+    # Координаты запрашиваются вне транзакции: пока ждем сервис геолокации, соединение и блокировки строк inbox
+    # не удерживаются. Записи inbox и заказы пишутся потом одной короткой транзакцией.
+    # Временный сбой сервиса геолокации повторяется с нарастающей паузой. Если все попытки не удались, исключение
+    # выходит из `handle`: в inbox ничего не записано, и консьюмер прочитает пачку снова.
+
+    _street_is_unknown = Error("street.is.unknown", "The geo service does not know the street")
+
+    def __init__(
+        self,
+        uow: DeliveryUnitOfWork,
+        geo_client: IGeoClient,
+        geo_concurrency: int = 10,
+        geo_attempts: int = 3,
+        geo_retry_delay: float = 0.1,
+    ) -> None:
+        self._uow = uow
+        self._geo_client = geo_client
+        # Одновременных запросов к сервису геолокации не больше `geo_concurrency`, сколько бы улиц ни было в пачке.
+        self._geo_semaphore = asyncio.Semaphore(geo_concurrency)
+        self._geo_attempts = geo_attempts
+        self._geo_retry_delay = geo_retry_delay
+
+    async def handle(self, commands: typing.Sequence[CreateOrderCommand]) -> CreateOrdersResult:
+        unique: dict[uuid.UUID, CreateOrderCommand] = {}
+        for command in commands:
+            unique.setdefault(command.basket_id, command)
+        if not unique:
+            return CreateOrdersResult(received=0, created=0, duplicates=0, rejected=[])
+
+        async with self._uow as uow:
+            processed = await uow.inbox.get_processed([command.message_id for command in unique.values()])
+        fresh = [command for command in unique.values() if command.message_id not in processed]
+        if not fresh:
+            return CreateOrdersResult(received=len(commands), created=0, duplicates=len(commands), rejected=[])
+
+        orders, rejected = await self._create_orders(fresh)
+
+        async with self._uow as uow:
+            # Сообщение отмечается обработанным в той же транзакции, в которой создается заказ. Пока запрашивались
+            # координаты, часть сообщений мог обработать другой консьюмер: их заказы и отказы отбрасываются.
+            new_message_ids = await uow.inbox.add_new([command.message_id for command in fresh])
+            new = [command for command in fresh if command.message_id in new_message_ids]
+            new_basket_ids = {command.basket_id for command in new}
+            orders = [order for order in orders if order.id_ in new_basket_ids]
+            rejected = [(command, error) for command, error in rejected if command.message_id in new_message_ids]
+
+            created = await uow.orders.add_many_if_absent(orders)
+            await uow.commit()
+
+        return CreateOrdersResult(
+            received=len(commands),
+            created=len(created),
+            duplicates=len(commands) - len(new) + len(orders) - len(created),
+            rejected=rejected,
+        )
+
+    async def _create_orders(
+        self,
+        commands: typing.Sequence[CreateOrderCommand],
+    ) -> tuple[list[Order], list[tuple[CreateOrderCommand, Error]]]:
+        streets = list({command.street for command in commands})
+        locations: dict[str, Location | None] = dict(
+            zip(streets, await asyncio.gather(*map(self._get_location, streets)), strict=True),
+        )
+
+        orders: list[Order] = []
+        rejected: list[tuple[CreateOrderCommand, Error]] = []
+        for command in commands:
+            volume = Volume.create(command.volume)
+            if volume.is_failure:
+                rejected.append((command, volume.error))
+                continue
+
+            location = locations[command.street]
+            if location is None:
+                rejected.append((command, self._street_is_unknown))
+                continue
+
+            order = Order.create(command.basket_id, location, volume.value)
+            if order.is_failure:
+                rejected.append((command, order.error))
+                continue
+            orders.append(order.value)
+
+        return orders, rejected
+
+    async def _get_location(self, street: str) -> Location | None:
+        # Пауза перед повтором удваивается с каждой попыткой. Исключение последней попытки пробрасывается.
+        async with self._geo_semaphore:
+            for attempt in range(1, self._geo_attempts):
+                try:
+                    return await self._geo_client.get_location(street)
+                except Exception:  # noqa: BLE001
+                    logger.warning(
+                        "Geo lookup failed, attempt %s of %s: %r",
+                        attempt,
+                        self._geo_attempts,
+                        street,
+                        exc_info=True,
+                    )
+                await asyncio.sleep(self._geo_retry_delay * 2 ** (attempt - 1))
+            return await self._geo_client.get_location(street)
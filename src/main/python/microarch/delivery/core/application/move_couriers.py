@@ -0,0 +1,46 @@
+import typing
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import Order
+from microarch.delivery.core.domain.services.fleet_movement import FleetMovement
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+
+if typing.TYPE_CHECKING:
+    import uuid
+
+
+class MoveCouriersResult(typing.NamedTuple):
+    moved: int
+    completed: int
+
+
+class MoveCouriersHandler:
+    # Такт движения: все курьеры с назначенными заказами делают шаг, изменения пишутся одним `commit`,
+    # то есть по одному пакетному запросу на таблицу.
+    # Курьеры блокируются так же, как диспетчером, - FOR UPDATE SKIP LOCKED. Курьер, которому диспетчер
+    # в это время назначает заказ, пропускает такт. Иначе такт освободил бы место хранения по устаревшему
+    # снимку, а `free_capacity`, записанная диспетчером, осталась бы прежней.
+
+    def __init__(self, uow: DeliveryUnitOfWork, movement: FleetMovement | None = None) -> None:
+        self._uow = uow
+        self._movement = movement or FleetMovement()
+
+    async def handle(self) -> MoveCouriersResult:
+        async with self._uow as uow:
+            orders = await uow.orders.get_assigned_orders()
+            couriers = await uow.couriers.claim_by_ids(
+                typing.cast("uuid.UUID", order.courier_id) for order in orders if order.courier_id is not None
+            )
+            couriers_by_id = {courier.id_: courier for courier in couriers}
+
+            # У курьера может быть несколько заказов, за такт он движется к самому раннему из них.
+            deliveries: dict[uuid.UUID, tuple[Courier, Order]] = {}
+            for order in orders:
+                courier = couriers_by_id.get(order.courier_id)
+                if courier is not None:
+                    deliveries.setdefault(typing.cast("uuid.UUID", courier.id_), (courier, order))
+
+            completed = self._movement.move(deliveries.values())
+            await uow.commit()
+
+        return MoveCouriersResult(moved=len(deliveries), completed=len(completed))
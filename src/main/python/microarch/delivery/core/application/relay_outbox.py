@@ -0,0 +1,43 @@
+import datetime
+import typing
+
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from microarch.delivery.core.ports.message_bus_producer import IMessageBusProducer
+
+
+class RelayOutboxResult(typing.NamedTuple):
+    published: int
+    # Время от возникновения события до его публикации: максимальное и суммарное по пачке.
+    max_latency: datetime.timedelta
+    total_latency: datetime.timedelta
+
+
+class RelayOutboxHandler:
+    # Публикует пачку событий из outbox и отмечает их обработанными в той же транзакции, в которой они захвачены.
+    # Если публикация не удалась, транзакция откатывается и события будут опубликованы следующей пачкой.
+
+    def __init__(self, uow: DeliveryUnitOfWork, producer: IMessageBusProducer) -> None:
+        self._uow = uow
+        self._producer = producer
+
+    async def handle(self, limit: int) -> RelayOutboxResult:
+        async with self._uow as uow:
+            events = await uow.outbox.claim_unprocessed(limit)
+            if not events:
+                return RelayOutboxResult(
+                    published=0,
+                    max_latency=datetime.timedelta(),
+                    total_latency=datetime.timedelta(),
+                )
+
+            await self._producer.publish(events)
+            published_at = datetime.datetime.now(tz=datetime.UTC)
+            await uow.outbox.mark_processed([event.event_id for event in events])
+            await uow.commit()
+
+        latencies = [published_at - event.occurred_on_utc for event in events]
+        return RelayOutboxResult(
+            published=len(events),
+            max_latency=max(latencies),
+            total_latency=sum(latencies, datetime.timedelta()),
+        )
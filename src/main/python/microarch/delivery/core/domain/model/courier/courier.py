@@ -14,6 +14,11 @@ if typing.TYPE_CHECKING:
 
 
 class Courier(Aggregate[uuid.UUID]):
+    __slots__ = ("_location", "_name", "_speed", "_storage_places")
+
+    _no_free_storage_place = Error("no.free.storage.place", "No free storage place")
+    _step_exceeds_speed = Error("step.exceeds.speed", "The courier cannot move that far in one step")
+
     def __init__(
         self,
         name: str,
@@ -45,6 +50,11 @@ class Courier(Aggregate[uuid.UUID]):
     def storage_places(self) -> list[StoragePlace]:
         return self._storage_places
 
+    @property
+    def free_capacity(self) -> int:
+        # Объем самого большого свободного места хранения: заказ большего объема курьер взять не сможет.
+        return max((sp.total_volume.value for sp in self._storage_places if not sp.is_occupied), default=0)
+
     @classmethod
     def create(cls, name: str, speed: Speed, location: Location) -> Result[typing.Self, Error]:
         if err := Guard.against_null_or_empty(name, "name"):
@@ -62,6 +72,25 @@ class Courier(Aggregate[uuid.UUID]):
 
         return Result.success(cls_)
 
+    @classmethod
+    def restore(  # noqa: PLR0913
+        cls,
+        id_: uuid.UUID,
+        name: str,
+        speed: Speed,
+        location: Location,
+        storage_places: list[StoragePlace],
+        free_capacity: int,
+    ) -> typing.Self:
+        # Доверенный путь для данных из хранилища: они проверены при сохранении, поэтому проверки не выполняются,
+        # а снимок состояния собирается из сохраненных значений.
+        courier = cls(name, speed, location, id_, storage_places)
+        courier._restore_snapshot(
+            ("name", "speed", "location", "free_capacity"),
+            (name, speed, location, free_capacity),
+        )
+        return courier
+
     def add_storage_place(self, name: str, volume: Volume) -> UnitResult[Error]:
         result = StoragePlace.create(name, volume)
 
@@ -77,7 +106,7 @@ class Courier(Aggregate[uuid.UUID]):
 
     def take_order(self, order: "Order") -> UnitResult[Error]:
         if not self.can_take_order(order):
-            return UnitResult.failure(Error("no.free.storage.place", "No free storage place"))
+            return UnitResult.failure(self._no_free_storage_place)
 
         empty_sp = typing.cast("StoragePlace", self._get_empty_storage_place(order))
 
@@ -99,7 +128,13 @@ class Courier(Aggregate[uuid.UUID]):
         return UnitResult.success()
 
     def calculate_time_to_location(self, location: Location) -> float:
-        return self._location.distance_to(location) / self._speed.value
+        # Время в пути берется из таблицы сетки, если скорость и расстояние в нее попадают.
+        distance = self._location.distance_to(location)
+        speed = self._speed.value
+        travel_times = Location.GRID.travel_times
+        if speed < len(travel_times) and distance < len(travel_times[speed]):
+            return travel_times[speed][distance]
+        return distance / speed
 
     def move(self, target: Location) -> UnitResult[Error]:
         dif_x = target.x - self._location.x
@@ -121,5 +156,22 @@ class Courier(Aggregate[uuid.UUID]):
         self._location = location_create_result.value
         return UnitResult.success()
 
+    def step_to(self, location: Location) -> UnitResult[Error]:
+        # Перемещает курьера в заранее рассчитанную точку, например при пакетном движении всего парка.
+        # За один шаг курьер проходит не больше своей скорости.
+        if self._location.distance_to(location) > self._speed.value:
+            return UnitResult.failure(self._step_exceeds_speed)
+
+        self._location = location
+        return UnitResult.success()
+
+    def _persistent_state(self) -> dict[str, typing.Any]:
+        return {
+            "name": self._name,
+            "speed": self._speed,
+            "location": self._location,
+            "free_capacity": self.free_capacity,
+        }
+
     def _get_empty_storage_place(self, order: "Order") -> StoragePlace | None:
         return next((sp for sp in self._storage_places if sp.can_store(order.volume)), None)
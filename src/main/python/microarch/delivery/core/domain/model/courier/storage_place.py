@@ -8,6 +8,14 @@ from microarch.delivery.core.domain.model.kernel.volume import Volume
 
 
 class StoragePlace(BaseEntity[uuid.UUID]):
+    __slots__ = ("_name", "_order_id", "_total_volume")
+
+    _impossible_take_order = Error("impossible.take.order", "It is impossible to take an order")
+    _order_id_does_not_match = Error(
+        "order.id.does.not.match",
+        "The order ID does not match the one stored in the storage place",
+    )
+
     def __init__(
         self,
         name: str,
@@ -40,6 +48,13 @@ class StoragePlace(BaseEntity[uuid.UUID]):
 
         return Result.success(cls(name=name, total_volume=total_volume))
 
+    @classmethod
+    def restore(cls, id_: uuid.UUID, name: str, total_volume: Volume, order_id: uuid.UUID | None) -> typing.Self:
+        # Доверенный путь для данных из хранилища, снимок состояния собирается из сохраненных значений.
+        storage_place = cls(name, total_volume, id_, order_id)
+        storage_place._restore_snapshot(("name", "total_volume", "order_id"), (name, total_volume, order_id))
+        return storage_place
+
     @property
     def is_occupied(self) -> bool:
         return self._order_id is not None
@@ -49,8 +64,7 @@ class StoragePlace(BaseEntity[uuid.UUID]):
 
     def store(self, order_id: uuid.UUID, volume: Volume) -> UnitResult[Error]:
         if not self.can_store(volume):
-            err = Error("impossible.take.order", "It is impossible to take an order")
-            return UnitResult.failure(err)
+            return UnitResult.failure(self._impossible_take_order)
 
         if err := Guard.against_null_or_empty_uuid(order_id, "order_id"):  # type: ignore[assignment]
             return UnitResult.failure(err)
@@ -63,8 +77,10 @@ class StoragePlace(BaseEntity[uuid.UUID]):
             return UnitResult.failure(err)
 
         if self._order_id is None or self._order_id != order_id:
-            err = Error("order.id.does.not.match", "The order ID does not match the one stored in the storage place")
-            return UnitResult.failure(err)
+            return UnitResult.failure(self._order_id_does_not_match)
 
         self._order_id = None
         return UnitResult.success()
+
+    def _persistent_state(self) -> dict[str, typing.Any]:
+        return {"name": self._name, "total_volume": self._total_volume, "order_id": self._order_id}
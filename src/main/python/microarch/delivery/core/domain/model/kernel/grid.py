@@ -0,0 +1,36 @@
+import itertools
+import typing
+
+
+class Grid:
+    # Ограниченная сетка города. Клеток немного, поэтому расстояния между всеми парами клеток и время в пути
+    # для небольших скоростей считаются один раз при создании сетки. Таблицы только для чтения.
+    # Таблица расстояний занимает size ** 4 ссылок: при size=10 это 10 000 элементов, при size=40 - 2,5 млн.
+    MIN_VALUE: typing.Final = 1
+
+    def __init__(self, size: int, max_table_speed: int = 10) -> None:
+        if size < 1:
+            msg = f"Grid size must be positive, got {size}"
+            raise ValueError(msg)
+
+        self.size = size
+        self.max_value = self.MIN_VALUE + size - 1
+
+        coordinates = list(itertools.product(range(self.MIN_VALUE, self.max_value + 1), repeat=2))
+        self.distances: tuple[tuple[int, ...], ...] = tuple(
+            tuple(abs(x1 - x2) + abs(y1 - y2) for x2, y2 in coordinates) for x1, y1 in coordinates
+        )
+
+        # `travel_times[speed][distance]`, для speed в [1, max_table_speed]. Более быстрые курьеры считаются делением.
+        max_distance = 2 * (size - 1)
+        self.travel_times: tuple[tuple[float, ...], ...] = tuple(
+            tuple(distance / speed for distance in range(max_distance + 1)) if speed else ()
+            for speed in range(max_table_speed + 1)
+        )
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.MIN_VALUE <= x <= self.max_value and self.MIN_VALUE <= y <= self.max_value
+
+    def cell(self, x: int, y: int) -> int:
+        # Только для точек внутри сетки, см. `contains`: за ее пределами номер клетки указывает на чужую клетку.
+        return (x - self.MIN_VALUE) * self.size + (y - self.MIN_VALUE)
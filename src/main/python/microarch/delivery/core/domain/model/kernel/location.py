@@ -1,20 +1,65 @@
+import itertools
+import sys
 import typing
 from dataclasses import dataclass, field
 
 from libs.errs import Error, Guard, Result
 
+from microarch.delivery.core.domain.model.kernel.grid import Grid
 
-@dataclass(frozen=True)
+DEFAULT_GRID_SIZE: typing.Final = 10
+OUTSIDE_GRID: typing.Final = sys.maxsize
+
+
+@dataclass(frozen=True, slots=True)
 class Location:
-    # Do not call the constructor directly. Use the `create` method to create.
-    MIN_VALUE: typing.Final[int] = field(default=1, init=False, repr=False, compare=False)
-    MAX_VALUE: typing.Final[int] = field(default=10, init=False, repr=False, compare=False)
+    # Do not call the constructor directly. Use `create` to validate coordinates, or `of` for already validated ones.
+    # Точек в сетке немного: каждая создается один раз при настройке сетки и дальше переиспользуется.
+    GRID: typing.ClassVar[Grid]
+    MIN_VALUE: typing.ClassVar[int] = Grid.MIN_VALUE
+    MAX_VALUE: typing.ClassVar[int]
 
     x: int
     y: int
+    # Номер клетки и строка таблицы расстояний из нее, заполняются при создании. У точки вне сетки клетки нет:
+    # ее `cell` не попадает ни в одну строку таблицы, строка пустая, и расстояния до нее считаются по координатам.
+    cell: int = field(init=False, repr=False, compare=False)
+    _distances: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # `of` не проверяет координаты, а точка может прийти из БД или внешнего сервиса, настроенных на другую сетку.
+        if self.GRID.contains(self.x, self.y):
+            cell = self.GRID.cell(self.x, self.y)
+            object.__setattr__(self, "cell", cell)
+            object.__setattr__(self, "_distances", self.GRID.distances[cell])
+        else:
+            object.__setattr__(self, "cell", OUTSIDE_GRID)
+            object.__setattr__(self, "_distances", ())
+
+    @classmethod
+    def configure_grid(cls, grid: Grid) -> None:
+        # Меняет размер сетки для всего приложения. Вызывается при старте, до создания первой `Location`:
+        # уже созданные точки ссылаются на таблицы прежней сетки.
+        cls.GRID = grid
+        cls.MAX_VALUE = grid.max_value
+
+        _interned.clear()
+        _created.clear()
+        for x, y in itertools.product(range(cls.MIN_VALUE, cls.MAX_VALUE + 1), repeat=2):
+            location = cls(x=x, y=y)
+            _interned[x, y] = location
+            _created[x, y] = Result.success(location)
+
+    @classmethod
+    def of(cls, x: int, y: int) -> typing.Self:
+        if (location := _interned.get((x, y))) is not None:
+            return typing.cast("typing.Self", location)
+        return cls(x=x, y=y)
 
     @classmethod
     def create(cls, x: int, y: int) -> Result[typing.Self, Error]:
+        if (result := _created.get((x, y))) is not None:
+            return typing.cast("Result[typing.Self, Error]", result)
         if err := Guard.against_out_of_range(x, cls.MIN_VALUE, cls.MAX_VALUE, param_name="x"):
             return Result.failure(err)
         if err := Guard.against_out_of_range(y, cls.MIN_VALUE, cls.MAX_VALUE, param_name="y"):
@@ -23,4 +68,14 @@ class Location:
         return Result.success(cls(x=x, y=y))
 
     def distance_to(self, location: "Location") -> int:
-        return abs(self.x - location.x) + abs(self.y - location.y)
+        # Проверка границ не нужна на частом пути: для точки вне сетки индекс выходит за пределы строки.
+        try:
+            return self._distances[location.cell]
+        except IndexError:
+            return abs(self.x - location.x) + abs(self.y - location.y)
+
+
+_interned: dict[tuple[int, int], Location] = {}
+_created: dict[tuple[int, int], Result[Location, Error]] = {}
+
+Location.configure_grid(Grid(DEFAULT_GRID_SIZE))
@@ -1,19 +1,33 @@
 import typing
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from libs.errs import Error, Guard, Result
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Speed:
-    # Do not call the constructor directly. Use the `create` method to create.
-    MIN_SPEED: typing.Final[int] = field(default=1, init=False, repr=False, compare=False)
+    # Do not call the constructor directly. Use `create` to validate the value, or `of` for an already validated one.
+    # Скорости - небольшие целые: значения до MAX_INTERNED создаются один раз и переиспользуются.
+    MIN_SPEED: typing.ClassVar[int] = 1
+    MAX_INTERNED: typing.ClassVar[int] = 100
 
     value: int
 
+    @classmethod
+    def of(cls, value: int) -> typing.Self:
+        if cls.MIN_SPEED <= value <= cls.MAX_INTERNED:
+            return typing.cast("typing.Self", _interned[value - cls.MIN_SPEED])
+        return cls(value=value)
+
     @classmethod
     def create(cls, value: int) -> Result[typing.Self, Error]:
+        if cls.MIN_SPEED <= value <= cls.MAX_INTERNED:
+            return typing.cast("Result[typing.Self, Error]", _created[value - cls.MIN_SPEED])
         if err := Guard.against_less_than(value, cls.MIN_SPEED, "value"):
             return Result.failure(err)
 
         return Result.success(cls(value=value))
+
+
+_interned: tuple[Speed, ...] = tuple(Speed(value=value) for value in range(Speed.MIN_SPEED, Speed.MAX_INTERNED + 1))
+_created: tuple[Result[Speed, Error], ...] = tuple(Result.success(value) for value in _interned)
@@ -1,18 +1,35 @@
 import typing
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from libs.errs import Error, Guard, Result
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Volume:
-    # Do not call the constructor directly. Use the `create` method to create.
-    MIN_TOTAL_VOLUME: typing.Final[int] = field(default=1, repr=False, init=False, compare=False)
+    # Do not call the constructor directly. Use `create` to validate the value, or `of` for an already validated one.
+    # Объемы - небольшие целые: значения до MAX_INTERNED создаются один раз и переиспользуются.
+    MIN_TOTAL_VOLUME: typing.ClassVar[int] = 1
+    MAX_INTERNED: typing.ClassVar[int] = 100
 
     value: int
 
+    @classmethod
+    def of(cls, value: int) -> typing.Self:
+        if cls.MIN_TOTAL_VOLUME <= value <= cls.MAX_INTERNED:
+            return typing.cast("typing.Self", _interned[value - cls.MIN_TOTAL_VOLUME])
+        return cls(value=value)
+
     @classmethod
     def create(cls, value: int) -> Result[typing.Self, Error]:
+        if cls.MIN_TOTAL_VOLUME <= value <= cls.MAX_INTERNED:
+            return typing.cast("Result[typing.Self, Error]", _created[value - cls.MIN_TOTAL_VOLUME])
         if err := Guard.against_less_than(value, cls.MIN_TOTAL_VOLUME, "value"):
             return Result.failure(err)
+
         return Result.success(cls(value=value))
+
+
+_interned: tuple[Volume, ...] = tuple(
+    Volume(value=value) for value in range(Volume.MIN_TOTAL_VOLUME, Volume.MAX_INTERNED + 1)
+)
+_created: tuple[Result[Volume, Error], ...] = tuple(Result.success(value) for value in _interned)
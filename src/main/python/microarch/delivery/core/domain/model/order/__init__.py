@@ -1,4 +1,5 @@
 from .enums import OrderStatusEnum
+from .events import OrderAssignedDomainEvent, OrderCompletedDomainEvent
 from .order import Order
 
-__all__ = ["Order", "OrderStatusEnum"]
+__all__ = ["Order", "OrderAssignedDomainEvent", "OrderCompletedDomainEvent", "OrderStatusEnum"]
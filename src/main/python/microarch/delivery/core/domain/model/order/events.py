@@ -0,0 +1,33 @@
+import typing
+import uuid
+
+from libs.ddd.domain_event import DomainEvent
+
+if typing.TYPE_CHECKING:
+    import datetime
+
+
+class OrderCompletedDomainEvent(DomainEvent):
+    def __init__(
+        self,
+        order_id: uuid.UUID,
+        courier_id: uuid.UUID,
+        event_id: uuid.UUID | None = None,
+        occurred_on_utc: "datetime.datetime | None" = None,
+    ) -> None:
+        super().__init__(event_id=event_id, occurred_on_utc=occurred_on_utc)
+        self.order_id = order_id
+        self.courier_id = courier_id
+
+
+class OrderAssignedDomainEvent(DomainEvent):
+    def __init__(
+        self,
+        order_id: uuid.UUID,
+        courier_id: uuid.UUID,
+        event_id: uuid.UUID | None = None,
+        occurred_on_utc: "datetime.datetime | None" = None,
+    ) -> None:
+        super().__init__(event_id=event_id, occurred_on_utc=occurred_on_utc)
+        self.order_id = order_id
+        self.courier_id = courier_id
@@ -7,12 +7,18 @@ from libs.errs import Error, Guard, Result, UnitResult
 from microarch.delivery.core.domain.model.kernel.location import Location
 from microarch.delivery.core.domain.model.kernel.volume import Volume
 from microarch.delivery.core.domain.model.order.enums import OrderStatusEnum
+from microarch.delivery.core.domain.model.order.events import OrderAssignedDomainEvent, OrderCompletedDomainEvent
 
 if typing.TYPE_CHECKING:
     from microarch.delivery.core.domain.model.courier import Courier
 
 
 class Order(Aggregate[uuid.UUID]):
+    __slots__ = ("_courier_id", "_location", "_status", "_volume")
+
+    _status_is_not_created = Error("status.is.not.created", "It is impossible to assign the order")
+    _status_is_not_assigned = Error("status.is.not.assigned", "It is impossible to complete the order")
+
     def __init__(
         self,
         id_: uuid.UUID,
@@ -53,17 +59,45 @@ class Order(Aggregate[uuid.UUID]):
 
         return Result.success(cls_)
 
+    @classmethod
+    def restore(
+        cls,
+        id_: uuid.UUID,
+        location: Location,
+        volume: Volume,
+        status: OrderStatusEnum,
+        courier_id: uuid.UUID | None,
+    ) -> typing.Self:
+        # Доверенный путь для данных из хранилища, снимок состояния собирается из сохраненных значений.
+        order = cls(id_, location, volume, status, courier_id)
+        order._restore_snapshot(("location", "volume", "status", "courier_id"), (location, volume, status, courier_id))
+        return order
+
     def assign(self, courier: "Courier") -> UnitResult[Error]:
         if self._status != OrderStatusEnum.CREATED:
-            return UnitResult.failure(Error("status.is.not.created", "It is impossible to assign the order"))
+            return UnitResult.failure(self._status_is_not_created)
 
         self._courier_id = courier.id_
         self._status = OrderStatusEnum.ASSIGNED
+        self.raise_domain_event(
+            OrderAssignedDomainEvent(typing.cast("uuid.UUID", self._id), typing.cast("uuid.UUID", self._courier_id)),
+        )
         return UnitResult.success()
 
     def complete(self) -> UnitResult[Error]:
         if self._status != OrderStatusEnum.ASSIGNED:
-            return UnitResult.failure(Error("status.is.not.assigned", "It is impossible to complete the order"))
+            return UnitResult.failure(self._status_is_not_assigned)
 
         self._status = OrderStatusEnum.COMPLETED
+        self.raise_domain_event(
+            OrderCompletedDomainEvent(typing.cast("uuid.UUID", self._id), typing.cast("uuid.UUID", self._courier_id)),
+        )
         return UnitResult.success()
+
+    def _persistent_state(self) -> dict[str, typing.Any]:
+        return {
+            "location": self._location,
+            "volume": self._volume,
+            "status": self._status,
+            "courier_id": self._courier_id,
+        }
@@ -0,0 +1,74 @@
+import math
+from collections.abc import Sequence
+
+
+def solve_assignment(costs: Sequence[Sequence[float]]) -> list[int]:
+    # Венгерский алгоритм (вариант с потенциалами) для прямоугольной матрицы n x m, где n <= m.
+    # Возвращает для каждой строки номер назначенного ей столбца так, что сумма стоимостей минимальна.
+    n = len(costs)
+    if n == 0:
+        return []
+
+    m = len(costs[0])
+    if m < n:
+        raise ValueError("The number of columns must be greater than or equal to the number of rows")
+
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)
+    way = [0] * (m + 1)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = _find_augmenting_path(costs, u, v, p, way)
+
+        while j0 != 0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    assignment = [-1] * n
+    for j in range(1, m + 1):
+        if p[j] != 0:
+            assignment[p[j] - 1] = j - 1
+
+    return assignment
+
+
+def _find_augmenting_path(
+    costs: Sequence[Sequence[float]],
+    u: list[float],
+    v: list[float],
+    p: list[int],
+    way: list[int],
+) -> int:
+    m = len(v) - 1
+    j0 = 0
+    minv = [math.inf] * (m + 1)
+    used = [False] * (m + 1)
+
+    while p[j0] != 0:
+        used[j0] = True
+        i0 = p[j0]
+        row, u_i0 = costs[i0 - 1], u[i0]
+        delta, j1 = math.inf, 0
+
+        for j in range(1, m + 1):
+            if used[j]:
+                continue
+            cur = row[j - 1] - u_i0 - v[j]
+            if cur < minv[j]:
+                minv[j], way[j] = cur, j0
+            if minv[j] < delta:
+                delta, j1 = minv[j], j
+
+        for j in range(m + 1):
+            if used[j]:
+                u[p[j]] += delta
+                v[j] -= delta
+            else:
+                minv[j] -= delta
+
+        j0 = j1
+
+    return j0
@@ -0,0 +1,42 @@
+import enum
+import typing
+from collections.abc import Callable, Sequence
+
+from microarch.delivery.core.domain.model.courier import Courier
+
+
+class TieBreak(enum.StrEnum):
+    LEAST_LOADED = "least_loaded"
+    HIGHEST_SPEED = "highest_speed"
+    ID_ORDER = "id_order"
+
+
+_TIE_BREAK_COMPONENTS: dict[TieBreak, Callable[[Courier], typing.Any]] = {
+    TieBreak.LEAST_LOADED: lambda courier: sum(sp.is_occupied for sp in courier.storage_places),
+    TieBreak.HIGHEST_SPEED: lambda courier: -courier.speed.value,
+    TieBreak.ID_ORDER: lambda courier: courier.id_,
+}
+
+
+class CourierRanking:
+    # Курьеры сравниваются сначала по времени до заказа, а при равном времени - по правилам
+    # `tie_break` в заданном порядке. Идентификатор курьера всегда замыкает ключ,
+    # поэтому выбор не зависит от порядка, в котором пришли курьеры.
+    DEFAULT_TIE_BREAK: typing.Final = (TieBreak.LEAST_LOADED, TieBreak.HIGHEST_SPEED, TieBreak.ID_ORDER)
+
+    def __init__(self, tie_break: Sequence[TieBreak] = DEFAULT_TIE_BREAK) -> None:
+        self.tie_break = tuple(dict.fromkeys((*tie_break, TieBreak.ID_ORDER)))
+        self._components = [_TIE_BREAK_COMPONENTS[rule] for rule in self.tie_break]
+
+    def key(self, courier: Courier, time: float) -> tuple[typing.Any, ...]:
+        return (time, *self.tie_key(courier))
+
+    def tie_key(self, courier: Courier) -> tuple[typing.Any, ...]:
+        # Часть ключа, не зависящая от заказа. Ее можно хранить вместе с курьером: в контейнере, упорядоченном
+        # по `tie_key`, лучший из курьеров с равным временем лежит первым, и перебирать остальных не нужно.
+        return tuple([component(courier) for component in self._components])
+
+    def best(self, couriers: typing.Iterable[Courier]) -> Courier:
+        # Лучший из курьеров, которые доберутся до заказа за одно и то же время. Проход линейный, поэтому
+        # передавать сюда стоит уже отобранных кандидатов, например первых курьеров упорядоченных групп.
+        return min(couriers, key=self.tie_key)
@@ -0,0 +1,57 @@
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.kernel.volume import Volume
+from microarch.delivery.core.domain.services.courier_ranking import CourierRanking
+
+
+class CourierSnapshot:
+    # Колоночное представление курьеров: i-я строка массивов описывает couriers[i].
+    # Снимок не следит за курьерами сам, после изменения курьера нужно вызвать `refresh`.
+
+    def __init__(self, couriers: Iterable[Courier]) -> None:
+        self.couriers = list(couriers)
+        count = len(self.couriers)
+
+        self.x: npt.NDArray[np.int64] = np.empty(count, dtype=np.int64)
+        self.y: npt.NDArray[np.int64] = np.empty(count, dtype=np.int64)
+        self.speed: npt.NDArray[np.int64] = np.empty(count, dtype=np.int64)
+        self.free_volume: npt.NDArray[np.int64] = np.empty(count, dtype=np.int64)
+
+        for idx in range(count):
+            self.refresh(idx)
+
+    def __len__(self) -> int:
+        return len(self.couriers)
+
+    def refresh(self, idx: int) -> None:
+        courier = self.couriers[idx]
+        self.x[idx] = courier.location.x
+        self.y[idx] = courier.location.y
+        self.speed[idx] = courier.speed.value
+        self.free_volume[idx] = courier.free_capacity
+
+    def times_to_location(self, location: Location) -> npt.NDArray[np.float64]:
+        return (np.abs(self.x - location.x) + np.abs(self.y - location.y)) / self.speed
+
+    def find_fastest(self, location: Location, volume: Volume, ranking: CourierRanking) -> int | None:
+        # Индекс самого быстрого курьера, способного взять заказ. Среди курьеров с равным
+        # временем выбор делает `ranking`, как и в `OrderDispatcher.dispatch`.
+        times = np.where(self.free_volume >= volume.value, self.times_to_location(location), np.inf)
+        if not len(times):
+            return None
+
+        best_time = times.min()
+        if not np.isfinite(best_time):
+            return None
+
+        candidates = np.flatnonzero(times == best_time)
+        if len(candidates) == 1:
+            return int(candidates[0])
+
+        best = ranking.best(self.couriers[idx] for idx in candidates)
+        return next(int(idx) for idx in candidates if self.couriers[idx] is best)
@@ -0,0 +1,205 @@
+import bisect
+import typing
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
+from libs.errs import Error, UnitResult
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.kernel.volume import Volume
+from microarch.delivery.core.domain.model.order import Order
+from microarch.delivery.core.domain.services.courier_ranking import CourierRanking
+
+if typing.TYPE_CHECKING:
+    import uuid
+
+type _Cell = tuple[int, int]
+# Наибольшее свободное место хранения курьера и его скорость.
+type _BucketKey = tuple[int, int]
+type _Rank = tuple[typing.Any, ...]
+
+
+class _Entry:
+    def __init__(self, courier_id: "uuid.UUID", courier: Courier) -> None:
+        self.courier_id = courier_id
+        self.courier = courier
+        self.cell: _Cell = (0, 0)
+        self.key: _BucketKey = (0, 0)
+        self.rank: _Rank = ()
+
+
+class _Bucket:
+    # Курьеры одной клетки с одинаковыми свободным объемом и скоростью, то есть с одинаковым временем до любой
+    # точки. Они упорядочены по `CourierRanking.tie_key`, поэтому лучший из них всегда первый.
+    __slots__ = ("_couriers", "_ranks")
+
+    def __init__(self) -> None:
+        self._couriers: dict[uuid.UUID, Courier] = {}
+        self._ranks: list[tuple[_Rank, uuid.UUID]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._ranks)
+
+    def __iter__(self) -> Iterator[Courier]:
+        return (self._couriers[courier_id] for _, courier_id in self._ranks)
+
+    def first(self) -> Courier:
+        return self._couriers[self._ranks[0][1]]
+
+    def add(self, entry: _Entry) -> None:
+        bisect.insort(self._ranks, (entry.rank, entry.courier_id))
+        self._couriers[entry.courier_id] = entry.courier
+
+    def remove(self, entry: _Entry) -> None:
+        # Идентификатор курьера входит в `tie_key`, поэтому ранги в группе не повторяются.
+        del self._ranks[bisect.bisect_left(self._ranks, (entry.rank, entry.courier_id))]
+        del self._couriers[entry.courier_id]
+
+
+class CourierSpatialIndex:
+    # Курьеры разложены по клеткам сетки, а внутри клетки - по свободному объему и скорости.
+    # Поиск идет кольцами Манхэттенского расстояния от точки заказа и останавливается, как только
+    # даже самый быстрый курьер следующего кольца не сможет приехать раньше уже найденного.
+    # Курьеры без свободных мест хранения учитываются индексом, но в клетки не попадают.
+    # Из курьеров с равным временем сравниваются только первые курьеры групп, поэтому стоимость поиска
+    # не растет с числом курьеров в клетке.
+
+    def __init__(self, couriers: Iterable[Courier] = (), ranking: CourierRanking | None = None) -> None:
+        self._ranking = ranking or CourierRanking()
+        self._cells: dict[_Cell, dict[_BucketKey, _Bucket]] = {}
+        self._entries: dict[uuid.UUID, _Entry] = {}
+        self._speeds: Counter[int] = Counter()
+
+        for courier in couriers:
+            self.add(courier)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, courier: object) -> bool:
+        return isinstance(courier, Courier) and courier.id_ in self._entries
+
+    def add(self, courier: Courier) -> None:
+        courier_id = typing.cast("uuid.UUID", courier.id_)
+        if courier_id in self._entries:
+            self.update(courier)
+            return
+
+        entry = self._entries[courier_id] = _Entry(courier_id, courier)
+        self._place(entry)
+
+    def remove(self, courier: Courier) -> None:
+        entry = self._entries.pop(typing.cast("uuid.UUID", courier.id_), None)
+        if entry is not None:
+            self._displace(entry)
+
+    def update(self, courier: Courier) -> None:
+        entry = self._entries[typing.cast("uuid.UUID", courier.id_)]
+        rank = self._ranking.tie_key(courier)
+        if (self._cell_of(courier), self._key_of(courier), rank) != (entry.cell, entry.key, entry.rank):
+            self._displace(entry)
+            self._place(entry)
+
+    def move(self, courier: Courier, target: Location) -> UnitResult[Error]:
+        return courier.move(target).on_success(lambda: self.update(courier))
+
+    def take_order(self, courier: Courier, order: Order) -> UnitResult[Error]:
+        return courier.take_order(order).on_success(lambda: self.update(courier))
+
+    def complete_order(self, courier: Courier, order: Order) -> UnitResult[Error]:
+        return courier.complete_order(order).on_success(lambda: self.update(courier))
+
+    def nearest(self, location: Location, volume: Volume) -> Iterator[Courier]:
+        # Курьеры, способные взять заказ объемом `volume`, в порядке удаления от `location`.
+        for _, buckets in self._rings(location, volume):
+            for _, bucket in buckets:
+                yield from bucket
+
+    def find_fastest(self, location: Location, volume: Volume) -> Courier | None:
+        # При равном времени курьер выбирается по правилам `CourierRanking`.
+        if not self._speeds:
+            return None
+
+        max_speed = max(self._speeds)
+        best_time = 0.0
+        best_buckets: list[_Bucket] = []
+
+        for distance, buckets in self._rings(location, volume):
+            if best_buckets and distance / max_speed > best_time:
+                break
+
+            for speed, bucket in buckets:
+                time = distance / speed
+                if not best_buckets or time < best_time:
+                    best_time, best_buckets = time, [bucket]
+                elif time == best_time:
+                    best_buckets.append(bucket)
+
+        if not best_buckets:
+            return None
+
+        return self._ranking.best(bucket.first() for bucket in best_buckets)
+
+    def _rings(self, location: Location, volume: Volume) -> Iterator[tuple[int, list[tuple[int, _Bucket]]]]:
+        for distance in range(2 * (Location.MAX_VALUE - Location.MIN_VALUE) + 1):
+            yield (
+                distance,
+                [
+                    (speed, bucket)
+                    for cell in self._ring_cells(location.x, location.y, distance)
+                    for (free_volume, speed), bucket in self._cells.get(cell, {}).items()
+                    if free_volume >= volume.value
+                ],
+            )
+
+    @staticmethod
+    def _ring_cells(x: int, y: int, distance: int) -> Iterator[_Cell]:
+        for dx in range(-distance, distance + 1):
+            cx = x + dx
+            if not Location.MIN_VALUE <= cx <= Location.MAX_VALUE:
+                continue
+
+            dy = distance - abs(dx)
+            for cy in (y - dy, y + dy) if dy else (y,):
+                if Location.MIN_VALUE <= cy <= Location.MAX_VALUE:
+                    yield cx, cy
+
+    def _place(self, entry: _Entry) -> None:
+        entry.cell, entry.key = self._cell_of(entry.courier), self._key_of(entry.courier)
+        entry.rank = self._ranking.tie_key(entry.courier)
+        self._speeds[entry.courier.speed.value] += 1
+
+        free_volume, _ = entry.key
+        if free_volume > 0:
+            buckets = self._cells.setdefault(entry.cell, {})
+            bucket = buckets.get(entry.key)
+            if bucket is None:
+                bucket = buckets[entry.key] = _Bucket()
+            bucket.add(entry)
+
+    def _displace(self, entry: _Entry) -> None:
+        speed = entry.key[1]
+        self._speeds[speed] -= 1
+        if not self._speeds[speed]:
+            del self._speeds[speed]
+
+        buckets = self._cells.get(entry.cell, {})
+        bucket = buckets.get(entry.key)
+        if bucket is None:
+            return
+
+        bucket.remove(entry)
+        if not bucket:
+            del buckets[entry.key]
+        if not buckets:
+            del self._cells[entry.cell]
+
+    @staticmethod
+    def _cell_of(courier: Courier) -> _Cell:
+        return courier.location.x, courier.location.y
+
+    @staticmethod
+    def _key_of(courier: Courier) -> _BucketKey:
+        free_volume = max((sp.total_volume.value for sp in courier.storage_places if not sp.is_occupied), default=0)
+        return free_volume, courier.speed.value
@@ -0,0 +1,66 @@
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.order import Order, OrderStatusEnum
+
+type Coordinates = npt.NDArray[np.int64]
+
+
+def step_towards(
+    x: Coordinates,
+    y: Coordinates,
+    speed: Coordinates,
+    target_x: Coordinates,
+    target_y: Coordinates,
+) -> tuple[Coordinates, Coordinates]:
+    # То же, что `Courier.move`, но сразу для массивов: сначала ход по x, остаток скорости - по y.
+    move_x = np.clip(target_x - x, -speed, speed)
+    remaining = speed - np.abs(move_x)
+    move_y = np.clip(target_y - y, -remaining, remaining)
+    return x + move_x, y + move_y
+
+
+class FleetMovement:
+    # Один такт движения парка: каждый курьер делает шаг к своему заказу, доставленные заказы завершаются.
+    # Новые координаты считаются векторно, затем применяются к курьерам через `Courier.step_to`.
+
+    def move(self, deliveries: Iterable[tuple[Courier, Order]]) -> list[Order]:
+        deliveries = list(deliveries)
+        if not deliveries:
+            return []
+
+        count = len(deliveries)
+        x = np.fromiter((courier.location.x for courier, _ in deliveries), dtype=np.int64, count=count)
+        y = np.fromiter((courier.location.y for courier, _ in deliveries), dtype=np.int64, count=count)
+        speed = np.fromiter((courier.speed.value for courier, _ in deliveries), dtype=np.int64, count=count)
+        target_x = np.fromiter((order.location.x for _, order in deliveries), dtype=np.int64, count=count)
+        target_y = np.fromiter((order.location.y for _, order in deliveries), dtype=np.int64, count=count)
+
+        new_x, new_y = step_towards(x, y, speed, target_x, target_y)
+        arrived = (new_x == target_x) & (new_y == target_y)
+
+        completed = []
+        for (courier, order), step_x, step_y, is_arrived in zip(
+            deliveries,
+            new_x.tolist(),
+            new_y.tolist(),
+            arrived.tolist(),
+            strict=True,
+        ):
+            # Точка лежит между текущим положением курьера и заказом, поэтому она всегда внутри сетки.
+            # Курьер, который не смог сделать шаг, остается на месте и заказ не доставляет.
+            if courier.step_to(Location.of(step_x, step_y)).is_failure or not is_arrived:
+                continue
+            # Сначала курьер освобождает место хранения: если заказа у него нет, заказ не должен стать COMPLETED
+            # и породить событие о завершении. Статус заказа проверяется заранее, чтобы место не освободилось
+            # у заказа, который завершить нельзя.
+            if order.status != OrderStatusEnum.ASSIGNED or courier.complete_order(order).is_failure:
+                continue
+            order.complete()
+            completed.append(order)
+
+        return completed
@@ -0,0 +1,85 @@
+import heapq
+from collections.abc import Iterable
+
+from libs.errs import Error, Result
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import Order
+from microarch.delivery.core.domain.model.order.enums import OrderStatusEnum
+from microarch.delivery.core.domain.services.assignment import solve_assignment
+from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
+
+
+class OptimalOrderDispatcher(OrderDispatcher):
+    # Распределяет пачку заказов так, чтобы сначала назначить как можно больше заказов,
+    # а затем минимизировать суммарное время доставки. Одиночный `dispatch` остается жадным:
+    # для одного заказа ближайший курьер и есть оптимальное решение.
+
+    def dispatch_many(self, orders: Iterable[Order], couriers: Iterable[Courier]) -> list[Result[Courier, Error]]:
+        orders = list(orders)
+        couriers = list(couriers)
+        results: list[Result[Courier, Error] | None] = [None] * len(orders)
+
+        created: list[int] = []
+        for idx, order in enumerate(orders):
+            if order.status is not OrderStatusEnum.CREATED:
+                results[idx] = Result.failure(self._order_is_not_created)
+            elif not couriers:
+                results[idx] = Result.failure(self._list_courier_is_empty)
+            else:
+                created.append(idx)
+
+        assigned = self._solve([orders[idx] for idx in created], couriers)
+
+        # Курьер кладет заказ в первое подходящее место хранения, поэтому свои заказы он
+        # принимает от большего к меньшему: так решение задачи о назначениях всегда выполнимо.
+        by_courier: dict[int, list[int]] = {}
+        for pos, courier_idx in enumerate(assigned):
+            if courier_idx is None:
+                results[created[pos]] = Result.failure(self._there_are_no_suitable_couriers)
+            else:
+                by_courier.setdefault(courier_idx, []).append(created[pos])
+
+        for courier_idx, order_indexes in by_courier.items():
+            for idx in sorted(order_indexes, key=lambda i: orders[i].volume.value, reverse=True):
+                results[idx] = self._assign(orders[idx], couriers[courier_idx])
+
+        return [result for result in results if result is not None]
+
+    @staticmethod
+    def _solve(orders: list[Order], couriers: list[Courier]) -> list[int | None]:
+        n = len(orders)
+        if n == 0:
+            return []
+
+        # Каждое свободное место хранения - отдельный "слот" курьера.
+        slots = [
+            (courier_idx, sp.total_volume.value)
+            for courier_idx, courier in enumerate(couriers)
+            for sp in courier.storage_places
+            if not sp.is_occupied
+        ]
+
+        # Заказу достаточно своих n самых дешевых подходящих слотов: если в оптимальном решении
+        # он занимает другой слот, то один из этих n свободен и обмен на него не ухудшает решение.
+        edges: list[dict[int, float]] = []
+        for order in orders:
+            feasible = (
+                (couriers[courier_idx].calculate_time_to_location(order.location), slot_idx)
+                for slot_idx, (courier_idx, volume) in enumerate(slots)
+                if volume >= order.volume.value
+            )
+            edges.append({slot_idx: time for time, slot_idx in heapq.nsmallest(n, feasible)})
+
+        columns = sorted({slot_idx for order_edges in edges for slot_idx in order_edges})
+        max_time = max((time for order_edges in edges for time in order_edges.values()), default=0.0)
+        # Штраф за неназначенный заказ больше любой суммы времен, а недопустимая пара дороже n штрафов.
+        unassigned_cost = max_time * n + 1
+        infeasible_cost = unassigned_cost * (n + 1)
+
+        costs = [
+            [order_edges.get(slot_idx, infeasible_cost) for slot_idx in columns] + [unassigned_cost] * n
+            for order_edges in edges
+        ]
+
+        return [slots[columns[column]][0] if column < len(columns) else None for column in solve_assignment(costs)]
@@ -1,41 +1,118 @@
+import math
 import typing
-from collections.abc import Iterable
+from collections.abc import AsyncIterable, Iterable, Sequence
 
 from libs.errs import Error, Result
 
 from microarch.delivery.core.domain.model.courier import Courier
 from microarch.delivery.core.domain.model.order import Order
 from microarch.delivery.core.domain.model.order.enums import OrderStatusEnum
+from microarch.delivery.core.domain.services.courier_ranking import CourierRanking, TieBreak
+from microarch.delivery.core.domain.services.courier_spatial_index import CourierSpatialIndex
 
 
 class IOrderDispatcher(typing.Protocol):
     def dispatch(self, order: Order, couriers: Iterable[Courier]) -> Result[Courier, Error]: ...
 
+    async def dispatch_stream(self, order: Order, couriers: AsyncIterable[Courier]) -> Result[Courier, Error]: ...
+
+    def dispatch_many(self, orders: Iterable[Order], couriers: Iterable[Courier]) -> list[Result[Courier, Error]]: ...
+
 
 class OrderDispatcher(IOrderDispatcher):
     _order_is_not_created = Error("order.is.not.created", "Order is not 'created' status")
     _list_courier_is_empty = Error("list.of.courier.is.empty", "List of courier is empty")
     _there_are_no_suitable_couriers = Error("there.are.no.suitable.couriers", "There are no suitable couriers.")
 
+    def __init__(self, tie_break: Sequence[TieBreak] = CourierRanking.DEFAULT_TIE_BREAK) -> None:
+        self._ranking = CourierRanking(tie_break)
+
     def dispatch(self, order: Order, couriers: Iterable[Courier]) -> Result[Courier, Error]:
+        # Курьеры перебираются один раз и нигде не накапливаются, поэтому подойдет и ленивый итератор.
         if order.status is not OrderStatusEnum.CREATED:
             return Result.failure(self._order_is_not_created)
-        if not couriers:
-            return Result.failure(self._list_courier_is_empty)
 
-        time_to_courier = {c.calculate_time_to_location(order.location): c for c in couriers if c.can_take_order(order)}
+        selector = _FastestCourierSelector(order, self._ranking)
+        for courier in couriers:
+            selector.offer(courier)
+
+        return self._assign_selected(order, selector)
+
+    async def dispatch_stream(self, order: Order, couriers: AsyncIterable[Courier]) -> Result[Courier, Error]:
+        # То же, что `dispatch`, но курьеры читаются из асинхронного источника, например курсора БД.
+        if order.status is not OrderStatusEnum.CREATED:
+            return Result.failure(self._order_is_not_created)
+
+        selector = _FastestCourierSelector(order, self._ranking)
+        async for courier in couriers:
+            selector.offer(courier)
+
+        return self._assign_selected(order, selector)
+
+    def dispatch_many(self, orders: Iterable[Order], couriers: Iterable[Courier]) -> list[Result[Courier, Error]]:
+        # Результат совпадает с последовательным вызовом `dispatch` для каждого заказа,
+        # но список курьеров разбирается один раз, а не на каждый заказ.
+        index = CourierSpatialIndex(couriers, self._ranking)
+        results: list[Result[Courier, Error]] = []
 
-        if not time_to_courier:
+        for order in orders:
+            if order.status is not OrderStatusEnum.CREATED:
+                results.append(Result.failure(self._order_is_not_created))
+                continue
+            if not index:
+                results.append(Result.failure(self._list_courier_is_empty))
+                continue
+
+            fast_courier = index.find_fastest(order.location, order.volume)
+            if fast_courier is None:
+                results.append(Result.failure(self._there_are_no_suitable_couriers))
+                continue
+
+            results.append(self._assign(order, fast_courier))
+            index.update(fast_courier)
+
+        return results
+
+    def _assign_selected(self, order: Order, selector: "_FastestCourierSelector") -> Result[Courier, Error]:
+        if selector.is_empty:
+            return Result.failure(self._list_courier_is_empty)
+        if selector.courier is None:
             return Result.failure(self._there_are_no_suitable_couriers)
 
-        fast_courier = time_to_courier[min(time_to_courier.keys())]
+        return self._assign(order, selector.courier)
 
-        result = order.assign(courier=fast_courier)
+    @staticmethod
+    def _assign(order: Order, courier: Courier) -> Result[Courier, Error]:
+        result = order.assign(courier=courier)
         if result.is_failure:
             return Result.failure(result.error)
 
-        result = fast_courier.take_order(order)
+        result = courier.take_order(order)
         if result.is_failure:
             return Result.failure(result.error)
 
-        return Result.success(fast_courier)
+        return Result.success(courier)
+
+
+class _FastestCourierSelector:
+    def __init__(self, order: Order, ranking: CourierRanking) -> None:
+        self._order = order
+        self._ranking = ranking
+        self._time = math.inf
+        self._key: tuple[typing.Any, ...] | None = None
+        self.is_empty = True
+        self.courier: Courier | None = None
+
+    def offer(self, courier: Courier) -> None:
+        self.is_empty = False
+        if not courier.can_take_order(self._order):
+            return
+
+        time = courier.calculate_time_to_location(self._order.location)
+        if time > self._time:
+            return
+
+        # Полный ключ нужен только для курьеров не медленнее текущего лучшего.
+        key = self._ranking.key(courier, time)
+        if self._key is None or key < self._key:
+            self._time, self._key, self.courier = time, key, courier
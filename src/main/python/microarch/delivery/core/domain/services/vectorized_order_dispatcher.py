@@ -0,0 +1,35 @@
+from collections.abc import Iterable
+
+from libs.errs import Error, Result
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import Order
+from microarch.delivery.core.domain.model.order.enums import OrderStatusEnum
+from microarch.delivery.core.domain.services.courier_snapshot import CourierSnapshot
+from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
+
+
+class VectorizedOrderDispatcher(OrderDispatcher):
+    # Выбирает курьера той же логикой, что и `OrderDispatcher`, но проверка вместимости и расчет
+    # времени выполняются сразу для всех курьеров над колоночным снимком `CourierSnapshot`.
+
+    def dispatch(self, order: Order, couriers: Iterable[Courier]) -> Result[Courier, Error]:
+        return self.dispatch_many([order], couriers)[0]
+
+    def dispatch_many(self, orders: Iterable[Order], couriers: Iterable[Courier]) -> list[Result[Courier, Error]]:
+        snapshot = CourierSnapshot(couriers)
+        return [self.dispatch_snapshot(order, snapshot) for order in orders]
+
+    def dispatch_snapshot(self, order: Order, snapshot: CourierSnapshot) -> Result[Courier, Error]:
+        if order.status is not OrderStatusEnum.CREATED:
+            return Result.failure(self._order_is_not_created)
+        if not snapshot:
+            return Result.failure(self._list_courier_is_empty)
+
+        idx = snapshot.find_fastest(order.location, order.volume, self._ranking)
+        if idx is None:
+            return Result.failure(self._there_are_no_suitable_couriers)
+
+        result = self._assign(order, snapshot.couriers[idx])
+        snapshot.refresh(idx)
+        return result
@@ -1,26 +1,42 @@
 import typing
+import uuid
 from types import TracebackType
 
+from libs.ddd.identity_map import IdentityMap
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
+from microarch.delivery.adapters.out.postgres.inbox_repository import SqlAlchemyInboxRepository
 from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
+from microarch.delivery.adapters.out.postgres.outbox_repository import SqlAlchemyOutboxRepository
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import Order
 from microarch.delivery.core.ports.courier_repository import ICourierRepository
+from microarch.delivery.core.ports.inbox_repository import IInboxRepository
 from microarch.delivery.core.ports.order_repository import IOrderRepository
+from microarch.delivery.core.ports.outbox_repository import IOutboxRepository
 
 
 class DeliveryUnitOfWork:
     orders: IOrderRepository
     couriers: ICourierRepository
+    outbox: IOutboxRepository
+    inbox: IInboxRepository
     session: AsyncSession
 
     def __init__(self, async_session_factory: async_sessionmaker[AsyncSession]) -> None:
         self._async_session_factory = async_session_factory
 
     async def __aenter__(self) -> typing.Self:
+        # Агрегаты, прочитанные или сохраненные через репозитории, запоминаются на время единицы работы:
+        # повторное чтение возвращает тот же экземпляр, а `commit` сохраняет их все разом.
+        self._orders_identity_map = IdentityMap[uuid.UUID, Order]()
+        self._couriers_identity_map = IdentityMap[uuid.UUID, Courier]()
         self.session = self._async_session_factory()
-        self.orders = SqlAlchemyOrderRepository(self.session)
-        self.couriers = SqlAlchemyCourierRepository(self.session)
+        self.orders = SqlAlchemyOrderRepository(self.session, self._orders_identity_map)
+        self.couriers = SqlAlchemyCourierRepository(self.session, self._couriers_identity_map)
+        self.outbox = SqlAlchemyOutboxRepository(self.session)
+        self.inbox = SqlAlchemyInboxRepository(self.session)
         return self
 
     async def __aexit__(
@@ -31,6 +47,30 @@ class DeliveryUnitOfWork:
     ) -> None:
         await self.session.rollback()
         await self.session.close()
+        self._orders_identity_map.clear()
+        self._couriers_identity_map.clear()
 
     async def commit(self) -> None:
+        # Неизмененные агрегаты не пишутся, поэтому пишутся только реально измененные. Порядок записи следует
+        # внешним ключам: заказ ссылается на курьера, место хранения - на курьера и заказ. Поэтому курьеры,
+        # созданные в этой единице работы, пишутся раньше заказов, а места хранения - после них.
+        # Доменные события агрегатов попадают в outbox в той же транзакции и публикуются позже `OutboxRelayWorker`.
+        orders = list(self._orders_identity_map)
+        couriers = list(self._couriers_identity_map)
+        await self.couriers.write_many(couriers)
+        await self.orders.write_many(orders)
+        await self.couriers.write_storage_places(couriers)
+
+        aggregates: list[Order | Courier] = [*orders, *couriers]
+        await self.outbox.add_many(event for aggregate in aggregates for event in aggregate.get_domain_events())
+
         await self.session.commit()
+
+        # Снимки и события агрегатов меняются только после успешного коммита. Если он не удался, изменения
+        # и события остаются в агрегатах, и повторный `commit` запишет их снова.
+        for aggregate in aggregates:
+            aggregate.mark_clean()
+            aggregate.clear_domain_events()
+        for courier in couriers:
+            for sp in courier.storage_places:
+                sp.mark_clean()
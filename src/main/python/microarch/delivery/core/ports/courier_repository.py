@@ -2,9 +2,22 @@ import typing
 import uuid
 
 from microarch.delivery.core.domain.model.courier.courier import Courier
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.kernel.volume import Volume
 
 
 class ICourierRepository(typing.Protocol):
     async def save(self, courier: Courier) -> None: ...
+    async def save_many(self, couriers: typing.Iterable[Courier]) -> None: ...
+    async def write_many(self, couriers: typing.Iterable[Courier]) -> None: ...
+    async def write_storage_places(self, couriers: typing.Iterable[Courier]) -> None: ...
     async def get_by_id(self, id_: uuid.UUID) -> Courier | None: ...
+    async def get_by_ids(self, ids: typing.Iterable[uuid.UUID]) -> list[Courier]: ...
+    async def claim_by_ids(self, ids: typing.Iterable[uuid.UUID]) -> list[Courier]: ...
     async def get_free_couriers(self) -> typing.Iterable[Courier]: ...
+    def iter_free_couriers(self, batch_size: int = ...) -> typing.AsyncIterator[Courier]: ...
+    async def get_couriers_able_to_take(self, volume: Volume, near: Location, limit: int) -> list[Courier]: ...
+    async def get_couriers_able_to_take_many(
+        self,
+        requests: typing.Iterable[tuple[Volume, Location, int]],
+    ) -> list[Courier]: ...
@@ -0,0 +1,9 @@
+import typing
+
+from microarch.delivery.core.domain.model.kernel.location import Location
+
+
+class IGeoClient(typing.Protocol):
+    # Координаты адреса доставки по названию улицы. None - сервис такой улицы не знает. Исключение - временный
+    # сбой, запрос можно повторить.
+    async def get_location(self, street: str) -> Location | None: ...
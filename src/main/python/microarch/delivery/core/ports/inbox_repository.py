@@ -0,0 +1,10 @@
+import typing
+import uuid
+
+
+class IInboxRepository(typing.Protocol):
+    # Отмечает сообщения обработанными и возвращает те из них, что раньше обработаны не были.
+    async def add_new(self, message_ids: typing.Collection[uuid.UUID]) -> set[uuid.UUID]: ...
+
+    # Только читает: какие из сообщений уже отмечены обработанными.
+    async def get_processed(self, message_ids: typing.Collection[uuid.UUID]) -> set[uuid.UUID]: ...
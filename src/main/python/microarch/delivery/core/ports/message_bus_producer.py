@@ -0,0 +1,8 @@
+import typing
+
+from libs.ddd.domain_event import DomainEvent
+
+
+class IMessageBusProducer(typing.Protocol):
+    # Публикует пачку событий во внешнюю шину. Возврат без исключения означает, что все события приняты.
+    async def publish(self, events: typing.Sequence[DomainEvent]) -> None: ...
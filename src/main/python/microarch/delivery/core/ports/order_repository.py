@@ -1,3 +1,4 @@
+import datetime
 import typing
 import uuid
 
@@ -6,6 +7,12 @@ from microarch.delivery.core.domain.model.order.order import Order
 
 class IOrderRepository(typing.Protocol):
     async def save(self, order: Order) -> None: ...
+    async def save_many(self, orders: typing.Iterable[Order]) -> None: ...
+    async def write_many(self, orders: typing.Iterable[Order]) -> None: ...
+    async def add_many_if_absent(self, orders: typing.Iterable[Order]) -> list[Order]: ...
     async def get_by_id(self, id_: uuid.UUID) -> Order | None: ...
     async def get_created_order(self) -> Order | None: ...
+    async def claim_created_orders(self, limit: int) -> list[Order]: ...
+    async def get_oldest_created_at(self) -> datetime.datetime | None: ...
     async def get_assigned_orders(self) -> typing.Iterable[Order]: ...
+    def iter_assigned_orders(self, batch_size: int = ...) -> typing.AsyncIterator[Order]: ...
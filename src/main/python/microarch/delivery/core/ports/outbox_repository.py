@@ -0,0 +1,10 @@
+import typing
+import uuid
+
+from libs.ddd.domain_event import DomainEvent
+
+
+class IOutboxRepository(typing.Protocol):
+    async def add_many(self, events: typing.Iterable[DomainEvent]) -> None: ...
+    async def claim_unprocessed(self, limit: int) -> list[DomainEvent]: ...
+    async def mark_processed(self, event_ids: typing.Sequence[uuid.UUID]) -> None: ...
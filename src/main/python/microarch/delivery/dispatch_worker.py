@@ -0,0 +1,78 @@
+import datetime
+import time
+
+from microarch.delivery.application_properties import DispatcherProperties
+from microarch.delivery.core.application.assign_orders import AssignOrdersHandler, AssignOrdersResult
+from microarch.delivery.periodic_worker import PeriodicWorker, WorkerMetrics
+
+
+class AdaptiveBatchPolicy:
+    # Пока очередь не пуста, размер пачки удваивается, а пауза между пачками минимальна.
+    # Когда заказов нет или их некому назначить, пачка уменьшается, а пауза удваивается.
+
+    def __init__(self, properties: DispatcherProperties) -> None:
+        self._properties = properties
+        self.batch_size = properties.min_batch_size
+        self.poll_interval = properties.min_poll_interval
+
+    def on_batch(self, result: AssignOrdersResult) -> None:
+        if result.claimed >= self.batch_size and result.assigned:
+            self.batch_size = min(self.batch_size * 2, self._properties.max_batch_size)
+            self.poll_interval = self._properties.min_poll_interval
+        elif result.assigned:
+            self.poll_interval = self._properties.min_poll_interval
+        else:
+            self.batch_size = max(self.batch_size // 2, self._properties.min_batch_size)
+            self._back_off()
+
+    def on_error(self) -> None:
+        self._back_off()
+
+    def _back_off(self) -> None:
+        self.poll_interval = min(self.poll_interval * 2, self._properties.max_poll_interval)
+
+
+class DispatchWorkerMetrics(WorkerMetrics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.started_at = time.monotonic()
+        self.batches = 0
+        self.orders_claimed = 0
+        self.orders_assigned = 0
+        self.last_batch_duration = 0.0
+        self.lag = datetime.timedelta()
+
+    @property
+    def throughput(self) -> float:
+        # Назначенных заказов в секунду с момента запуска.
+        elapsed = time.monotonic() - self.started_at
+        return self.orders_assigned / elapsed if elapsed else 0.0
+
+    def record(self, result: AssignOrdersResult, duration: float) -> None:
+        self.batches += 1
+        self.orders_claimed += result.claimed
+        self.orders_assigned += result.assigned
+        self.last_batch_duration = duration
+        self.lag = result.lag or datetime.timedelta()
+
+
+class DispatchWorker(PeriodicWorker[DispatchWorkerMetrics]):
+    # Фоновый цикл распределения заказов. Размер пачки и паузу между пачками задает `AdaptiveBatchPolicy`.
+
+    _failure_message = "Order dispatch batch failed"
+
+    def __init__(self, handler: AssignOrdersHandler, properties: DispatcherProperties) -> None:
+        super().__init__(DispatchWorkerMetrics())
+        self._handler = handler
+        self.policy = AdaptiveBatchPolicy(properties)
+
+    async def _step(self) -> float:
+        started = time.perf_counter()
+        result = await self._handler.handle(self.policy.batch_size)
+        self.metrics.record(result, time.perf_counter() - started)
+        self.policy.on_batch(result)
+        return self.policy.poll_interval
+
+    def _pause_after_error(self) -> float:
+        self.policy.on_error()
+        return self.policy.poll_interval
@@ -0,0 +1,42 @@
+import time
+
+from microarch.delivery.application_properties import FleetProperties
+from microarch.delivery.core.application.move_couriers import MoveCouriersHandler, MoveCouriersResult
+from microarch.delivery.periodic_worker import PeriodicWorker, WorkerMetrics
+
+
+class FleetTickMetrics(WorkerMetrics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ticks = 0
+        self.couriers_moved = 0
+        self.orders_completed = 0
+        self.last_tick_duration = 0.0
+
+    def record(self, result: MoveCouriersResult, duration: float) -> None:
+        self.ticks += 1
+        self.couriers_moved += result.moved
+        self.orders_completed += result.completed
+        self.last_tick_duration = duration
+
+
+class FleetTickWorker(PeriodicWorker[FleetTickMetrics]):
+    # Фоновый цикл движения курьеров. Такты идут с периодом `tick_interval`: время самого такта вычитается
+    # из паузы до следующего.
+
+    _failure_message = "Fleet tick failed"
+
+    def __init__(self, handler: MoveCouriersHandler, properties: FleetProperties) -> None:
+        super().__init__(FleetTickMetrics())
+        self._handler = handler
+        self._tick_interval = properties.tick_interval
+
+    async def _step(self) -> float:
+        started = time.perf_counter()
+        result = await self._handler.handle()
+        duration = time.perf_counter() - started
+        self.metrics.record(result, duration)
+        return max(self._tick_interval - duration, 0)
+
+    def _pause_after_error(self) -> float:
+        return self._tick_interval
@@ -1,12 +1,137 @@
 # microarch/delivery/main.py
 import asyncio
+import contextlib
+import typing
+from collections.abc import AsyncIterator
 
 import uvicorn
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from microarch.delivery.adapters.out.kafla.message_bus_producer import IKafkaProducer, KafkaMessageBusProducer
+from microarch.delivery.adapters.out.postgres.engine import create_engine
+from microarch.delivery.adapters.out.postgres.migrations import migrate
+from microarch.delivery.application_properties import ApplicationSettings, GridProperties
+from microarch.delivery.basket_events_consumer import BasketEventsConsumer, IKafkaConsumer
+from microarch.delivery.core.application.assign_orders import AssignOrdersHandler
+from microarch.delivery.core.application.create_orders import CreateOrdersHandler
+from microarch.delivery.core.application.move_couriers import MoveCouriersHandler
+from microarch.delivery.core.application.relay_outbox import RelayOutboxHandler
+from microarch.delivery.core.domain.model.kernel.grid import Grid
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from microarch.delivery.core.ports.geo_client import IGeoClient
+from microarch.delivery.core.ports.message_bus_producer import IMessageBusProducer
+from microarch.delivery.dispatch_worker import DispatchWorker
+from microarch.delivery.fleet_tick_worker import FleetTickWorker
+from microarch.delivery.outbox_relay_worker import OutboxRelayWorker
+from microarch.delivery.periodic_worker import PeriodicWorker
 
-def create_app() -> FastAPI:
-    return FastAPI(title="Delivery Service", version="1.0.0")
+
+def configure_grid(properties: GridProperties) -> None:
+    # Таблицы сетки пересчитываются, только если настройки отличаются от сетки по умолчанию.
+    grid = Location.GRID
+    if grid.size != properties.size or len(grid.travel_times) != properties.max_table_speed + 1:
+        Location.configure_grid(Grid(properties.size, properties.max_table_speed))
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Движок с пулом соединений создается один раз на запуск приложения, а не на каждый запрос.
+    settings: ApplicationSettings = app.state.settings
+    configure_grid(settings.grid_properties)
+
+    engine = create_engine(settings.db_properties)
+    if settings.db_properties.migrate_on_startup:
+        async with engine.begin() as conn:
+            await conn.run_sync(migrate)
+
+    app.state.engine = engine
+    app.state.async_session_factory = async_sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    dispatcher_properties = settings.dispatcher_properties
+    handler = AssignOrdersHandler(
+        DeliveryUnitOfWork(app.state.async_session_factory),
+        OrderDispatcher(),
+        dispatcher_properties.candidates_per_order,
+    )
+    app.state.dispatch_worker = DispatchWorker(handler, dispatcher_properties)
+
+    fleet_properties = settings.fleet_properties
+    app.state.fleet_tick_worker = FleetTickWorker(
+        MoveCouriersHandler(DeliveryUnitOfWork(app.state.async_session_factory)),
+        fleet_properties,
+    )
+
+    # Доменные события попадают в шину только через outbox: `DeliveryUnitOfWork.commit` пишет их в outbox
+    # и убирает из агрегатов. Ретранслятору нужна шина сообщений, без нее события копятся в outbox
+    # до запуска с продьюсером.
+    outbox_properties = settings.outbox_properties
+    producer: IMessageBusProducer | None = app.state.message_bus_producer
+    app.state.outbox_relay_worker = None
+    if producer is not None:
+        app.state.outbox_relay_worker = OutboxRelayWorker(
+            RelayOutboxHandler(DeliveryUnitOfWork(app.state.async_session_factory), producer),
+            outbox_properties,
+        )
+
+    # Заказы из топика корзин создаются, только если переданы клиенты Kafka и сервиса геолокации.
+    consumer_properties = settings.kafka_properties.kafka_consumer_properties
+    geo_properties = settings.geo_properties
+    app.state.basket_events_consumer = None
+    if app.state.kafka_consumer is not None and app.state.geo_client is not None:
+        app.state.basket_events_consumer = BasketEventsConsumer(
+            app.state.kafka_consumer,
+            CreateOrdersHandler(
+                DeliveryUnitOfWork(app.state.async_session_factory),
+                app.state.geo_client,
+                geo_properties.max_concurrency,
+                geo_properties.attempts,
+                geo_properties.retry_delay,
+            ),
+            consumer_properties,
+        )
+
+    workers: list[PeriodicWorker[typing.Any]] = []
+    if dispatcher_properties.enabled:
+        workers.append(app.state.dispatch_worker)
+    if fleet_properties.enabled:
+        workers.append(app.state.fleet_tick_worker)
+    if outbox_properties.enabled and app.state.outbox_relay_worker is not None:
+        workers.append(app.state.outbox_relay_worker)
+    if consumer_properties.enabled and app.state.basket_events_consumer is not None:
+        workers.append(app.state.basket_events_consumer)
+    tasks = [asyncio.create_task(worker.run()) for worker in workers]
+
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.stop()
+        await asyncio.gather(*tasks)
+        await engine.dispose()
+
+
+def create_app(
+    settings: ApplicationSettings | None = None,
+    message_bus_producer: IMessageBusProducer | None = None,
+    kafka_consumer: IKafkaConsumer | None = None,
+    geo_client: IGeoClient | None = None,
+    kafka_producer: IKafkaProducer | None = None,
+) -> FastAPI:
+    app = FastAPI(title="Delivery Service", version="1.0.0", lifespan=lifespan)
+    app.state.settings = settings or ApplicationSettings()
+    # Без своей шины сообщений события публикуются через Kafka продьюсер в топик заказов.
+    if message_bus_producer is None and kafka_producer is not None:
+        message_bus_producer = KafkaMessageBusProducer(
+            kafka_producer,
+            app.state.settings.kafka_properties.orders_events_topic,
+        )
+    app.state.message_bus_producer = message_bus_producer
+    app.state.kafka_consumer = kafka_consumer
+    app.state.geo_client = geo_client
+    return app
 
 
 async def main() -> None:
@@ -0,0 +1,58 @@
+import datetime
+import time
+
+from microarch.delivery.application_properties import OutboxProperties
+from microarch.delivery.core.application.relay_outbox import RelayOutboxHandler, RelayOutboxResult
+from microarch.delivery.periodic_worker import PeriodicWorker, WorkerMetrics
+
+
+class OutboxRelayMetrics(WorkerMetrics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.started_at = time.monotonic()
+        self.batches = 0
+        self.events_published = 0
+        self.last_batch_duration = 0.0
+        # Время от возникновения события до публикации: максимальное в последней пачке и суммарное за все время.
+        self.last_max_latency = datetime.timedelta()
+        self.total_latency = datetime.timedelta()
+
+    @property
+    def throughput(self) -> float:
+        # Опубликованных событий в секунду с момента запуска.
+        elapsed = time.monotonic() - self.started_at
+        return self.events_published / elapsed if elapsed else 0.0
+
+    @property
+    def mean_latency(self) -> datetime.timedelta:
+        return self.total_latency / self.events_published if self.events_published else datetime.timedelta()
+
+    def record(self, result: RelayOutboxResult, duration: float) -> None:
+        self.batches += 1
+        self.last_batch_duration = duration
+        if result.published:
+            self.events_published += result.published
+            self.last_max_latency = result.max_latency
+            self.total_latency += result.total_latency
+
+
+class OutboxRelayWorker(PeriodicWorker[OutboxRelayMetrics]):
+    # Фоновый цикл публикации событий из outbox. Полные пачки идут одна за другой, после неполной или ошибки
+    # ретранслятор ждет `poll_interval`.
+
+    _failure_message = "Outbox relay batch failed"
+
+    def __init__(self, handler: RelayOutboxHandler, properties: OutboxProperties) -> None:
+        super().__init__(OutboxRelayMetrics())
+        self._handler = handler
+        self._batch_size = properties.batch_size
+        self._poll_interval = properties.poll_interval
+
+    async def _step(self) -> float:
+        started = time.perf_counter()
+        result = await self._handler.handle(self._batch_size)
+        self.metrics.record(result, time.perf_counter() - started)
+        return 0 if result.published >= self._batch_size else self._poll_interval
+
+    def _pause_after_error(self) -> float:
+        return self._poll_interval
@@ -0,0 +1,49 @@
+import abc
+import asyncio
+import contextlib
+import logging
+import typing
+
+
+class WorkerMetrics:
+    def __init__(self) -> None:
+        self.errors = 0
+
+
+class PeriodicWorker[TMetrics: WorkerMetrics](abc.ABC):
+    # Фоновый цикл, запускается в lifespan приложения: `run` повторяет `run_once`, пока не вызван `stop`.
+    # Шаг цикла (`_step`) возвращает паузу перед следующим шагом в секундах, `stop` прерывает паузу. Ошибка шага
+    # пишется в лог модуля воркера и считается в метриках, после нее цикл ждет `_pause_after_error`.
+
+    _failure_message: typing.ClassVar[str] = "Worker step failed"
+
+    def __init__(self, metrics: TMetrics) -> None:
+        self._stopping = asyncio.Event()
+        self._logger = logging.getLogger(type(self).__module__)
+        self.metrics = metrics
+
+    async def run(self) -> None:
+        self._stopping.clear()
+        while not self._stopping.is_set():
+            pause = await self.run_once()
+            if pause <= 0:
+                continue
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), pause)
+
+    async def run_once(self) -> float:
+        try:
+            return await self._step()
+        except Exception:
+            self._logger.exception(self._failure_message)
+            self.metrics.errors += 1
+            return self._pause_after_error()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    @abc.abstractmethod
+    async def _step(self) -> float: ...
+
+    @abc.abstractmethod
+    def _pause_after_error(self) -> float: ...
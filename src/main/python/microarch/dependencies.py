@@ -1,28 +1,29 @@
 import typing
-from collections.abc import AsyncGenerator
 
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from microarch.delivery.adapters.out.postgres.engine import PoolMetrics, get_pool_metrics
 from microarch.delivery.application_properties import ApplicationSettings
 from microarch.delivery.core.domain.services.order_dispatcher import IOrderDispatcher, OrderDispatcher
 from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
 
 
-async def provide_properties() -> ApplicationSettings:
-    return ApplicationSettings()
+async def provide_properties(request: Request) -> ApplicationSettings:
+    return request.app.state.settings
 
 
 async def provide_order_dispatcher() -> IOrderDispatcher:
     return OrderDispatcher()
 
 
-async def provide_async_session_factory(
-    properties: typing.Annotated[ApplicationSettings, Depends(provide_properties)],
-) -> AsyncGenerator[async_sessionmaker[AsyncSession]]:
-    engine = create_async_engine(url=properties.db_properties.dsn)
-    yield async_sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    await engine.dispose()
+async def provide_async_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
+    # Фабрика сессий и движок создаются в lifespan приложения, см. `microarch.delivery.main.lifespan`.
+    return request.app.state.async_session_factory
+
+
+async def provide_pool_metrics(request: Request) -> PoolMetrics | None:
+    return get_pool_metrics(request.app.state.engine)
 
 
 async def provide_uow(
@@ -0,0 +1,57 @@
+# Создание заказов из сообщений корзин: по одному на транзакцию против пачек разного размера,
+# и повторная доставка тех же сообщений, как после ребалансировки консьюмеров.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_create_orders <dsn>
+# DSN можно передать и через переменную окружения DB_DSN. Созданные заказы и записи inbox удаляются.
+import asyncio
+import itertools
+import os
+import sys
+import time
+import uuid
+
+from microarch.delivery.adapters.out.postgres.models import BaseModel, InboxModel, OrderModel
+from microarch.delivery.core.application.create_orders import CreateOrderCommand, CreateOrdersHandler
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+MESSAGES = 5_000
+BATCH_SIZES = [1, 50, 500]
+
+
+class InstantGeoClient:
+    async def get_location(self, street: str) -> Location:
+        return Location.of(1 + len(street) % 10, 1)
+
+
+async def main(dsn: str) -> None:
+    engine = create_async_engine(dsn)
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    handler = CreateOrdersHandler(DeliveryUnitOfWork(session_factory), InstantGeoClient())
+
+    print(f"{MESSAGES} basket messages")
+    for batch_size in BATCH_SIZES:
+        commands = [
+            CreateOrderCommand(uuid.uuid4(), uuid.uuid4(), f"street {i % 20}", 1 + i % 10) for i in range(MESSAGES)
+        ]
+
+        rates = []
+        for _ in ("first delivery", "replay"):
+            started = time.perf_counter()
+            for batch in itertools.batched(commands, batch_size, strict=False):
+                await handler.handle(batch)
+            rates.append(MESSAGES / (time.perf_counter() - started))
+        print(f"  batch {batch_size:>4}: {rates[0]:10,.0f} orders/s, replay {rates[1]:10,.0f} messages/s")
+
+        async with engine.begin() as conn:
+            await conn.execute(delete(OrderModel))
+            await conn.execute(delete(InboxModel))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1] if len(sys.argv) > 1 else os.environ["DB_DSN"]))
@@ -0,0 +1,66 @@
+# Сравнение жадного и оптимального распределения пачки заказов.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_dispatch_strategies
+import copy
+import random
+import time
+import uuid
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import Order
+from microarch.delivery.core.domain.services.optimal_order_dispatcher import OptimalOrderDispatcher
+from microarch.delivery.core.domain.services.order_dispatcher import IOrderDispatcher, OrderDispatcher
+
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+SIZES = [(20, 50), (50, 200), (100, 500), (200, 1000)]
+SEED = 42
+
+
+def make_batch(orders_count: int, couriers_count: int, rnd: random.Random) -> tuple[list[Order], list[Courier]]:
+    orders = [
+        create_order(
+            uuid.uuid4(),
+            create_location(rnd.randint(1, 10), rnd.randint(1, 10)),
+            create_volume(rnd.randint(1, 20)),
+        )
+        for _ in range(orders_count)
+    ]
+    couriers = []
+    for _ in range(couriers_count):
+        courier = create_courier(
+            "courier",
+            create_speed(rnd.randint(1, 3)),
+            create_location(rnd.randint(1, 10), rnd.randint(1, 10)),
+        )
+        if rnd.random() < 0.3:
+            courier.add_storage_place("car", create_volume(20))
+        couriers.append(courier)
+    return orders, couriers
+
+
+def run(dispatcher: IOrderDispatcher, orders: list[Order], couriers: list[Courier]) -> tuple[int, float, float]:
+    started = time.perf_counter()
+    results = dispatcher.dispatch_many(orders, couriers)
+    elapsed = time.perf_counter() - started
+
+    total_time = sum(
+        result.value.calculate_time_to_location(order.location)
+        for order, result in zip(orders, results, strict=True)
+        if result.is_success
+    )
+    return sum(result.is_success for result in results), total_time, elapsed
+
+
+def main() -> None:
+    rnd = random.Random(SEED)
+    print(f"{'orders':>7} {'couriers':>9} | {'strategy':>8} {'assigned':>9} {'total time':>11} {'wall, ms':>9}")
+    for orders_count, couriers_count in SIZES:
+        orders, couriers = make_batch(orders_count, couriers_count, rnd)
+        for name, dispatcher in (("greedy", OrderDispatcher()), ("optimal", OptimalOrderDispatcher())):
+            assigned, total_time, elapsed = run(dispatcher, *copy.deepcopy((orders, couriers)))
+            row = f"{name:>8} {assigned:>9} {total_time:>11.2f} {elapsed * 1000:>9.1f}"
+            print(f"{orders_count:>7} {couriers_count:>9} | {row}")
+
+
+if __name__ == "__main__":
+    main()
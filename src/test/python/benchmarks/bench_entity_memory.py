@@ -0,0 +1,47 @@
+# Память, занимаемая загруженным парком курьеров: байт на курьера с одним местом хранения.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_entity_memory
+import gc
+import random
+import tracemalloc
+import uuid
+
+from microarch.delivery.core.domain.model.courier import Courier, StoragePlace
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.kernel.speed import Speed
+from microarch.delivery.core.domain.model.kernel.volume import Volume
+
+SIZES = [10_000, 100_000, 1_000_000]
+SEED = 42
+
+
+def load_fleet(size: int, rnd: random.Random) -> list[Courier]:
+    # Так же, как после загрузки из БД: объекты-значения общие, состояние запомнено через `mark_clean`.
+    couriers = []
+    for _ in range(size):
+        storage_place = StoragePlace(id_=uuid.uuid4(), name="bag", total_volume=Volume.create(10).value)
+        storage_place.mark_clean()
+        courier = Courier(
+            id_=uuid.uuid4(),
+            name="courier",
+            speed=Speed.create(rnd.randint(1, 3)).value,
+            location=Location.create(rnd.randint(1, 10), rnd.randint(1, 10)).value,
+            storage_places=[storage_place],
+        )
+        courier.mark_clean()
+        couriers.append(courier)
+    return couriers
+
+
+def main() -> None:
+    for size in SIZES:
+        gc.collect()
+        tracemalloc.start()
+        fleet = load_fleet(size, random.Random(SEED))
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{size:>9} couriers: {current / 2**20:8.1f} MiB, {current / size:6.0f} bytes/courier")
+        del fleet
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Один такт движения парка: `Courier.move` по одному курьеру против векторного `FleetMovement`.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_fleet_tick
+import random
+import time
+import uuid
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import Order
+from microarch.delivery.core.domain.services.fleet_movement import FleetMovement
+
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+SIZES = [1_000, 10_000, 100_000]
+SEED = 42
+
+
+def make_deliveries(size: int, rnd: random.Random) -> list[tuple[Courier, Order]]:
+    deliveries = []
+    for _ in range(size):
+        courier = create_courier(
+            "courier",
+            create_speed(rnd.randint(1, 3)),
+            create_location(rnd.randint(1, 10), rnd.randint(1, 10)),
+        )
+        order = create_order(
+            uuid.uuid4(),
+            create_location(rnd.randint(1, 10), rnd.randint(1, 10)),
+            create_volume(rnd.randint(1, 10)),
+        )
+        order.assign(courier)
+        courier.take_order(order)
+        deliveries.append((courier, order))
+    return deliveries
+
+
+def move_one_by_one(deliveries: list[tuple[Courier, Order]]) -> None:
+    for courier, order in deliveries:
+        courier.move(order.location)
+        if courier.location == order.location:
+            order.complete()
+            courier.complete_order(order)
+
+
+def main() -> None:
+    movement = FleetMovement()
+    for size in SIZES:
+        for name, tick in (("Courier.move", move_one_by_one), ("FleetMovement", movement.move)):
+            deliveries = make_deliveries(size, random.Random(SEED))
+            started = time.perf_counter()
+            tick(deliveries)
+            elapsed = time.perf_counter() - started
+            print(f"{name:<14} x {size:>7}: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
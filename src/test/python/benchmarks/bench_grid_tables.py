@@ -0,0 +1,43 @@
+# Расстояние и время в пути: таблицы сетки против арифметики через `abs()`.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_grid_tables
+import itertools
+import random
+import timeit
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.kernel.location import Location
+
+from python.helpers import create_courier, create_location, create_speed
+
+PAIRS = 10_000
+REPEAT = 5
+SEED = 42
+
+
+def distance_by_arithmetic(a: Location, b: Location) -> int:
+    return abs(a.x - b.x) + abs(a.y - b.y)
+
+
+def time_by_arithmetic(courier: Courier, location: Location) -> float:
+    return distance_by_arithmetic(courier.location, location) / courier.speed.value
+
+
+def main() -> None:
+    rnd = random.Random(SEED)
+    points = [create_location(rnd.randint(1, 10), rnd.randint(1, 10)) for _ in range(PAIRS + 1)]
+    pairs = list(itertools.pairwise(points))
+    couriers = [(create_courier("courier", create_speed(rnd.randint(1, 3)), a), b) for a, b in pairs]
+
+    cases = {
+        "distance abs()": lambda: [distance_by_arithmetic(a, b) for a, b in pairs],
+        "distance table": lambda: [a.distance_to(b) for a, b in pairs],
+        "time abs() / speed": lambda: [time_by_arithmetic(c, b) for c, b in couriers],
+        "time table": lambda: [c.calculate_time_to_location(b) for c, b in couriers],
+    }
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=REPEAT))
+        print(f"{name:<20}: {best / PAIRS * 1e9:6.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
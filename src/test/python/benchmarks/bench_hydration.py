@@ -0,0 +1,79 @@
+# Скорость гидратации курьеров из строк БД: конструкторы + `mark_clean` против доверенного `restore`.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_hydration <dsn>
+# DSN можно передать и через переменную окружения DB_DSN. Все изменения откатываются.
+import asyncio
+import os
+import sys
+import time
+
+from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
+from microarch.delivery.adapters.out.postgres.models import BaseModel, CourierModel, StoragePlaceModel
+from microarch.delivery.core.domain.model.courier import Courier, StoragePlace
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.kernel.speed import Speed
+from microarch.delivery.core.domain.model.kernel.volume import Volume
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from python.helpers import create_courier, create_location, create_speed
+
+SIZES = [10_000, 100_000]
+
+
+def storage_place_by_constructor(model: StoragePlaceModel) -> StoragePlace:
+    storage_place = StoragePlace(
+        id_=model.id_,
+        name=model.name,
+        total_volume=Volume.of(model.volume),
+        order_id=model.order_id,
+    )
+    storage_place.mark_clean()
+    return storage_place
+
+
+def courier_by_constructor(model: CourierModel) -> Courier:
+    # Прежняя гидратация: конструктор, затем снимок состояния через `mark_clean`.
+    courier = Courier(
+        id_=model.id_,
+        name=model.name,
+        speed=Speed.of(model.speed),
+        location=Location.of(model.location_x, model.location_y),
+        storage_places=[storage_place_by_constructor(storage_place) for storage_place in model.storage_places],
+    )
+    courier.mark_clean()
+    return courier
+
+
+async def measure(session: AsyncSession, size: int) -> None:
+    couriers = [
+        create_courier("courier", create_speed(1 + i % 3), create_location(1 + i % 10, 1 + i // 10 % 10))
+        for i in range(size)
+    ]
+    await SqlAlchemyCourierRepository(session).save_many(couriers)
+    models = list(await session.scalars(select(CourierModel)))
+
+    for name, to_entity in (("constructor + mark_clean", courier_by_constructor), ("restore", CourierModel.to_entity)):
+        started = time.perf_counter()
+        for model in models:
+            to_entity(model)
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<24} {size / elapsed:12,.0f} couriers/s")
+
+    await session.rollback()
+
+
+async def main(dsn: str) -> None:
+    engine = create_async_engine(dsn)
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+
+    for size in SIZES:
+        print(f"{size} couriers")
+        async with AsyncSession(engine) as session:
+            await measure(session, size)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1] if len(sys.argv) > 1 else os.environ["DB_DSN"]))
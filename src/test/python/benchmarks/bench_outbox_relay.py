@@ -0,0 +1,85 @@
+# Пропускная способность и задержка ретранслятора outbox при разном размере пачки и числе параллельных ретрансляторов.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_outbox_relay <dsn>
+# DSN можно передать и через переменную окружения DB_DSN. Публикация - заглушка в памяти, таблица outbox очищается.
+import asyncio
+import datetime
+import os
+import sys
+import time
+import typing
+import uuid
+
+from libs.ddd.domain_event import DomainEvent
+from microarch.delivery.adapters.out.postgres.models import BaseModel, OutboxModel
+from microarch.delivery.adapters.out.postgres.outbox_repository import SqlAlchemyOutboxRepository
+from microarch.delivery.core.application.relay_outbox import RelayOutboxHandler
+from microarch.delivery.core.domain.model.order import OrderCompletedDomainEvent
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+EVENTS = 20_000
+BATCH_SIZES = [10, 100, 1_000]
+RELAYS = [1, 4]
+
+
+class NullMessageBusProducer:
+    async def publish(self, events: typing.Sequence[DomainEvent]) -> None:
+        pass
+
+
+async def fill_outbox(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    async with session_factory() as session:
+        await session.execute(delete(OutboxModel))
+        await SqlAlchemyOutboxRepository(session).add_many(
+            [OrderCompletedDomainEvent(uuid.uuid4(), uuid.uuid4()) for _ in range(EVENTS)],
+        )
+        await session.commit()
+
+
+async def relay(handler: RelayOutboxHandler, batch_size: int) -> tuple[int, datetime.timedelta]:
+    published = 0
+    total_latency = datetime.timedelta()
+    while (result := await handler.handle(batch_size)).published:
+        published += result.published
+        total_latency += result.total_latency
+    return published, total_latency
+
+
+async def measure(engine: AsyncEngine, batch_size: int, relays: int) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await fill_outbox(session_factory)
+    producer = NullMessageBusProducer()
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(relay(RelayOutboxHandler(DeliveryUnitOfWork(session_factory), producer), batch_size) for _ in range(relays)),
+    )
+    elapsed = time.perf_counter() - started
+
+    published = sum(count for count, _ in results)
+    assert published == EVENTS, published
+    mean_latency = sum((latency for _, latency in results), datetime.timedelta()) / published
+    print(
+        f"  batch {batch_size:>5}, relays {relays}: {published / elapsed:10,.0f} events/s, "
+        f"mean latency {mean_latency.total_seconds():6.2f} s",
+    )
+
+
+async def main(dsn: str) -> None:
+    engine = create_async_engine(dsn, pool_size=max(RELAYS))
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+
+    print(f"{EVENTS} events")
+    for batch_size in BATCH_SIZES:
+        for relays in RELAYS:
+            await measure(engine, batch_size, relays)
+
+    async with engine.begin() as conn:
+        await conn.execute(delete(OutboxModel))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1] if len(sys.argv) > 1 else os.environ["DB_DSN"]))
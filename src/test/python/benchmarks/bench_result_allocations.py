@@ -0,0 +1,73 @@
+# Горячий путь `libs.errs`: время и память, выделяемая на вызов, для успешных и неуспешных операций домена.
+# Память считается по результатам, которые остаются живыми: общий экземпляр не стоит ничего.
+# В случаях с двумя операциями 56 байт - кортеж, в котором бенчмарк хранит пару результатов.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_result_allocations
+import math
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+
+from libs.errs import GeneralErrors, Guard, UnitResult
+from microarch.delivery.core.domain.model.courier import StoragePlace
+from microarch.delivery.core.domain.model.order import Order
+
+from python.helpers import create_courier, create_location, create_speed, create_volume
+
+CALLS = 100_000
+REPEAT = 5
+
+
+def measure(operation: Callable[[], object], calls: int) -> tuple[float, float]:
+    # Время и память меряются отдельными прогонами: tracemalloc сам замедляет каждое выделение.
+    elapsed = math.inf
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        for _ in range(calls):
+            operation()
+        elapsed = min(elapsed, time.perf_counter() - started)
+
+    results: list[object] = [None] * calls
+    tracemalloc.start()
+    for i in range(calls):
+        results[i] = operation()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / calls * 1e9, current / calls
+
+
+def dispatch_step() -> object:
+    # То, что делает диспетчер при назначении: заказ назначается курьеру, курьер берет заказ.
+    courier = COURIERS.pop()
+    order = ORDERS.pop()
+    return order.assign(courier), courier.take_order(order)
+
+
+ORDER_ID = uuid.uuid4()
+LOCATION = create_location(1, 1)
+VOLUME = create_volume(1)
+FREE_PLACE = StoragePlace.create("bag", create_volume(10)).value
+BUSY_PLACE = StoragePlace.create("bag", create_volume(10)).value
+BUSY_PLACE.store(ORDER_ID, VOLUME)
+# По паре курьер-заказ на каждый вызов во всех прогонах.
+COURIERS = [create_courier("courier", create_speed(1), LOCATION) for _ in range((REPEAT + 1) * CALLS)]
+ORDERS = [Order.create(uuid.uuid4(), LOCATION, VOLUME).value for _ in range((REPEAT + 1) * CALLS)]
+
+
+def main() -> None:
+    cases: dict[str, Callable[[], object]] = {
+        "UnitResult.success()": UnitResult.success,
+        "store + clear (success)": lambda: (FREE_PLACE.store(ORDER_ID, VOLUME), FREE_PLACE.clear(ORDER_ID)),
+        "store (occupied)": lambda: BUSY_PLACE.store(ORDER_ID, VOLUME),
+        "Guard failure": lambda: Guard.against_less_than(0, 1, "value"),
+        "Guard failure + message": lambda: Guard.against_less_than(0, 1, "value").message,  # type: ignore[union-attr]
+        "not_found": lambda: GeneralErrors.not_found("order", ORDER_ID),
+        "assign + take_order": dispatch_step,
+    }
+    for name, operation in cases.items():
+        ns, allocated = measure(operation, CALLS)
+        print(f"{name:<24}: {ns:7.1f} ns/call, {allocated:6.1f} bytes/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Гидратация курьеров из строк БД: новые объекты-значения на каждую строку против общих экземпляров из `of`.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_value_interning
+import gc
+import random
+import time
+import tracemalloc
+import uuid
+
+from microarch.delivery.adapters.out.postgres.models import CourierModel, StoragePlaceModel
+from microarch.delivery.core.domain.model.courier import Courier, StoragePlace
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.kernel.speed import Speed
+from microarch.delivery.core.domain.model.kernel.volume import Volume
+
+COURIERS = 100_000
+SEED = 42
+
+
+def make_models(rnd: random.Random) -> list[CourierModel]:
+    return [
+        CourierModel(
+            id_=uuid.uuid4(),
+            name="courier",
+            speed=rnd.randint(1, 3),
+            location_x=rnd.randint(1, 10),
+            location_y=rnd.randint(1, 10),
+            storage_places=[StoragePlaceModel(id_=uuid.uuid4(), name="bag", volume=10, order_id=None)],
+        )
+        for _ in range(COURIERS)
+    ]
+
+
+def storage_place_with_new_values(model: StoragePlaceModel) -> StoragePlace:
+    storage_place = StoragePlace(
+        id_=model.id_,
+        name=model.name,
+        total_volume=Volume(model.volume),
+        order_id=model.order_id,
+    )
+    storage_place.mark_clean()
+    return storage_place
+
+
+def to_entity_with_new_values(model: CourierModel) -> Courier:
+    # Прежняя гидратация: каждое поле-значение создается заново.
+    courier = Courier(
+        id_=model.id_,
+        name=model.name,
+        speed=Speed(model.speed),
+        location=Location(model.location_x, model.location_y),
+        storage_places=[storage_place_with_new_values(storage_place) for storage_place in model.storage_places],
+    )
+    courier.mark_clean()
+    return courier
+
+
+def main() -> None:
+    cases = {"new values": to_entity_with_new_values, "interned (of)": CourierModel.to_entity}
+    for name, to_entity in cases.items():
+        # Модели создаются заново для каждого случая: первое чтение атрибутов SQLAlchemy само выделяет память.
+        models = make_models(random.Random(SEED))
+        gc.collect()
+        collections = sum(stat["collections"] for stat in gc.get_stats())
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        couriers = [to_entity(model) for model in models]
+        elapsed = time.perf_counter() - started
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+        print(
+            f"{name:<14}: {elapsed * 1000:7.1f} ms, retained {current / 2**20:6.1f} MiB, {collections} gc collections",
+        )
+        del couriers, models
+
+
+if __name__ == "__main__":
+    main()
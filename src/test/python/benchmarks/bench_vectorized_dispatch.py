@@ -0,0 +1,76 @@
+# Сравнение построчного, индексного и векторизованного распределения заказов на больших парках курьеров.
+# Запуск: cd src/test && PYTHONPATH=../main/python python -m python.benchmarks.bench_vectorized_dispatch
+import copy
+import random
+import time
+import uuid
+from collections.abc import Callable
+
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import Order
+from microarch.delivery.core.domain.services.courier_snapshot import CourierSnapshot
+from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
+from microarch.delivery.core.domain.services.vectorized_order_dispatcher import VectorizedOrderDispatcher
+
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+FLEET_SIZES = [1_000, 10_000, 100_000]
+ORDERS_COUNT = 100
+SEED = 42
+
+
+def make_fleet(size: int, rnd: random.Random) -> list[Courier]:
+    return [
+        create_courier(
+            "courier",
+            create_speed(rnd.randint(1, 3)),
+            create_location(rnd.randint(1, 10), rnd.randint(1, 10)),
+        )
+        for _ in range(size)
+    ]
+
+
+def make_orders(count: int, rnd: random.Random) -> list[Order]:
+    return [
+        create_order(
+            uuid.uuid4(),
+            create_location(rnd.randint(1, 10), rnd.randint(1, 10)),
+            create_volume(rnd.randint(1, 10)),
+        )
+        for _ in range(count)
+    ]
+
+
+def measure(action: Callable[[list[Order], list[Courier]], object], orders: list[Order], fleet: list[Courier]) -> float:
+    orders, fleet = copy.deepcopy((orders, fleet))
+    started = time.perf_counter()
+    action(orders, fleet)
+    return (time.perf_counter() - started) * 1000
+
+
+def sequential_dispatch(orders: list[Order], fleet: list[Courier]) -> None:
+    dispatcher = OrderDispatcher()
+    for order in orders:
+        dispatcher.dispatch(order, fleet)
+
+
+def main() -> None:
+    rnd = random.Random(SEED)
+    orders = make_orders(ORDERS_COUNT, rnd)
+    actions: dict[str, Callable[[list[Order], list[Courier]], object]] = {
+        "dispatch x N": sequential_dispatch,
+        "dispatch_many (index)": OrderDispatcher().dispatch_many,
+        "dispatch_many (numpy)": VectorizedOrderDispatcher().dispatch_many,
+        "snapshot build only": lambda _, fleet: CourierSnapshot(fleet),
+    }
+
+    print(f"{ORDERS_COUNT} orders")
+    print(f"{'couriers':>9} | " + " | ".join(f"{name:>22}" for name in actions))
+    for size in FLEET_SIZES:
+        fleet = make_fleet(size, rnd)
+        timings = [measure(action, orders, fleet) for action in actions.values()]
+        print(f"{size:>9} | " + " | ".join(f"{timing:>19.1f} ms" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
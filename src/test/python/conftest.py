@@ -1,9 +1,17 @@
+import typing
 from collections.abc import AsyncGenerator, Generator
 
 import pytest
-from microarch.delivery.adapters.out.postgres.models import BaseModel
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from microarch.delivery.adapters.out.postgres.migrations import migrate
+from microarch.delivery.adapters.out.postgres.models import (
+    CourierModel,
+    InboxModel,
+    OrderModel,
+    OutboxModel,
+    StoragePlaceModel,
+)
+from sqlalchemy import create_engine, delete, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from testcontainers.postgres import PostgresContainer
 
 
@@ -12,8 +20,9 @@ def postgres_container() -> Generator[PostgresContainer]:
     with PostgresContainer("postgres:16", driver="psycopg") as postgres:
         engine = create_engine(postgres.get_connection_url())
         with engine.begin() as conn:
-            BaseModel.metadata.drop_all(conn)
-            BaseModel.metadata.create_all(conn)
+            conn.execute(text("DROP SCHEMA public CASCADE"))
+            conn.execute(text("CREATE SCHEMA public"))
+            migrate(conn)
         yield postgres
         engine.dispose()
 
@@ -27,3 +36,17 @@ async def async_session(postgres_container: PostgresContainer) -> AsyncGenerator
         await session.rollback()
 
     await engine.dispose()
+
+
+@pytest.fixture
+async def session_factory(async_session: AsyncSession) -> AsyncGenerator[async_sessionmaker[AsyncSession]]:
+    # Обработчики и единица работы сами фиксируют транзакции, поэтому данные теста удаляются явно.
+    factory = async_sessionmaker(typing.cast("AsyncEngine", async_session.bind))
+    yield factory
+    async with factory() as session:
+        await session.execute(delete(StoragePlaceModel))
+        await session.execute(delete(OrderModel))
+        await session.execute(delete(CourierModel))
+        await session.execute(delete(OutboxModel))
+        await session.execute(delete(InboxModel))
+        await session.commit()
@@ -1,10 +1,15 @@
+import contextlib
+import typing
 import uuid
+from collections.abc import Generator
 
 from microarch.delivery.core.domain.model.courier.courier import Courier
 from microarch.delivery.core.domain.model.kernel.location import Location
 from microarch.delivery.core.domain.model.kernel.speed import Speed
 from microarch.delivery.core.domain.model.kernel.volume import Volume
 from microarch.delivery.core.domain.model.order.order import Order
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 
 def create_volume(value: int) -> Volume:
@@ -25,3 +30,35 @@ def create_order(basket_id: uuid.UUID, location: Location, volume: Volume) -> Or
 
 def create_courier(name: str, spped: Speed, location: Location) -> Courier:
     return Courier.create(name, spped, location).value
+
+
+@contextlib.contextmanager
+def capture_statements(async_session: AsyncSession) -> Generator[list[str]]:
+    # Собирает SQL всех запросов, выполненных через движок сессии.
+    statements: list[str] = []
+    engine = typing.cast("AsyncEngine", async_session.bind).sync_engine
+
+    def on_execute(*args: object) -> None:
+        statements.append(typing.cast("str", args[2]))
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+
+class StubHandler[TResult]:
+    # Обработчик для тестов фоновых воркеров: возвращает результаты по очереди и запоминает аргументы вызовов.
+    # Исключение среди результатов выбрасывается. Последний результат повторяется, когда остальные исчерпаны.
+
+    def __init__(self, *results: TResult | Exception) -> None:
+        self.calls: list[tuple[typing.Any, ...]] = []
+        self._results = list(results)
+
+    async def handle(self, *args: typing.Any) -> TResult:  # noqa: ANN401
+        self.calls.append(args)
+        result = self._results.pop(0) if len(self._results) > 1 else self._results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
@@ -0,0 +1,27 @@
+import uuid
+
+from libs.errs import Error, GeneralErrors
+
+
+class TestError:
+    def test_message_is_formatted_from_args(self) -> None:
+        id_ = uuid.uuid4()
+
+        error = GeneralErrors.not_found("order", id_)
+
+        assert error.message == f"Record not found. Name: order, id: {id_}"
+        assert error.serialize() == f"record.not.found||Record not found. Name: order, id: {id_}"
+
+    def test_message_keeps_state_of_mutable_args_at_creation(self) -> None:
+        items = [1, 2]
+        error = Error("items.are.invalid", "Items {} are invalid", items)
+
+        items.append(3)
+
+        assert error.message == "Items [1, 2] are invalid"
+
+    def test_errors_with_same_code_and_message_are_equal(self) -> None:
+        assert Error("value.is.invalid", "Value '{}' is invalid for {}", 5, "x") == Error(
+            "value.is.invalid",
+            "Value '5' is invalid for x",
+        )
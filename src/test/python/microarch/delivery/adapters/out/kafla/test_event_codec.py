@@ -0,0 +1,69 @@
+import datetime
+import json
+import uuid
+
+import pytest
+from libs.ddd.domain_event import DomainEvent
+from microarch.delivery.adapters.out.kafla.event_codec import decode_event, encode_event
+from microarch.delivery.core.domain.model.order import OrderAssignedDomainEvent, OrderCompletedDomainEvent
+
+
+@pytest.mark.parametrize("event_class", [OrderAssignedDomainEvent, OrderCompletedDomainEvent])
+def test_round_trip(event_class: type[OrderAssignedDomainEvent | OrderCompletedDomainEvent]) -> None:
+    event = event_class(uuid.uuid4(), uuid.uuid4())
+
+    result = decode_event(encode_event(event))
+
+    assert type(result) is event_class
+    assert isinstance(result, OrderAssignedDomainEvent | OrderCompletedDomainEvent)
+    assert result.event_id == event.event_id
+    assert result.occurred_on_utc == event.occurred_on_utc
+    assert result.order_id == event.order_id
+    assert result.courier_id == event.courier_id
+
+
+@pytest.mark.parametrize(
+    ("event_class", "event_type"),
+    [
+        (OrderAssignedDomainEvent, "OrderAssignedIntegrationEvent"),
+        (OrderCompletedDomainEvent, "OrderCompletedIntegrationEvent"),
+    ],
+)
+def test_encode_as_proto3_json_integration_event(
+    event_class: type[OrderAssignedDomainEvent | OrderCompletedDomainEvent],
+    event_type: str,
+) -> None:
+    event = event_class(
+        uuid.uuid4(),
+        uuid.uuid4(),
+        occurred_on_utc=datetime.datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=datetime.UTC),
+    )
+
+    result = json.loads(encode_event(event))
+
+    assert result == {
+        "eventId": str(event.event_id),
+        "eventType": event_type,
+        "occurredAt": "2024-01-01T12:30:15.123456Z",
+        "orderId": str(event.order_id),
+        "courierId": str(event.courier_id),
+    }
+
+
+def test_encode_fails_for_event_without_integration_event() -> None:
+    with pytest.raises(ValueError, match="No integration event for event type: 'DomainEvent'"):
+        encode_event(DomainEvent())
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"", "Invalid order event"),
+        (b"[]", "Invalid order event"),
+        (b'{"eventType": "OrderCreatedIntegrationEvent"}', "Unsupported event type: 'OrderCreatedIntegrationEvent'"),
+        (b'{"eventType": "OrderCompletedIntegrationEvent"}', "Invalid order event: 'orderId'"),
+    ],
+)
+def test_decode_fails_for_invalid_data(data: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        decode_event(data)
@@ -0,0 +1,52 @@
+import asyncio
+import typing
+import uuid
+
+import pytest
+from microarch.delivery.adapters.out.kafla.event_codec import decode_event
+from microarch.delivery.adapters.out.kafla.message_bus_producer import KafkaMessageBusProducer
+from microarch.delivery.core.domain.model.order import OrderAssignedDomainEvent, OrderCompletedDomainEvent
+
+TOPIC = "orders.events"
+
+
+class RecordingKafkaProducer:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.messages: list[tuple[str, bytes, bytes | None]] = []
+        self._error = error
+
+    async def send(self, topic: str, value: bytes, key: bytes | None = None) -> asyncio.Future[typing.Any]:
+        self.messages.append((topic, value, key))
+        delivery = asyncio.get_running_loop().create_future()
+        if self._error is not None:
+            delivery.set_exception(self._error)
+        else:
+            delivery.set_result(None)
+        return delivery
+
+
+class TestKafkaMessageBusProducer:
+    async def test_publish_encoded_events_keyed_by_order(self) -> None:
+        # Arrange
+        kafka_producer = RecordingKafkaProducer()
+        events: list[OrderAssignedDomainEvent | OrderCompletedDomainEvent] = [
+            OrderAssignedDomainEvent(uuid.uuid4(), uuid.uuid4()),
+            OrderCompletedDomainEvent(uuid.uuid4(), uuid.uuid4()),
+        ]
+        sut = KafkaMessageBusProducer(kafka_producer, TOPIC)
+
+        # Act
+        await sut.publish(events)
+
+        # Assert
+        assert [topic for topic, _, _ in kafka_producer.messages] == [TOPIC, TOPIC]
+        assert [key for _, _, key in kafka_producer.messages] == [event.order_id.bytes for event in events]
+        decoded = [decode_event(value) for _, value, _ in kafka_producer.messages]
+        assert [type(event) for event in decoded] == [type(event) for event in events]
+        assert [event.event_id for event in decoded] == [event.event_id for event in events]
+
+    async def test_publish_fails_if_broker_rejects_message(self) -> None:
+        sut = KafkaMessageBusProducer(RecordingKafkaProducer(RuntimeError("broker is down")), TOPIC)
+
+        with pytest.raises(RuntimeError, match="broker is down"):
+            await sut.publish([OrderCompletedDomainEvent(uuid.uuid4(), uuid.uuid4())])
@@ -0,0 +1,28 @@
+from microarch.delivery.adapters.out.postgres import bulk
+from microarch.delivery.adapters.out.postgres.models import OrderModel
+from microarch.delivery.core.domain.model.order import OrderStatusEnum
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from python.constants import BASKET_ID, ORDER_LOCATION, ORDER_VOLUME
+from python.helpers import create_order
+
+
+class TestUpsert:
+    async def test_upsert_keeps_last_row_for_same_primary_key(self, async_session: AsyncSession) -> None:
+        # Arrange
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        row = OrderModel.row_from_entity(order)
+
+        # Act
+        await bulk.upsert(
+            async_session,
+            OrderModel.__table__,  # type: ignore[arg-type]
+            [row, {**row, "status": OrderStatusEnum.COMPLETED}, {**row, "volume": 7}],
+        )
+
+        # Assert
+        model = await async_session.scalar(select(OrderModel).where(OrderModel.id_ == order.id_))
+        assert model is not None
+        assert model.status == OrderStatusEnum.CREATED
+        assert model.volume == 7
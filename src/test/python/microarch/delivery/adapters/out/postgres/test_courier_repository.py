@@ -2,15 +2,24 @@ import typing
 import uuid
 
 import pytest
+from libs.ddd.identity_map import IdentityMap
 from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
 from microarch.delivery.adapters.out.postgres.models import CourierModel, StoragePlaceModel
 from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
+from microarch.delivery.core.domain.model.courier.courier import Courier
 from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from python.constants import BASKET_ID, COURIER_LOCATION, COURIER_NAME, COURIER_SPEED, ORDER_LOCATION, ORDER_VOLUME
-from python.helpers import create_courier, create_order, create_volume
+from python.helpers import (
+    capture_statements,
+    create_courier,
+    create_location,
+    create_order,
+    create_speed,
+    create_volume,
+)
 
 
 @pytest.fixture
@@ -124,3 +133,308 @@ class TestSqlAlchemyCourierRepository:
 
         # Assert
         assert result == [free_courier]
+
+    async def test_iter_free_couriers(self, sut: SqlAlchemyCourierRepository, async_session: AsyncSession) -> None:
+        # Arrange
+        order_repository = SqlAlchemyOrderRepository(async_session)
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        await order_repository.save(order)
+
+        busy_courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        OrderDispatcher().dispatch(order, [busy_courier])
+        await sut.save(busy_courier)
+        await order_repository.save(order)
+
+        free_couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(5)]
+        for courier in free_couriers:
+            await sut.save(courier)
+
+        # Act
+        result = [courier async for courier in sut.iter_free_couriers(batch_size=2)]
+
+        # Assert
+        assert sorted(result) == sorted(free_couriers)
+        assert all(len(courier.storage_places) == 1 for courier in result)
+
+    async def test_iter_free_couriers_does_not_track_streamed_couriers(self, async_session: AsyncSession) -> None:
+        # Arrange
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(3)]
+        await SqlAlchemyCourierRepository(async_session).save_many(couriers)
+        identity_map = IdentityMap[uuid.UUID, Courier]()
+        sut = SqlAlchemyCourierRepository(async_session, identity_map)
+        loaded = await sut.get_by_id(typing.cast("uuid.UUID", couriers[0].id_))
+
+        # Act
+        result = [courier async for courier in sut.iter_free_couriers(batch_size=2)]
+
+        # Assert
+        assert sorted(result) == sorted(couriers)
+        assert any(courier is loaded for courier in result)
+        assert len(identity_map) == 1
+
+    async def test_save_many_new_entities(self, sut: SqlAlchemyCourierRepository) -> None:
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(5)]
+
+        await sut.save_many(couriers)
+
+        result = [await sut.get_by_id(typing.cast("uuid.UUID", courier.id_)) for courier in couriers]
+        assert result == couriers
+        assert [r.storage_places for r in result if r] == [courier.storage_places for courier in couriers]
+
+    async def test_save_many_update_entities(self, sut: SqlAlchemyCourierRepository) -> None:
+        # Arrange
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(3)]
+        await sut.save_many(couriers)
+        for courier in couriers:
+            courier.move(ORDER_LOCATION)
+            courier.add_storage_place("Car", create_volume(20))
+
+        # Act
+        await sut.save_many(couriers)
+
+        # Assert
+        for courier in couriers:
+            result = await sut.get_by_id(typing.cast("uuid.UUID", courier.id_))
+            assert result is not None
+            assert result.location == courier.location
+            assert sorted(result.storage_places, key=lambda sp: sp.total_volume.value) == courier.storage_places
+
+    async def test_save_many_empty(self, sut: SqlAlchemyCourierRepository) -> None:
+        await sut.save_many([])
+
+        assert await sut.get_free_couriers() == []
+
+    async def test_save_loaded_courier_updates_only_changed_columns(
+        self,
+        sut: SqlAlchemyCourierRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await sut.save(courier)
+        loaded = await sut.get_by_id(typing.cast("uuid.UUID", courier.id_))
+        assert loaded is not None
+        loaded.move(ORDER_LOCATION)
+
+        # Act
+        with capture_statements(async_session) as statements:
+            await sut.save(loaded)
+
+        # Assert
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE courier SET location_x=")
+        assert "storage_place" not in statements[0]
+        result = await sut.get_by_id(typing.cast("uuid.UUID", courier.id_))
+        assert result is not None
+        assert result.location == loaded.location
+
+    async def test_save_many_does_not_overwrite_columns_changed_only_in_other_couriers(
+        self,
+        sut: SqlAlchemyCourierRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        await SqlAlchemyOrderRepository(async_session).save(order)
+        moving, dispatched = (create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(2))
+        await sut.save_many([moving, dispatched])
+        # Другой обработчик уже сдвинул курьера, которому здесь назначается заказ.
+        await async_session.execute(
+            update(CourierModel).where(CourierModel.id_ == dispatched.id_).values(location_x=9, location_y=9),
+        )
+        moving.move(ORDER_LOCATION)
+        dispatched.take_order(order)
+
+        # Act
+        await sut.save_many([moving, dispatched])
+
+        # Assert
+        location = (
+            await async_session.execute(
+                select(CourierModel.location_x, CourierModel.location_y).where(CourierModel.id_ == dispatched.id_),
+            )
+        ).one()
+        assert tuple(location) == (9, 9)
+        result = await sut.get_by_id(typing.cast("uuid.UUID", moving.id_))
+        assert result is not None
+        assert result.location == moving.location
+
+    async def test_save_untouched_courier_writes_nothing(
+        self,
+        sut: SqlAlchemyCourierRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await sut.save(courier)
+
+        with capture_statements(async_session) as statements:
+            await sut.save(courier)
+
+        assert statements == []
+
+    async def test_get_by_id_returns_tracked_instance(self, async_session: AsyncSession) -> None:
+        # Arrange
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await SqlAlchemyCourierRepository(async_session).save(courier)
+        sut = SqlAlchemyCourierRepository(async_session, IdentityMap())
+        loaded = await sut.get_by_id(typing.cast("uuid.UUID", courier.id_))
+        assert loaded is not None
+        loaded.move(ORDER_LOCATION)
+
+        # Act
+        with capture_statements(async_session) as statements:
+            result = await sut.get_by_id(typing.cast("uuid.UUID", courier.id_))
+
+        # Assert
+        assert result is loaded
+        assert result.location == loaded.location
+        assert statements == []
+
+    async def test_get_free_couriers_returns_tracked_instances(self, async_session: AsyncSession) -> None:
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        sut = SqlAlchemyCourierRepository(async_session, IdentityMap())
+        await sut.save(courier)
+
+        result = await sut.get_free_couriers()
+
+        assert len(result) == 1
+        assert result[0] is courier
+
+    async def test_save_keeps_free_capacity_in_sync(
+        self,
+        sut: SqlAlchemyCourierRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        await SqlAlchemyOrderRepository(async_session).save(order)
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await sut.save(courier)
+
+        # Act
+        courier.take_order(order)
+        await sut.save(courier)
+
+        # Assert
+        free_capacity = await async_session.scalar(
+            select(CourierModel.free_capacity).where(CourierModel.id_ == courier.id_),
+        )
+        assert free_capacity == courier.free_capacity == 0
+
+    async def test_get_couriers_able_to_take(
+        self,
+        sut: SqlAlchemyCourierRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        target = create_location(5, 5)
+        far = create_courier(COURIER_NAME, create_speed(1), create_location(1, 1))
+        near = create_courier(COURIER_NAME, create_speed(1), create_location(4, 5))
+        fast = create_courier(COURIER_NAME, create_speed(3), create_location(10, 10))
+        small = create_courier(COURIER_NAME, create_speed(3), create_location(5, 5))
+        busy = create_courier(COURIER_NAME, create_speed(3), create_location(5, 5))
+        busy.add_storage_place("car", create_volume(20))
+        order = create_order(BASKET_ID, ORDER_LOCATION, create_volume(20))
+        await SqlAlchemyOrderRepository(async_session).save(order)
+        busy.take_order(order)
+        for courier in (far, near, fast):
+            courier.add_storage_place("car", create_volume(20))
+        await sut.save_many([far, near, fast, small, busy])
+
+        # Act
+        result = await sut.get_couriers_able_to_take(create_volume(15), target, limit=2)
+
+        # Assert
+        assert result == [near, fast]
+        assert await sut.get_couriers_able_to_take(create_volume(15), target, limit=10) == [near, fast, far]
+
+    async def test_get_couriers_able_to_take_many(self, sut: SqlAlchemyCourierRepository) -> None:
+        # Arrange
+        west, east = create_location(1, 5), create_location(10, 5)
+        west_near = create_courier(COURIER_NAME, create_speed(1), create_location(2, 5))
+        west_far = create_courier(COURIER_NAME, create_speed(1), create_location(4, 5))
+        east_near = create_courier(COURIER_NAME, create_speed(1), create_location(9, 5))
+        east_far = create_courier(COURIER_NAME, create_speed(1), create_location(6, 5))
+        big = create_courier(COURIER_NAME, create_speed(1), create_location(8, 5))
+        big.add_storage_place("car", create_volume(20))
+        await sut.save_many([west_near, west_far, east_near, east_far, big])
+
+        # Act
+        result = await sut.get_couriers_able_to_take_many(
+            [(create_volume(5), west, 1), (create_volume(5), east, 2), (create_volume(15), east, 1)],
+        )
+
+        # Assert
+        assert sorted(result) == sorted([west_near, east_near, big])
+        assert await sut.get_couriers_able_to_take_many([]) == []
+
+    async def test_get_couriers_able_to_take_many_skips_locked_couriers(self, async_session: AsyncSession) -> None:
+        # Arrange
+        engine = typing.cast("AsyncEngine", async_session.bind)
+        locked, free = (create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(2))
+        ids = [typing.cast("uuid.UUID", courier.id_) for courier in (locked, free)]
+        async with AsyncSession(engine) as session:
+            await SqlAlchemyCourierRepository(session).save_many([locked, free])
+            await session.commit()
+
+        try:
+            async with AsyncSession(engine) as first, AsyncSession(engine) as second:
+                await SqlAlchemyCourierRepository(first).claim_by_ids(ids[:1])
+
+                # Act
+                result = await SqlAlchemyCourierRepository(second).get_couriers_able_to_take_many(
+                    [(create_volume(1), COURIER_LOCATION, 2)],
+                )
+
+                # Assert
+                assert result == [free]
+        finally:
+            async with AsyncSession(engine) as session:
+                await session.execute(delete(StoragePlaceModel).where(StoragePlaceModel.courier_id.in_(ids)))
+                await session.execute(delete(CourierModel).where(CourierModel.id_.in_(ids)))
+                await session.commit()
+
+    async def test_get_by_ids(self, sut: SqlAlchemyCourierRepository) -> None:
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(3)]
+        await sut.save_many(couriers)
+        ids = [typing.cast("uuid.UUID", courier.id_) for courier in couriers[:2]]
+
+        result = await sut.get_by_ids([*ids, uuid.uuid4(), ids[0]])
+
+        assert sorted(result) == sorted(couriers[:2])
+
+    async def test_claim_by_ids_skips_locked_couriers(self, async_session: AsyncSession) -> None:
+        # Arrange
+        engine = typing.cast("AsyncEngine", async_session.bind)
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(3)]
+        ids = [typing.cast("uuid.UUID", courier.id_) for courier in couriers]
+        async with AsyncSession(engine) as session:
+            await SqlAlchemyCourierRepository(session).save_many(couriers)
+            await session.commit()
+
+        try:
+            async with AsyncSession(engine) as first, AsyncSession(engine) as second:
+                # Act
+                first_claimed = await SqlAlchemyCourierRepository(first).claim_by_ids(ids[:2])
+                second_claimed = await SqlAlchemyCourierRepository(second).claim_by_ids([*ids, uuid.uuid4()])
+
+                # Assert
+                assert sorted(first_claimed) == sorted(couriers[:2])
+                assert second_claimed == [couriers[2]]
+        finally:
+            async with AsyncSession(engine) as session:
+                await session.execute(delete(StoragePlaceModel).where(StoragePlaceModel.courier_id.in_(ids)))
+                await session.execute(delete(CourierModel).where(CourierModel.id_.in_(ids)))
+                await session.commit()
+
+    async def test_get_by_ids_returns_tracked_instances_without_query(self, async_session: AsyncSession) -> None:
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        sut = SqlAlchemyCourierRepository(async_session, IdentityMap())
+        await sut.save(courier)
+
+        with capture_statements(async_session) as statements:
+            result = await sut.get_by_ids([typing.cast("uuid.UUID", courier.id_)])
+
+        assert result == [courier]
+        assert result[0] is courier
+        assert statements == []
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+from microarch.delivery.adapters.out.postgres.engine import InstrumentedAsyncQueuePool, create_engine, get_pool_metrics
+from microarch.delivery.application_properties import DBProperties
+from sqlalchemy import exc, text
+from testcontainers.postgres import PostgresContainer
+
+
+class TestCreateEngine:
+    async def test_pool_settings_from_properties(self, postgres_container: PostgresContainer) -> None:
+        properties = DBProperties(dsn=postgres_container.get_connection_url(), pool_size=3, max_overflow=2)
+
+        engine = create_engine(properties)
+
+        assert isinstance(engine.pool, InstrumentedAsyncQueuePool)
+        assert engine.pool.size() == 3
+        await engine.dispose()
+
+    async def test_pool_metrics_track_checkouts(self, postgres_container: PostgresContainer) -> None:
+        engine = create_engine(DBProperties(dsn=postgres_container.get_connection_url()))
+        metrics = get_pool_metrics(engine)
+        assert metrics is not None
+
+        async with engine.connect() as conn:
+            await conn.execute(text("select 1"))
+            assert metrics.checked_out == 1
+
+        assert metrics.checked_out == 0
+        assert metrics.checkouts == 1
+        assert metrics.waits == 0
+        await engine.dispose()
+
+    async def test_pool_metrics_track_waits_and_timeouts(self, postgres_container: PostgresContainer) -> None:
+        # Arrange
+        properties = DBProperties(
+            dsn=postgres_container.get_connection_url(),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.1,
+        )
+        engine = create_engine(properties)
+        metrics = get_pool_metrics(engine)
+        assert metrics is not None
+
+        # Act
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                await asyncio.wait_for(engine.connect().start(), timeout=5)
+
+        # Assert
+        assert metrics.waits == 1
+        assert metrics.timeouts == 1
+        assert metrics.wait_time >= properties.pool_timeout
+        assert metrics.checked_out == 0
+        await engine.dispose()
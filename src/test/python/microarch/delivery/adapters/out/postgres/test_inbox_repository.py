@@ -0,0 +1,44 @@
+import uuid
+
+import pytest
+from microarch.delivery.adapters.out.postgres.inbox_repository import SqlAlchemyInboxRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from python.helpers import capture_statements
+
+
+@pytest.fixture
+def sut(async_session: AsyncSession) -> SqlAlchemyInboxRepository:
+    return SqlAlchemyInboxRepository(async_session)
+
+
+class TestSqlAlchemyInboxRepository:
+    async def test_add_new_returns_only_unseen_messages(
+        self,
+        sut: SqlAlchemyInboxRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        seen = [uuid.uuid4(), uuid.uuid4()]
+        unseen = uuid.uuid4()
+        assert await sut.add_new(seen) == set(seen)
+
+        with capture_statements(async_session) as statements:
+            result = await sut.add_new([*seen, unseen])
+
+        assert result == {unseen}
+        assert len(statements) == 1
+
+    async def test_add_new_empty(self, sut: SqlAlchemyInboxRepository) -> None:
+        assert await sut.add_new([]) == set()
+
+    async def test_get_processed_does_not_add_messages(self, sut: SqlAlchemyInboxRepository) -> None:
+        seen, unseen = uuid.uuid4(), uuid.uuid4()
+        await sut.add_new([seen])
+
+        result = await sut.get_processed([seen, unseen])
+
+        assert result == {seen}
+        assert await sut.add_new([unseen]) == {unseen}
+
+    async def test_get_processed_empty(self, sut: SqlAlchemyInboxRepository) -> None:
+        assert await sut.get_processed([]) == set()
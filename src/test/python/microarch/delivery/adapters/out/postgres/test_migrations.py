@@ -0,0 +1,117 @@
+import typing
+import uuid
+
+import pytest
+from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
+from microarch.delivery.adapters.out.postgres.migrations import MIGRATIONS, migrate
+from microarch.delivery.adapters.out.postgres.models import BaseModel, StoragePlaceModel
+from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
+from microarch.delivery.adapters.out.postgres.outbox_repository import SqlAlchemyOutboxRepository
+from sqlalchemy import Connection, Select, inspect, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from python.helpers import create_location, create_volume
+
+# Данные с распределением, как в час пик: 95% курьеров заняты, большая часть заказов и событий outbox
+# уже обработана. Статистика собирается ANALYZE, поэтому планировщик выбирает индексы сам, без подсказок.
+PEAK_LOAD_DATA: typing.Final = (
+    """
+    INSERT INTO courier (id, name, speed, location_x, location_y, free_capacity)
+    SELECT md5('courier' || i)::uuid, 'courier', 1 + i % 3, 1 + i % 10, 1 + i / 10 % 10,
+           CASE WHEN i % 20 = 0 THEN 10 ELSE 0 END
+    FROM generate_series(1, 2000) i
+    """,
+    """
+    INSERT INTO "order" (id, status, volume, location_x, location_y, courier_id)
+    SELECT md5('order' || i)::uuid,
+           CASE
+               WHEN i <= 2000 AND i % 20 <> 0 THEN 'ASSIGNED'
+               WHEN i > 9950 THEN 'CREATED'
+               ELSE 'COMPLETED'
+           END::orderstatusenum,
+           5, 1 + i % 10, 1 + i / 10 % 10, CASE WHEN i <= 2000 THEN md5('courier' || i)::uuid END
+    FROM generate_series(1, 10000) i
+    """,
+    """
+    INSERT INTO storage_place (id, name, volume, order_id, courier_id)
+    SELECT md5('storage_place' || i)::uuid, 'bag', 10,
+           CASE WHEN i % 20 <> 0 THEN md5('order' || i)::uuid END, md5('courier' || i)::uuid
+    FROM generate_series(1, 2000) i
+    """,
+    """
+    INSERT INTO outbox (id, type, payload, occurred_at, processed_at)
+    SELECT md5('event' || i)::uuid, 'OrderCompleted', '{}', now(), CASE WHEN i <= 4990 THEN now() END
+    FROM generate_series(1, 5000) i
+    """,
+    'ANALYZE courier, "order", storage_place, outbox',
+)
+
+
+async def explain(async_session: AsyncSession, query: Select[typing.Any]) -> str:
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    rows = await async_session.execute(text(f"EXPLAIN {sql}"))
+    return "\n".join(row[0] for row in rows)
+
+
+def get_schema(connection: Connection) -> dict[str, tuple[set[str], set[str]]]:
+    inspector = inspect(connection)
+    return {
+        table: (
+            {column["name"] for column in inspector.get_columns(table)},
+            {index["name"] for index in inspector.get_indexes(table) if index["name"]},
+        )
+        for table in BaseModel.metadata.tables
+    }
+
+
+class TestMigrations:
+    async def test_migrated_schema_matches_models(self, async_session: AsyncSession) -> None:
+        connection = await async_session.connection()
+
+        schema = await connection.run_sync(get_schema)
+
+        for name, table in BaseModel.metadata.tables.items():
+            columns, indexes = schema[name]
+            assert columns == {column.name for column in table.columns}
+            assert indexes == {typing.cast("str", index.name) for index in table.indexes}
+
+    async def test_migrate_is_idempotent(self, async_session: AsyncSession) -> None:
+        connection = await async_session.connection()
+
+        assert await connection.run_sync(migrate) == []
+
+        versions = await async_session.scalars(text("SELECT version FROM schema_version ORDER BY version"))
+        assert list(versions) == [migration.version for migration in MIGRATIONS]
+
+    @pytest.mark.parametrize(
+        ("query", "index"),
+        [
+            (SqlAlchemyCourierRepository._free_couriers_query(), "ix_courier_free_capacity"),
+            (
+                select(StoragePlaceModel.id_).where(
+                    StoragePlaceModel.courier_id == uuid.uuid4(),
+                    StoragePlaceModel.order_id.isnot(None),
+                ),
+                "ix_storage_place_occupied_courier_id",
+            ),
+            (
+                select(StoragePlaceModel).where(StoragePlaceModel.courier_id.in_([uuid.uuid4()])),
+                "ix_storage_place_courier_id",
+            ),
+            (SqlAlchemyOrderRepository._assigned_orders_query(), "ix_order_status"),
+            (SqlAlchemyOrderRepository._claim_created_orders_query(10), "ix_order_created_queue"),
+            (
+                SqlAlchemyCourierRepository._able_to_take_query(create_volume(20), create_location(1, 1), 5),
+                "ix_courier_free_capacity",
+            ),
+            (SqlAlchemyOutboxRepository._claim_unprocessed_query(100), "ix_outbox_unprocessed"),
+        ],
+    )
+    async def test_query_uses_index(self, async_session: AsyncSession, query: Select[typing.Any], index: str) -> None:
+        for statement in PEAK_LOAD_DATA:
+            await async_session.execute(text(statement))
+
+        plan = await explain(async_session, query)
+
+        assert index in plan
@@ -2,15 +2,17 @@ import typing
 import uuid
 
 import pytest
+from libs.ddd.identity_map import IdentityMap
 from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
 from microarch.delivery.adapters.out.postgres.models import OrderModel
 from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
 from microarch.delivery.core.domain.model.order.enums import OrderStatusEnum
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from microarch.delivery.core.domain.model.order.order import Order
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from python.constants import BASKET_ID, COURIER_LOCATION, COURIER_NAME, COURIER_SPEED, ORDER_LOCATION, ORDER_VOLUME
-from python.helpers import create_courier, create_order
+from python.helpers import capture_statements, create_courier, create_order
 
 
 @pytest.fixture
@@ -89,3 +91,170 @@ class TestSqlalchemyOrderRepository:
 
         # Assert
         assert result == [order]
+
+    async def test_iter_assigned_orders(self, sut: SqlAlchemyOrderRepository, async_session: AsyncSession) -> None:
+        # Arrange
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await SqlAlchemyCourierRepository(async_session).save(courier)
+
+        created_order = create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME)
+        await sut.save(created_order)
+        assigned_orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(5)]
+        for order in assigned_orders:
+            order.assign(courier)
+            await sut.save(order)
+
+        # Act
+        result = [order async for order in sut.iter_assigned_orders(batch_size=2)]
+
+        # Assert
+        assert sorted(result) == sorted(assigned_orders)
+
+    async def test_save_many_new_entities(self, sut: SqlAlchemyOrderRepository) -> None:
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(5)]
+
+        await sut.save_many(orders)
+
+        result = [await sut.get_by_id(typing.cast("uuid.UUID", order.id_)) for order in orders]
+        assert result == orders
+
+    async def test_add_many_if_absent_keeps_existing_orders(
+        self,
+        sut: SqlAlchemyOrderRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await SqlAlchemyCourierRepository(async_session).save(courier)
+        existing = create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME)
+        existing.assign(courier)
+        await sut.save(existing)
+        replayed = create_order(typing.cast("uuid.UUID", existing.id_), ORDER_LOCATION, ORDER_VOLUME)
+        new = create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME)
+
+        # Act
+        result = await sut.add_many_if_absent([replayed, new])
+
+        # Assert
+        assert result == [new]
+        assert not new.is_new
+        stored = await sut.get_by_id(typing.cast("uuid.UUID", existing.id_))
+        assert stored is not None
+        assert stored.status == OrderStatusEnum.ASSIGNED
+        assert await sut.get_by_id(typing.cast("uuid.UUID", new.id_)) == new
+
+    async def test_save_many_update_entities(self, sut: SqlAlchemyOrderRepository, async_session: AsyncSession) -> None:
+        # Arrange
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(3)]
+        await sut.save_many(orders)
+
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await SqlAlchemyCourierRepository(async_session).save(courier)
+        for order in orders:
+            order.assign(courier)
+
+        # Act
+        await sut.save_many(orders)
+
+        # Assert
+        assert sorted(await sut.get_assigned_orders()) == sorted(orders)
+        assert all(order.courier_id == courier.id_ for order in await sut.get_assigned_orders())
+
+    async def test_save_loaded_order_updates_only_changed_columns(
+        self,
+        sut: SqlAlchemyOrderRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await SqlAlchemyCourierRepository(async_session).save(courier)
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        await sut.save(order)
+        loaded = await sut.get_by_id(typing.cast("uuid.UUID", order.id_))
+        assert loaded is not None
+        loaded.assign(courier)
+
+        # Act
+        with capture_statements(async_session) as statements:
+            await sut.save(loaded)
+
+        # Assert
+        assert len(statements) == 1
+        assert statements[0].startswith('UPDATE "order" SET status=')
+        assert "location_x" not in statements[0]
+        assert await sut.get_by_id(typing.cast("uuid.UUID", order.id_)) == loaded
+
+    async def test_get_by_id_returns_tracked_instance(self, async_session: AsyncSession) -> None:
+        # Arrange
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        await SqlAlchemyOrderRepository(async_session).save(order)
+        sut = SqlAlchemyOrderRepository(async_session, IdentityMap())
+        loaded = await sut.get_by_id(typing.cast("uuid.UUID", order.id_))
+
+        # Act
+        with capture_statements(async_session) as statements:
+            result = await sut.get_by_id(typing.cast("uuid.UUID", order.id_))
+
+        # Assert
+        assert result is loaded
+        assert statements == []
+        assert await sut.get_created_order() is loaded
+
+    async def test_iter_assigned_orders_does_not_track_streamed_orders(self, async_session: AsyncSession) -> None:
+        # Arrange
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        await SqlAlchemyCourierRepository(async_session).save(courier)
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(3)]
+        for order in orders:
+            order.assign(courier)
+        await SqlAlchemyOrderRepository(async_session).save_many(orders)
+        identity_map = IdentityMap[uuid.UUID, Order]()
+        sut = SqlAlchemyOrderRepository(async_session, identity_map)
+        loaded = await sut.get_by_id(typing.cast("uuid.UUID", orders[0].id_))
+
+        # Act
+        result = [order async for order in sut.iter_assigned_orders(batch_size=2)]
+
+        # Assert
+        assert sorted(result) == sorted(orders)
+        assert any(order is loaded for order in result)
+        assert len(identity_map) == 1
+
+    async def test_claim_created_orders_in_creation_order(self, sut: SqlAlchemyOrderRepository) -> None:
+        # Arrange
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(3)]
+        for order in orders:
+            await sut.save(order)
+            # В одной транзакции now() одинаков, поэтому время создания разводится явно.
+            await sut._async_session.execute(
+                update(OrderModel).where(OrderModel.id_ == order.id_).values(created_at=func.clock_timestamp()),
+            )
+
+        # Act
+        result = await sut.claim_created_orders(limit=2)
+
+        # Assert
+        assert result == orders[:2]
+
+    async def test_concurrent_claims_skip_locked_orders(self, async_session: AsyncSession) -> None:
+        # Arrange
+        engine = typing.cast("AsyncEngine", async_session.bind)
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(3)]
+        async with AsyncSession(engine) as session:
+            await SqlAlchemyOrderRepository(session).save_many(orders)
+            await session.commit()
+
+        try:
+            async with AsyncSession(engine) as first, AsyncSession(engine) as second:
+                # Act
+                first_claimed = await SqlAlchemyOrderRepository(first).claim_created_orders(limit=2)
+                second_claimed = await SqlAlchemyOrderRepository(second).claim_created_orders(limit=2)
+
+                # Assert
+                assert len(first_claimed) == 2
+                assert len(second_claimed) == 1
+                assert sorted(first_claimed + second_claimed) == sorted(orders)
+        finally:
+            async with AsyncSession(engine) as session:
+                await session.execute(delete(OrderModel).where(OrderModel.id_.in_([order.id_ for order in orders])))
+                await session.commit()
@@ -0,0 +1,77 @@
+import typing
+import uuid
+
+import pytest
+from microarch.delivery.adapters.out.postgres.outbox_repository import SqlAlchemyOutboxRepository
+from microarch.delivery.core.domain.model.order import OrderAssignedDomainEvent, OrderCompletedDomainEvent
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+
+@pytest.fixture
+def sut(async_session: AsyncSession) -> SqlAlchemyOutboxRepository:
+    return SqlAlchemyOutboxRepository(async_session)
+
+
+def create_events(count: int) -> list[OrderCompletedDomainEvent]:
+    return [OrderCompletedDomainEvent(uuid.uuid4(), uuid.uuid4()) for _ in range(count)]
+
+
+class TestSqlAlchemyOutboxRepository:
+    async def test_claim_unprocessed_restores_events(self, sut: SqlAlchemyOutboxRepository) -> None:
+        events: list[OrderAssignedDomainEvent | OrderCompletedDomainEvent] = [
+            OrderAssignedDomainEvent(uuid.uuid4(), uuid.uuid4()),
+            *create_events(2),
+        ]
+        await sut.add_many(events)
+
+        result = await sut.claim_unprocessed(10)
+
+        assert [event.event_id for event in result] == [event.event_id for event in events]
+        for claimed, event in zip(result, events, strict=True):
+            assert type(claimed) is type(event)
+            assert isinstance(claimed, OrderAssignedDomainEvent | OrderCompletedDomainEvent)
+            assert claimed.order_id == event.order_id
+            assert claimed.courier_id == event.courier_id
+            assert claimed.occurred_on_utc == event.occurred_on_utc
+
+    async def test_claim_unprocessed_respects_limit(self, sut: SqlAlchemyOutboxRepository) -> None:
+        events = create_events(3)
+        await sut.add_many(events)
+
+        result = await sut.claim_unprocessed(2)
+
+        assert [event.event_id for event in result] == [event.event_id for event in events[:2]]
+
+    async def test_processed_events_are_not_claimed(self, sut: SqlAlchemyOutboxRepository) -> None:
+        events = create_events(3)
+        await sut.add_many(events)
+
+        await sut.mark_processed([events[0].event_id, events[2].event_id])
+
+        result = await sut.claim_unprocessed(10)
+        assert [event.event_id for event in result] == [events[1].event_id]
+
+    async def test_claim_unprocessed_skips_locked_events(
+        self,
+        sut: SqlAlchemyOutboxRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        events = create_events(3)
+        await sut.add_many(events)
+        await async_session.commit()
+
+        try:
+            async with AsyncSession(typing.cast("AsyncEngine", async_session.bind)) as other_session:
+                first = await sut.claim_unprocessed(2)
+
+                # Act
+                second = await SqlAlchemyOutboxRepository(other_session).claim_unprocessed(10)
+
+            # Assert
+            assert [event.event_id for event in first] == [event.event_id for event in events[:2]]
+            assert [event.event_id for event in second] == [events[2].event_id]
+        finally:
+            await async_session.rollback()
+            await sut.mark_processed([event.event_id for event in events])
+            await async_session.commit()
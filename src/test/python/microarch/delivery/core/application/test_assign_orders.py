@@ -0,0 +1,117 @@
+import asyncio
+import typing
+import uuid
+
+import pytest
+from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
+from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
+from microarch.delivery.core.application.assign_orders import AssignOrdersHandler
+from microarch.delivery.core.domain.model.order import OrderStatusEnum
+from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from python.constants import COURIER_LOCATION, COURIER_NAME, COURIER_SPEED, ORDER_LOCATION, ORDER_VOLUME
+from python.helpers import capture_statements, create_courier, create_order, create_volume
+
+
+@pytest.fixture
+def sut(session_factory: async_sessionmaker[AsyncSession]) -> AssignOrdersHandler:
+    return AssignOrdersHandler(DeliveryUnitOfWork(session_factory), OrderDispatcher(), candidates_per_order=2)
+
+
+class TestAssignOrdersHandler:
+    async def test_nothing_to_assign(self, sut: AssignOrdersHandler) -> None:
+        result = await sut.handle(limit=10)
+
+        assert result.claimed == 0
+        assert result.assigned == 0
+        assert result.lag is None
+
+    async def test_assign_claimed_orders(
+        self,
+        sut: AssignOrdersHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(3)]
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(2)]
+        too_small_order = create_order(uuid.uuid4(), ORDER_LOCATION, create_volume(50))
+        async with session_factory() as session:
+            await SqlAlchemyCourierRepository(session).save_many(couriers)
+            await SqlAlchemyOrderRepository(session).save_many([*orders, too_small_order])
+            await session.commit()
+
+        # Act
+        with capture_statements(async_session) as statements:
+            result = await sut.handle(limit=10)
+
+        # Assert
+        assert result.claimed == 4
+        assert result.assigned == 2
+        # Кандидаты для обоих сочетаний объема и адреса загружаются одним запросом.
+        assert sum(statement.startswith("SELECT courier.") for statement in statements) == 1
+        assert result.lag is not None
+        async with session_factory() as session:
+            repository = SqlAlchemyOrderRepository(session)
+            assigned = await repository.get_assigned_orders()
+            assert len(assigned) == 2
+            assert {order.courier_id for order in assigned} == {courier.id_ for courier in couriers}
+            free_couriers = await SqlAlchemyCourierRepository(session).get_free_couriers()
+            assert free_couriers == []
+            remaining = await repository.claim_created_orders(limit=10)
+            assert len(remaining) == 2
+            assert all(order.status == OrderStatusEnum.CREATED for order in remaining)
+
+    async def test_assign_all_orders_from_one_location(
+        self,
+        sut: AssignOrdersHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(5)]
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(5)]
+        async with session_factory() as session:
+            await SqlAlchemyCourierRepository(session).save_many(couriers)
+            await SqlAlchemyOrderRepository(session).save_many(orders)
+            await session.commit()
+
+        # Act
+        result = await sut.handle(limit=10)
+
+        # Assert
+        assert result.claimed == 5
+        assert result.assigned == 5
+        async with session_factory() as session:
+            assigned = await SqlAlchemyOrderRepository(session).get_assigned_orders()
+            assert {order.courier_id for order in assigned} == {courier.id_ for courier in couriers}
+
+    async def test_concurrent_handlers_do_not_share_courier(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(2)]
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        async with session_factory() as session:
+            await SqlAlchemyCourierRepository(session).save(courier)
+            await SqlAlchemyOrderRepository(session).save_many(orders)
+            await session.commit()
+        handlers = [
+            AssignOrdersHandler(DeliveryUnitOfWork(session_factory), OrderDispatcher(), candidates_per_order=2)
+            for _ in range(2)
+        ]
+
+        # Act
+        results = await asyncio.gather(*(handler.handle(limit=1) for handler in handlers))
+
+        # Assert
+        assert sum(result.claimed for result in results) == 2
+        assert sum(result.assigned for result in results) == 1
+        async with session_factory() as session:
+            [assigned] = await SqlAlchemyOrderRepository(session).get_assigned_orders()
+            loaded = await SqlAlchemyCourierRepository(session).get_by_id(typing.cast("uuid.UUID", courier.id_))
+            assert loaded is not None
+            assert assigned.courier_id == loaded.id_
+            assert [sp.order_id for sp in loaded.storage_places] == [assigned.id_]
@@ -0,0 +1,251 @@
+import asyncio
+import uuid
+
+import pytest
+from microarch.delivery.adapters.out.postgres.inbox_repository import SqlAlchemyInboxRepository
+from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
+from microarch.delivery.core.application.create_orders import CreateOrderCommand, CreateOrdersHandler
+from microarch.delivery.core.domain.model.kernel.location import Location
+from microarch.delivery.core.domain.model.order import OrderStatusEnum
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from python.helpers import capture_statements, create_courier, create_location, create_speed
+
+UNKNOWN_STREET = "Несуществующая"
+
+
+class FakeGeoClient:
+    def __init__(self, failures: dict[str, int] | None = None) -> None:
+        self.requests: list[str] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        # Сколько первых запросов по улице завершаются ошибкой.
+        self._failures = failures or {}
+
+    async def get_location(self, street: str) -> Location | None:
+        self.requests.append(street)
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(0)
+            if self._failures.get(street, 0) > 0:
+                self._failures[street] -= 1
+                raise ConnectionError(street)
+            if street == UNKNOWN_STREET:
+                return None
+            return create_location(1 + len(street) % 10, 1)
+        finally:
+            self._in_flight -= 1
+
+
+def create_command(basket_id: uuid.UUID | None = None, street: str = "Тверская", volume: int = 5) -> CreateOrderCommand:
+    return CreateOrderCommand(uuid.uuid4(), basket_id or uuid.uuid4(), street, volume)
+
+
+@pytest.fixture
+def geo_client() -> FakeGeoClient:
+    return FakeGeoClient()
+
+
+@pytest.fixture
+def sut(session_factory: async_sessionmaker[AsyncSession], geo_client: FakeGeoClient) -> CreateOrdersHandler:
+    return CreateOrdersHandler(DeliveryUnitOfWork(session_factory), geo_client)
+
+
+class TestCreateOrdersHandler:
+    async def test_create_orders_with_single_insert(
+        self,
+        sut: CreateOrdersHandler,
+        geo_client: FakeGeoClient,
+        session_factory: async_sessionmaker[AsyncSession],
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        commands = [create_command(street="Тверская"), create_command(street="Арбат"), create_command(street="Арбат")]
+
+        # Act
+        with capture_statements(async_session) as statements:
+            result = await sut.handle(commands)
+
+        # Assert
+        assert result.received == 3
+        assert result.created == 3
+        assert result.duplicates == 0
+        assert result.rejected == []
+        assert sorted(geo_client.requests) == ["Арбат", "Тверская"]
+        assert sum(statement.startswith('INSERT INTO "order"') for statement in statements) == 1
+        async with session_factory() as session:
+            repository = SqlAlchemyOrderRepository(session)
+            for command in commands:
+                order = await repository.get_by_id(command.basket_id)
+                assert order is not None
+                assert order.status == OrderStatusEnum.CREATED
+                assert order.volume.value == command.volume
+                assert order.location == create_location(1 + len(command.street) % 10, 1)
+
+    async def test_duplicate_baskets_in_batch_create_one_order(
+        self,
+        sut: CreateOrdersHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        basket_id = uuid.uuid4()
+        first, duplicate = create_command(basket_id, volume=5), create_command(basket_id, volume=7)
+
+        result = await sut.handle([first, duplicate])
+
+        assert result.received == 2
+        assert result.created == 1
+        assert result.duplicates == 1
+        async with session_factory() as session:
+            order = await SqlAlchemyOrderRepository(session).get_by_id(basket_id)
+            assert order is not None
+            assert order.volume.value == first.volume
+
+    async def test_invalid_commands_are_rejected(self, sut: CreateOrdersHandler) -> None:
+        invalid_volume = create_command(volume=0)
+        empty_basket_id = create_command(basket_id=uuid.UUID(int=0))
+
+        result = await sut.handle([invalid_volume, empty_basket_id, create_command()])
+
+        assert result.created == 1
+        assert [(command, error.code) for command, error in result.rejected] == [
+            (invalid_volume, "value.must.be.greater.or.equal"),
+            (empty_basket_id, "value.is.required"),
+        ]
+
+    async def test_replayed_batch_changes_nothing(
+        self,
+        sut: CreateOrdersHandler,
+        geo_client: FakeGeoClient,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        commands = [create_command(), create_command()]
+        await sut.handle(commands)
+        async with DeliveryUnitOfWork(session_factory) as uow:
+            courier = create_courier("courier", create_speed(1), create_location(1, 1))
+            await uow.couriers.save(courier)
+            order = await uow.orders.get_by_id(commands[0].basket_id)
+            assert order is not None
+            order.assign(courier)
+            await uow.commit()
+        geo_client.requests.clear()
+
+        # Act
+        result = await sut.handle(commands)
+
+        # Assert
+        assert result.created == 0
+        assert result.duplicates == 2
+        assert geo_client.requests == []
+        async with session_factory() as session:
+            order = await SqlAlchemyOrderRepository(session).get_by_id(commands[0].basket_id)
+            assert order is not None
+            assert order.status == OrderStatusEnum.ASSIGNED
+
+    async def test_message_processed_during_geo_lookup_is_duplicate(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        processed_elsewhere, command = create_command(street="Тверская"), create_command(street="Арбат")
+
+        class ConcurrentConsumerGeoClient(FakeGeoClient):
+            async def get_location(self, street: str) -> Location | None:
+                # Пока запрашиваются координаты, сообщение обрабатывает другой консьюмер. Транзакция обработчика
+                # еще не начата, поэтому запись в inbox ее не ждет.
+                if street == processed_elsewhere.street:
+                    async with session_factory() as session:
+                        await SqlAlchemyInboxRepository(session).add_new([processed_elsewhere.message_id])
+                        await session.commit()
+                return await super().get_location(street)
+
+        sut = CreateOrdersHandler(DeliveryUnitOfWork(session_factory), ConcurrentConsumerGeoClient())
+
+        # Act
+        async with asyncio.timeout(5):
+            result = await sut.handle([processed_elsewhere, command])
+
+        # Assert
+        assert result.created == 1
+        assert result.duplicates == 1
+        async with session_factory() as session:
+            repository = SqlAlchemyOrderRepository(session)
+            assert await repository.get_by_id(processed_elsewhere.basket_id) is None
+            assert await repository.get_by_id(command.basket_id) is not None
+
+    async def test_new_message_for_existing_order_does_not_overwrite_it(
+        self,
+        sut: CreateOrdersHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        basket_id = uuid.uuid4()
+        await sut.handle([create_command(basket_id, volume=5)])
+
+        result = await sut.handle([create_command(basket_id, volume=7)])
+
+        assert result.created == 0
+        assert result.duplicates == 1
+        async with session_factory() as session:
+            order = await SqlAlchemyOrderRepository(session).get_by_id(basket_id)
+            assert order is not None
+            assert order.volume.value == 5
+
+    async def test_geo_requests_are_limited(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        geo_client = FakeGeoClient()
+        sut = CreateOrdersHandler(DeliveryUnitOfWork(session_factory), geo_client, geo_concurrency=2)
+
+        result = await sut.handle([create_command(street=f"street {i}") for i in range(5)])
+
+        assert result.created == 5
+        assert len(geo_client.requests) == 5
+        assert geo_client.max_in_flight == 2
+
+    async def test_commands_with_unknown_street_are_rejected(
+        self,
+        sut: CreateOrdersHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        unknown = create_command(street=UNKNOWN_STREET)
+        commands = [unknown, create_command()]
+
+        # Act
+        result = await sut.handle(commands)
+
+        # Assert
+        assert result.created == 1
+        assert [(command, error.code) for command, error in result.rejected] == [(unknown, "street.is.unknown")]
+        async with session_factory() as session:
+            assert await SqlAlchemyOrderRepository(session).get_by_id(unknown.basket_id) is None
+            assert await SqlAlchemyInboxRepository(session).get_processed([unknown.message_id]) == {unknown.message_id}
+
+    async def test_failed_geo_lookup_is_retried(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        geo_client = FakeGeoClient(failures={"Тверская": 2})
+        sut = CreateOrdersHandler(DeliveryUnitOfWork(session_factory), geo_client, geo_attempts=3, geo_retry_delay=0)
+
+        result = await sut.handle([create_command()])
+
+        assert result.created == 1
+        assert geo_client.requests == ["Тверская"] * 3
+
+    async def test_geo_outage_fails_batch_without_marking_messages_processed(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        geo_client = FakeGeoClient(failures={"Арбат": 3})
+        sut = CreateOrdersHandler(DeliveryUnitOfWork(session_factory), geo_client, geo_attempts=3, geo_retry_delay=0)
+        commands = [create_command(street="Арбат"), create_command()]
+
+        # Act
+        with pytest.raises(ConnectionError, match="Арбат"):
+            await sut.handle(commands)
+
+        # Assert
+        assert geo_client.requests.count("Арбат") == 3
+        async with session_factory() as session:
+            assert await SqlAlchemyInboxRepository(session).get_processed([c.message_id for c in commands]) == set()
+        result = await sut.handle(commands)
+        assert result.created == 2
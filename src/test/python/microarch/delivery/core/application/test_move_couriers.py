@@ -0,0 +1,149 @@
+import asyncio
+import typing
+import uuid
+
+import pytest
+from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
+from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
+from microarch.delivery.core.application.move_couriers import MoveCouriersHandler
+from microarch.delivery.core.domain.model.order import OrderStatusEnum
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from python.helpers import (
+    capture_statements,
+    create_courier,
+    create_location,
+    create_order,
+    create_speed,
+    create_volume,
+)
+
+
+@pytest.fixture
+def sut(session_factory: async_sessionmaker[AsyncSession]) -> MoveCouriersHandler:
+    return MoveCouriersHandler(DeliveryUnitOfWork(session_factory))
+
+
+class TestMoveCouriersHandler:
+    async def test_nothing_to_move(self, sut: MoveCouriersHandler) -> None:
+        result = await sut.handle()
+
+        assert result.moved == 0
+        assert result.completed == 0
+
+    async def test_move_couriers_and_complete_delivered_orders(
+        self,
+        sut: MoveCouriersHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+        async_session: AsyncSession,
+    ) -> None:
+        # Arrange
+        far_courier = create_courier("far", create_speed(1), create_location(1, 1))
+        near_courier = create_courier("near", create_speed(2), create_location(4, 5))
+        far_order = create_order(uuid.uuid4(), create_location(5, 5), create_volume(5))
+        near_order = create_order(uuid.uuid4(), create_location(5, 5), create_volume(5))
+        async with session_factory() as session:
+            await SqlAlchemyCourierRepository(session).save_many([far_courier, near_courier])
+            for courier, order in ((far_courier, far_order), (near_courier, near_order)):
+                order.assign(courier)
+                courier.take_order(order)
+            await SqlAlchemyOrderRepository(session).save_many([far_order, near_order])
+            await SqlAlchemyCourierRepository(session).save_many([far_courier, near_courier])
+            await session.commit()
+
+        # Act
+        with capture_statements(async_session) as statements:
+            result = await sut.handle()
+
+        # Assert
+        assert result.moved == 2
+        assert result.completed == 1
+        # Один executemany на набор измененных колонок: только location у одного курьера, location и free_capacity
+        # у другого.
+        assert sum(statement.startswith("UPDATE courier") for statement in statements) == 2
+        async with session_factory() as session:
+            couriers = SqlAlchemyCourierRepository(session)
+            orders = SqlAlchemyOrderRepository(session)
+            moved_far = await couriers.get_by_id(typing.cast("uuid.UUID", far_courier.id_))
+            moved_near = await couriers.get_by_id(typing.cast("uuid.UUID", near_courier.id_))
+            assert moved_far is not None
+            assert moved_far.location == create_location(2, 1)
+            assert moved_near is not None
+            assert moved_near.location == create_location(5, 5)
+            assert moved_near.free_capacity == 10
+            assert await orders.get_assigned_orders() == [far_order]
+            delivered = await orders.get_by_id(typing.cast("uuid.UUID", near_order.id_))
+            assert delivered is not None
+            assert delivered.status == OrderStatusEnum.COMPLETED
+
+    async def test_courier_moves_to_earliest_order(
+        self,
+        sut: MoveCouriersHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        courier = create_courier("courier", create_speed(1), create_location(1, 1))
+        courier.add_storage_place("car", create_volume(20))
+        earliest = create_order(uuid.uuid4(), create_location(1, 5), create_volume(5))
+        latest = create_order(uuid.uuid4(), create_location(5, 1), create_volume(5))
+        for order in (earliest, latest):
+            async with session_factory() as session:
+                await SqlAlchemyOrderRepository(session).save(order)
+                await session.commit()
+        # Строка раннего заказа обновляется последней и в таблице оказывается после строки позднего.
+        async with session_factory() as session:
+            await SqlAlchemyCourierRepository(session).save(courier)
+            for order in (latest, earliest):
+                order.assign(courier)
+                courier.take_order(order)
+                await SqlAlchemyOrderRepository(session).save(order)
+            await SqlAlchemyCourierRepository(session).save(courier)
+            await session.commit()
+
+        # Act
+        await sut.handle()
+        await sut.handle()
+
+        # Assert
+        async with session_factory() as session:
+            moved = await SqlAlchemyCourierRepository(session).get_by_id(typing.cast("uuid.UUID", courier.id_))
+            assert moved is not None
+            assert moved.location == create_location(1, 3)
+
+    async def test_courier_locked_by_dispatcher_skips_tick(
+        self,
+        sut: MoveCouriersHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        couriers = [create_courier(name, create_speed(1), create_location(1, 1)) for name in ("locked", "free")]
+        locked_id = typing.cast("uuid.UUID", couriers[0].id_)
+        orders = [create_order(uuid.uuid4(), create_location(5, 1), create_volume(5)) for _ in couriers]
+        async with session_factory() as session:
+            await SqlAlchemyCourierRepository(session).save_many(couriers)
+            for courier, order in zip(couriers, orders, strict=True):
+                order.assign(courier)
+                courier.take_order(order)
+            await SqlAlchemyOrderRepository(session).save_many(orders)
+            await SqlAlchemyCourierRepository(session).save_many(couriers)
+            await session.commit()
+
+        async with session_factory() as dispatcher_session:
+            # Диспетчер захватывает курьера и еще не зафиксировал транзакцию.
+            await SqlAlchemyCourierRepository(dispatcher_session).claim_by_ids([locked_id])
+
+            # Act
+            async with asyncio.timeout(5):
+                result = await sut.handle()
+
+        # Assert
+        assert result.moved == 1
+        assert (await sut.handle()).moved == 2
+        async with session_factory() as session:
+            repository = SqlAlchemyCourierRepository(session)
+            locked, free = [await repository.get_by_id(typing.cast("uuid.UUID", courier.id_)) for courier in couriers]
+            assert locked is not None
+            assert locked.location == create_location(2, 1)
+            assert free is not None
+            assert free.location == create_location(3, 1)
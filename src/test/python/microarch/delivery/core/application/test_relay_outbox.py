@@ -0,0 +1,114 @@
+import typing
+import uuid
+
+import pytest
+from libs.ddd.domain_event import DomainEvent
+from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
+from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
+from microarch.delivery.adapters.out.postgres.outbox_repository import SqlAlchemyOutboxRepository
+from microarch.delivery.core.application.assign_orders import AssignOrdersHandler
+from microarch.delivery.core.application.relay_outbox import RelayOutboxHandler
+from microarch.delivery.core.domain.model.order import OrderAssignedDomainEvent, OrderCompletedDomainEvent
+from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+
+class InMemoryMessageBusProducer:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.events: list[DomainEvent] = []
+        self._error = error
+
+    async def publish(self, events: typing.Sequence[DomainEvent]) -> None:
+        if self._error is not None:
+            raise self._error
+        self.events.extend(events)
+
+
+async def complete_order(session_factory: async_sessionmaker[AsyncSession]) -> uuid.UUID:
+    # Завершает заказ через единицу работы, событие о завершении попадает в outbox.
+    courier = create_courier("courier", create_speed(1), create_location(1, 1))
+    order = create_order(uuid.uuid4(), create_location(1, 1), create_volume(5))
+    async with session_factory() as session:
+        await SqlAlchemyCourierRepository(session).save(courier)
+        order.assign(courier)
+        courier.take_order(order)
+        await SqlAlchemyOrderRepository(session).save(order)
+        await SqlAlchemyCourierRepository(session).save(courier)
+        await session.commit()
+
+    async with DeliveryUnitOfWork(session_factory) as uow:
+        loaded = await uow.orders.get_by_id(typing.cast("uuid.UUID", order.id_))
+        assert loaded is not None
+        loaded.complete()
+        await uow.commit()
+
+    return typing.cast("uuid.UUID", order.id_)
+
+
+class TestRelayOutboxHandler:
+    async def test_nothing_to_publish(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        producer = InMemoryMessageBusProducer()
+        sut = RelayOutboxHandler(DeliveryUnitOfWork(session_factory), producer)
+
+        result = await sut.handle(10)
+
+        assert result.published == 0
+        assert producer.events == []
+
+    async def test_publish_events_committed_by_unit_of_work(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        order_id = await complete_order(session_factory)
+        producer = InMemoryMessageBusProducer()
+        sut = RelayOutboxHandler(DeliveryUnitOfWork(session_factory), producer)
+
+        # Act
+        result = await sut.handle(10)
+
+        # Assert
+        assert result.published == 1
+        assert result.max_latency.total_seconds() > 0
+        [event] = producer.events
+        assert isinstance(event, OrderCompletedDomainEvent)
+        assert event.order_id == order_id
+        assert (await sut.handle(10)).published == 0
+
+    async def test_publish_events_of_handler_once(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        # Arrange
+        courier = create_courier("courier", create_speed(1), create_location(1, 1))
+        order = create_order(uuid.uuid4(), create_location(1, 1), create_volume(5))
+        async with session_factory() as session:
+            await SqlAlchemyCourierRepository(session).save(courier)
+            await SqlAlchemyOrderRepository(session).save(order)
+            await session.commit()
+        await AssignOrdersHandler(DeliveryUnitOfWork(session_factory), OrderDispatcher()).handle(limit=10)
+        producer = InMemoryMessageBusProducer()
+        sut = RelayOutboxHandler(DeliveryUnitOfWork(session_factory), producer)
+
+        # Act
+        await sut.handle(10)
+        await sut.handle(10)
+
+        # Assert
+        [event] = producer.events
+        assert isinstance(event, OrderAssignedDomainEvent)
+        assert event.order_id == order.id_
+        assert event.courier_id == courier.id_
+
+    async def test_failed_publish_leaves_events_in_outbox(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        await complete_order(session_factory)
+        sut = RelayOutboxHandler(DeliveryUnitOfWork(session_factory), InMemoryMessageBusProducer(RuntimeError("down")))
+
+        with pytest.raises(RuntimeError, match="down"):
+            await sut.handle(10)
+
+        async with session_factory() as session:
+            assert len(await SqlAlchemyOutboxRepository(session).claim_unprocessed(10)) == 1
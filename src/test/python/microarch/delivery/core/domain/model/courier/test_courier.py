@@ -1,7 +1,7 @@
 import uuid
 
 import pytest
-from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.courier import Courier, StoragePlace
 from microarch.delivery.core.domain.model.kernel.location import Location
 from microarch.delivery.core.domain.model.kernel.speed import Speed
 from microarch.delivery.core.domain.model.order.order import Order
@@ -103,14 +103,21 @@ class TestCourier:
         assert result.is_failure
         assert result.error.code == "record.not.found"
 
-    @pytest.mark.parametrize(("speed", "expected"), [(1, 8), (2, 4), (4, 2)])
-    def test_calculate_time_to_location(self, speed: int, expected: int) -> None:
+    @pytest.mark.parametrize(("speed", "expected"), [(1, 8), (2, 4), (4, 2), (16, 0.5)])
+    def test_calculate_time_to_location(self, speed: int, expected: float) -> None:
         courier = Courier.create(name=COURIER_NAME, speed=Speed.create(speed).value, location=COURIER_LOCATION).value
 
         result = courier.calculate_time_to_location(ORDER_LOCATION)
 
         assert result == expected
 
+    def test_calculate_time_to_location_outside_grid(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=Speed.create(2).value, location=Location.of(1, 1)).value
+
+        result = courier.calculate_time_to_location(Location.of(15, 15))
+
+        assert result == 14
+
     def test_move(self) -> None:
         courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
 
@@ -118,3 +125,86 @@ class TestCourier:
 
         assert result.is_success
         assert courier.location == Location.create(3, 1).value
+
+    def test_courier_and_storage_places_have_no_instance_dict(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
+
+        assert not hasattr(courier, "__dict__")
+        assert not hasattr(courier.storage_places[0], "__dict__")
+
+    def test_new_courier_has_all_fields_changed(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
+
+        assert courier.is_new
+        assert courier.get_changes() == {
+            "name": COURIER_NAME,
+            "speed": COURIER_SPEED,
+            "location": COURIER_LOCATION,
+            "free_capacity": 10,
+        }
+
+    def test_clean_courier_has_no_changes(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
+
+        courier.mark_clean()
+
+        assert not courier.is_new
+        assert courier.get_changes() == {}
+
+    def test_restored_courier_has_no_changes(self) -> None:
+        storage_place = StoragePlace.restore(STORAGE_PLACE_UUID, "bag", create_volume(10), None)
+
+        courier = Courier.restore(uuid.uuid4(), COURIER_NAME, COURIER_SPEED, COURIER_LOCATION, [storage_place], 10)
+
+        assert not courier.is_new
+        assert not storage_place.is_new
+        assert courier.get_changes() == {}
+        assert storage_place.get_changes() == {}
+
+    def test_restored_courier_with_stale_free_capacity_has_changes(self) -> None:
+        storage_place = StoragePlace.restore(STORAGE_PLACE_UUID, "bag", create_volume(10), None)
+
+        courier = Courier.restore(uuid.uuid4(), COURIER_NAME, COURIER_SPEED, COURIER_LOCATION, [storage_place], 0)
+
+        assert courier.get_changes() == {"free_capacity": 10}
+
+    def test_move_changes_only_location(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
+        courier.mark_clean()
+
+        courier.move(ORDER_LOCATION)
+
+        assert courier.get_changes() == {"location": courier.location}
+
+    def test_free_capacity_is_largest_free_storage_place(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
+        courier.add_storage_place("car", create_volume(20))
+
+        courier.take_order(Order.create(uuid.uuid4(), ORDER_LOCATION, create_volume(15)).value)
+
+        assert courier.free_capacity == 10
+
+    def test_free_capacity_of_busy_courier_is_zero(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
+
+        courier.take_order(ORDER)
+
+        assert courier.free_capacity == 0
+
+    def test_step_to(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
+        target = Location.create(2, 2).value
+
+        result = courier.step_to(target)
+
+        assert result.is_success
+        assert courier.location == target
+
+    def test_failure_step_to_if_farther_than_speed(self) -> None:
+        courier = Courier.create(name=COURIER_NAME, speed=COURIER_SPEED, location=COURIER_LOCATION).value
+
+        result = courier.step_to(Location.create(3, 2).value)
+
+        assert result.is_failure
+        assert result.error.code == "step.exceeds.speed"
+        assert courier.location == COURIER_LOCATION
@@ -130,3 +130,18 @@ class TestStoragePlace:
         sut.store(ORDER_UUID, create_volume(10))
 
         assert sut.is_occupied is True
+
+    def test_store_changes_only_order_id(self, sut: StoragePlace) -> None:
+        sut.mark_clean()
+
+        sut.store(ORDER_UUID, create_volume(10))
+
+        assert sut.get_changes() == {"order_id": ORDER_UUID}
+
+    def test_store_and_clear_leave_no_changes(self, sut: StoragePlace) -> None:
+        sut.mark_clean()
+
+        sut.store(ORDER_UUID, create_volume(10))
+        sut.clear(ORDER_UUID)
+
+        assert sut.get_changes() == {}
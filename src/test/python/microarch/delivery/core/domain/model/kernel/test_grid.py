@@ -0,0 +1,33 @@
+import itertools
+
+import pytest
+from microarch.delivery.core.domain.model.kernel.grid import Grid
+
+
+class TestGrid:
+    @pytest.mark.parametrize("size", [1, 3, 10])
+    def test_distances_match_manhattan_distance(self, size: int) -> None:
+        sut = Grid(size)
+
+        for (x1, y1), (x2, y2) in itertools.product(itertools.product(range(1, size + 1), repeat=2), repeat=2):
+            assert sut.distances[sut.cell(x1, y1)][sut.cell(x2, y2)] == abs(x1 - x2) + abs(y1 - y2)
+
+    def test_travel_times_per_speed(self) -> None:
+        sut = Grid(10, max_table_speed=3)
+
+        assert len(sut.travel_times) == 4
+        assert sut.travel_times[2][5] == 2.5
+        assert sut.travel_times[3][18] == 6.0
+
+    @pytest.mark.parametrize(("coords", "expected"), [((1, 1), True), ((3, 3), True), ((0, 2), False), ((2, 4), False)])
+    def test_contains(self, coords: tuple[int, int], expected: bool) -> None:
+        assert Grid(3).contains(*coords) is expected
+
+    def test_max_value(self) -> None:
+        sut = Grid(25)
+
+        assert sut.max_value == 25
+
+    def test_failure_non_positive_size(self) -> None:
+        with pytest.raises(ValueError, match="Grid size must be positive"):
+            Grid(0)
@@ -1,4 +1,5 @@
 import pytest
+from microarch.delivery.core.domain.model.kernel.grid import Grid
 from microarch.delivery.core.domain.model.kernel.location import Location
 
 
@@ -43,3 +44,38 @@ class TestLocation:
         result = courier_location.distance_to(home_location)
 
         assert result == expected
+
+    @pytest.mark.parametrize(
+        ("coords", "other_coords", "expected"),
+        [
+            ((0, 5), (1, 1), 5),
+            ((1, 1), (0, 5), 5),
+            ((11, 11), (1, 1), 20),
+            ((11, 11), (12, 9), 3),
+        ],
+    )
+    def test_distance_to_location_outside_grid(
+        self,
+        coords: tuple[int, int],
+        other_coords: tuple[int, int],
+        expected: int,
+    ) -> None:
+        result = Location.of(*coords).distance_to(Location.of(*other_coords))
+
+        assert result == expected
+
+    def test_create_returns_interned_location(self) -> None:
+        assert Location.create(4, 7).value is Location.create(4, 7).value
+        assert Location.create(4, 7).value is Location.of(4, 7)
+
+    def test_configure_grid(self) -> None:
+        default_grid = Location.GRID
+        Location.configure_grid(Grid(20))
+        try:
+            sut = Location.create(20, 15)
+
+            assert sut.is_success
+            assert sut.value.distance_to(Location.create(1, 1).value) == 33
+            assert Location.create(21, 1).is_failure
+        finally:
+            Location.configure_grid(default_grid)
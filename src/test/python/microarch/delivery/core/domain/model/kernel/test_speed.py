@@ -3,7 +3,7 @@ from microarch.delivery.core.domain.model.kernel.speed import Speed
 
 
 class TestSpeed:
-    @pytest.mark.parametrize("value", [1, 2])
+    @pytest.mark.parametrize("value", [1, 2, 1000])
     def test_success_create(self, value: int) -> None:
         result = Speed.create(value=value)
 
@@ -16,3 +16,12 @@ class TestSpeed:
 
         assert result.is_failure
         assert result.error.code == "value.must.be.greater.or.equal"
+
+    def test_create_returns_interned_value(self) -> None:
+        assert Speed.create(value=3).value is Speed.create(value=3).value
+        assert Speed.create(value=3).value is Speed.of(3)
+
+    def test_of_value_above_interned_range(self) -> None:
+        result = Speed.of(Speed.MAX_INTERNED + 1)
+
+        assert result == Speed.create(value=Speed.MAX_INTERNED + 1).value
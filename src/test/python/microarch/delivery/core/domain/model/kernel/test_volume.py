@@ -3,7 +3,7 @@ from microarch.delivery.core.domain.model.kernel.volume import Volume
 
 
 class TestVolume:
-    @pytest.mark.parametrize("value", [1, 2])
+    @pytest.mark.parametrize("value", [1, 2, 1000])
     def test_success_create(self, value: int) -> None:
         result = Volume.create(value=value)
 
@@ -16,3 +16,12 @@ class TestVolume:
 
         assert result.is_failure
         assert result.error.code == "value.must.be.greater.or.equal"
+
+    def test_create_returns_interned_value(self) -> None:
+        assert Volume.create(value=3).value is Volume.create(value=3).value
+        assert Volume.create(value=3).value is Volume.of(3)
+
+    def test_of_value_above_interned_range(self) -> None:
+        result = Volume.of(Volume.MAX_INTERNED + 1)
+
+        assert result == Volume.create(value=Volume.MAX_INTERNED + 1).value
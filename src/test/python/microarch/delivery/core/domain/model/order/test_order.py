@@ -1,11 +1,18 @@
 import uuid
 
+import pytest
+from libs.ddd.domain_event import DomainEvent
 from libs.errs import Guard
 from microarch.delivery.core.domain.model.courier import Courier
 from microarch.delivery.core.domain.model.kernel.location import Location
 from microarch.delivery.core.domain.model.kernel.speed import Speed
 from microarch.delivery.core.domain.model.kernel.volume import Volume
-from microarch.delivery.core.domain.model.order import Order, OrderStatusEnum
+from microarch.delivery.core.domain.model.order import (
+    Order,
+    OrderAssignedDomainEvent,
+    OrderCompletedDomainEvent,
+    OrderStatusEnum,
+)
 
 from python.helpers import create_volume
 
@@ -70,6 +77,28 @@ class TestOrder:
         assert result.is_success
         self.assert_order(order, expected_status=OrderStatusEnum.COMPLETED, expected_courier_id=COURIER.id_)
 
+    def test_assign_raises_domain_event(self) -> None:
+        order = Order.create(BASKET_ID, LOCATION, VOLUME).value
+
+        order.assign(COURIER)
+
+        [event] = order.get_domain_events()
+        assert isinstance(event, OrderAssignedDomainEvent)
+        assert event.order_id == BASKET_ID
+        assert event.courier_id == COURIER.id_
+
+    def test_complete_raises_domain_event(self) -> None:
+        order = Order.create(BASKET_ID, LOCATION, VOLUME).value
+        order.assign(COURIER)
+        order.clear_domain_events()
+
+        order.complete()
+
+        [event] = order.get_domain_events()
+        assert isinstance(event, OrderCompletedDomainEvent)
+        assert event.order_id == BASKET_ID
+        assert event.courier_id == COURIER.id_
+
     def test_failure_complete(self) -> None:
         order = Order.create(BASKET_ID, LOCATION, VOLUME).value
 
@@ -77,3 +106,39 @@ class TestOrder:
 
         assert result.is_failure
         assert result.error.code == "status.is.not.assigned"
+
+    def test_assign_changes_status_and_courier(self) -> None:
+        order = Order.create(BASKET_ID, LOCATION, VOLUME).value
+        order.mark_clean()
+
+        order.assign(COURIER)
+
+        assert order.get_changes() == {"status": OrderStatusEnum.ASSIGNED, "courier_id": COURIER.id_}
+
+    def test_restored_order_has_no_changes(self) -> None:
+        order = Order.restore(BASKET_ID, LOCATION, VOLUME, OrderStatusEnum.ASSIGNED, COURIER.id_)
+
+        assert not order.is_new
+        assert order.get_changes() == {}
+        self.assert_order(order, expected_status=OrderStatusEnum.ASSIGNED, expected_courier_id=COURIER.id_)
+
+    def test_restore_fails_if_fields_do_not_match_persistent_state(self) -> None:
+        order = Order.create(BASKET_ID, LOCATION, VOLUME).value
+
+        with pytest.raises(ValueError, match="do not match persistent state"):
+            order._restore_snapshot(("volume", "location", "status", "courier_id"), (VOLUME, LOCATION, None, None))
+
+    def test_order_has_no_instance_dict(self) -> None:
+        order = Order.create(BASKET_ID, LOCATION, VOLUME).value
+
+        assert not hasattr(order, "__dict__")
+
+    def test_domain_events(self) -> None:
+        order = Order.create(BASKET_ID, LOCATION, VOLUME).value
+        event = DomainEvent(order)
+
+        assert order.get_domain_events() == []
+        order.raise_domain_event(event)
+        assert order.get_domain_events() == [event]
+        order.clear_domain_events()
+        assert order.get_domain_events() == []
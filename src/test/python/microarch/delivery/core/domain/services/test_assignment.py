@@ -0,0 +1,37 @@
+import itertools
+
+import pytest
+from microarch.delivery.core.domain.services.assignment import solve_assignment
+
+
+class TestSolveAssignment:
+    def test_empty_matrix(self) -> None:
+        assert solve_assignment([]) == []
+
+    def test_failure_if_columns_less_than_rows(self) -> None:
+        with pytest.raises(ValueError):
+            solve_assignment([[1.0], [2.0]])
+
+    def test_square_matrix(self) -> None:
+        costs = [
+            [4.0, 1.0, 3.0],
+            [2.0, 0.0, 5.0],
+            [3.0, 2.0, 2.0],
+        ]
+
+        assert solve_assignment(costs) == [1, 0, 2]
+
+    def test_rectangular_matrix_is_optimal(self) -> None:
+        costs = [
+            [7.0, 3.0, 9.0, 4.0, 8.0],
+            [2.0, 6.0, 1.0, 5.0, 9.0],
+            [5.0, 4.0, 8.0, 2.0, 3.0],
+        ]
+
+        result = solve_assignment(costs)
+
+        assert len(set(result)) == len(costs)
+        expected = min(
+            sum(costs[row][col] for row, col in enumerate(cols)) for cols in itertools.permutations(range(5), 3)
+        )
+        assert sum(costs[row][col] for row, col in enumerate(result)) == expected
@@ -0,0 +1,29 @@
+import uuid
+
+from microarch.delivery.core.domain.services.courier_ranking import CourierRanking, TieBreak
+
+from python.constants import COURIER_LOCATION, COURIER_NAME, ORDER_LOCATION, ORDER_VOLUME
+from python.helpers import create_courier, create_order, create_speed
+
+
+class TestCourierRanking:
+    def test_id_order_always_closes_tie_break(self) -> None:
+        assert CourierRanking([TieBreak.HIGHEST_SPEED]).tie_break == (TieBreak.HIGHEST_SPEED, TieBreak.ID_ORDER)
+        assert CourierRanking().tie_break == CourierRanking.DEFAULT_TIE_BREAK
+
+    def test_key(self) -> None:
+        courier = create_courier(COURIER_NAME, create_speed(3), COURIER_LOCATION)
+        courier.take_order(create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME))
+
+        assert CourierRanking().key(courier, 2.5) == (2.5, 1, -3, courier.id_)
+        assert CourierRanking([TieBreak.HIGHEST_SPEED]).tie_key(courier) == (-3, courier.id_)
+
+    def test_best(self) -> None:
+        slow_courier = create_courier(COURIER_NAME, create_speed(1), COURIER_LOCATION)
+        fast_courier = create_courier(COURIER_NAME, create_speed(2), COURIER_LOCATION)
+
+        assert CourierRanking().best([slow_courier, fast_courier]) == fast_courier
+        assert CourierRanking([TieBreak.ID_ORDER]).best([slow_courier, fast_courier]) == min(
+            slow_courier,
+            fast_courier,
+        )
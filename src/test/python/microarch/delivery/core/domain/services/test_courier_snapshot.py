@@ -0,0 +1,61 @@
+import uuid
+
+import pytest
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.services.courier_ranking import CourierRanking
+from microarch.delivery.core.domain.services.courier_snapshot import CourierSnapshot
+
+from python.constants import COURIER_NAME, ORDER_VOLUME
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+
+class TestCourierSnapshot:
+    @pytest.fixture
+    def couriers(self) -> list[Courier]:
+        return [
+            create_courier(COURIER_NAME, create_speed(1), create_location(1, 1)),
+            create_courier(COURIER_NAME, create_speed(2), create_location(4, 5)),
+        ]
+
+    def test_columns(self, couriers: list[Courier]) -> None:
+        couriers[1].add_storage_place("car", create_volume(20))
+
+        sut = CourierSnapshot(couriers)
+
+        assert len(sut) == 2
+        assert sut.x.tolist() == [1, 4]
+        assert sut.y.tolist() == [1, 5]
+        assert sut.speed.tolist() == [1, 2]
+        assert sut.free_volume.tolist() == [10, 20]
+
+    def test_times_to_location(self, couriers: list[Courier]) -> None:
+        sut = CourierSnapshot(couriers)
+
+        assert sut.times_to_location(create_location(2, 3)).tolist() == [3.0, 2.0]
+
+    def test_refresh(self, couriers: list[Courier]) -> None:
+        sut = CourierSnapshot(couriers)
+        couriers[0].take_order(create_order(uuid.uuid4(), create_location(1, 1), ORDER_VOLUME))
+        couriers[0].move(create_location(3, 3))
+
+        sut.refresh(0)
+
+        assert (sut.x[0], sut.y[0], sut.free_volume[0]) == (2, 1, 0)
+
+    def test_find_fastest(self, couriers: list[Courier]) -> None:
+        sut = CourierSnapshot(couriers)
+        ranking = CourierRanking()
+
+        assert sut.find_fastest(create_location(1, 2), ORDER_VOLUME, ranking) == 0
+        assert sut.find_fastest(create_location(5, 5), ORDER_VOLUME, ranking) == 1
+        assert sut.find_fastest(create_location(5, 5), create_volume(15), ranking) is None
+        assert CourierSnapshot([]).find_fastest(create_location(5, 5), ORDER_VOLUME, ranking) is None
+
+    def test_find_fastest_uses_ranking_for_equal_times(self) -> None:
+        loaded_courier = create_courier(COURIER_NAME, create_speed(1), create_location(1, 1))
+        loaded_courier.add_storage_place("car", create_volume(20))
+        loaded_courier.take_order(create_order(uuid.uuid4(), create_location(1, 1), ORDER_VOLUME))
+        free_courier = create_courier(COURIER_NAME, create_speed(1), create_location(5, 1))
+        sut = CourierSnapshot([loaded_courier, free_courier])
+
+        assert sut.find_fastest(create_location(3, 1), ORDER_VOLUME, CourierRanking()) == 1
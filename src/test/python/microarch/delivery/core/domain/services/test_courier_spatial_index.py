@@ -0,0 +1,115 @@
+import uuid
+
+import pytest
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.services.courier_ranking import CourierRanking
+from microarch.delivery.core.domain.services.courier_spatial_index import CourierSpatialIndex
+
+from python.constants import COURIER_NAME, COURIER_SPEED, ORDER_LOCATION, ORDER_VOLUME
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+
+class TestCourierSpatialIndex:
+    @pytest.fixture
+    def couriers(self) -> list[Courier]:
+        return [
+            create_courier(COURIER_NAME, COURIER_SPEED, create_location(1, 1)),
+            create_courier(COURIER_NAME, COURIER_SPEED, create_location(5, 5)),
+            create_courier(COURIER_NAME, COURIER_SPEED, create_location(9, 9)),
+        ]
+
+    @pytest.fixture
+    def sut(self, couriers: list[Courier]) -> CourierSpatialIndex:
+        return CourierSpatialIndex(couriers)
+
+    def test_len_and_contains(self, sut: CourierSpatialIndex, couriers: list[Courier]) -> None:
+        other_courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(1, 1))
+
+        assert len(sut) == 3
+        assert couriers[0] in sut
+        assert other_courier not in sut
+
+    def test_nearest(self, sut: CourierSpatialIndex, couriers: list[Courier]) -> None:
+        result = list(sut.nearest(create_location(6, 6), ORDER_VOLUME))
+
+        assert result == [couriers[1], couriers[2], couriers[0]]
+
+    def test_nearest_skips_couriers_without_enough_free_volume(
+        self,
+        sut: CourierSpatialIndex,
+        couriers: list[Courier],
+    ) -> None:
+        couriers[0].add_storage_place("car", create_volume(20))
+        sut.update(couriers[0])
+
+        assert list(sut.nearest(create_location(6, 6), create_volume(15))) == [couriers[0]]
+
+    def test_find_fastest_takes_speed_into_account(self, couriers: list[Courier]) -> None:
+        fast_courier = create_courier(COURIER_NAME, create_speed(4), create_location(10, 10))
+        sut = CourierSpatialIndex([*couriers, fast_courier])
+
+        assert sut.find_fastest(create_location(8, 8), ORDER_VOLUME) == fast_courier
+
+    def test_find_fastest_returns_none_if_there_are_no_suitable_couriers(self, sut: CourierSpatialIndex) -> None:
+        assert sut.find_fastest(create_location(1, 1), create_volume(50)) is None
+        assert CourierSpatialIndex().find_fastest(create_location(1, 1), ORDER_VOLUME) is None
+
+    def test_take_and_complete_order_update_index(self, sut: CourierSpatialIndex, couriers: list[Courier]) -> None:
+        order = create_order(uuid.uuid4(), create_location(1, 1), ORDER_VOLUME)
+
+        result = sut.take_order(couriers[0], order)
+
+        assert result.is_success
+        assert sut.find_fastest(create_location(1, 1), ORDER_VOLUME) == couriers[1]
+
+        result = sut.complete_order(couriers[0], order)
+
+        assert result.is_success
+        assert sut.find_fastest(create_location(1, 1), ORDER_VOLUME) == couriers[0]
+
+    def test_move_updates_index(self, sut: CourierSpatialIndex, couriers: list[Courier]) -> None:
+        for _ in range(8):
+            sut.move(couriers[2], create_location(1, 1))
+
+        assert couriers[2].location == create_location(1, 1)
+        assert list(sut.nearest(create_location(1, 1), ORDER_VOLUME))[-1] == couriers[1]
+
+    def test_remove(self, sut: CourierSpatialIndex, couriers: list[Courier]) -> None:
+        sut.remove(couriers[1])
+
+        assert couriers[1] not in sut
+        assert couriers[1] not in list(sut.nearest(create_location(5, 5), ORDER_VOLUME))
+
+    def test_find_fastest_is_equal_to_full_scan(self) -> None:
+        couriers = [
+            create_courier(COURIER_NAME, create_speed(i % 3 + 1), create_location(i * 7 % 10 + 1, i * 3 % 10 + 1))
+            for i in range(0, 300, 11)
+        ]
+        ranking = CourierRanking()
+        sut = CourierSpatialIndex(couriers, ranking)
+
+        for x in range(1, 11):
+            for y in range(1, 11):
+                location = create_location(x, y)
+                expected = min(couriers, key=lambda c: ranking.key(c, c.calculate_time_to_location(location)))
+
+                assert sut.find_fastest(location, ORDER_VOLUME) is expected
+
+    def test_find_fastest_follows_ranking_within_cell(self) -> None:
+        # Arrange
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, create_location(2, 2)) for _ in range(5)]
+        for courier in couriers:
+            courier.add_storage_place("car", create_volume(20))
+        ranking = CourierRanking()
+        sut = CourierSpatialIndex(couriers, ranking)
+        best = sut.find_fastest(create_location(1, 1), ORDER_VOLUME)
+        assert best is min(couriers)
+
+        # Act
+        assert best is not None
+        sut.take_order(best, create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME))
+
+        # Assert
+        # Загруженный курьер остается в той же группе, но уступает место следующему по рангу.
+        assert sut.find_fastest(create_location(1, 1), ORDER_VOLUME) is sorted(couriers)[1]
+        assert list(sut.nearest(create_location(1, 1), ORDER_VOLUME)) == [*sorted(couriers)[1:], best]
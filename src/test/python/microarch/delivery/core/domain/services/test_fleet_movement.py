@@ -0,0 +1,96 @@
+import itertools
+import uuid
+
+import numpy as np
+import pytest
+from libs.errs.error import Error
+from libs.errs.unit_result import UnitResult
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import OrderStatusEnum
+from microarch.delivery.core.domain.services.fleet_movement import FleetMovement, step_towards
+from pytest_mock import MockerFixture
+
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+POSITIONS = [create_location(x, y) for x, y in itertools.product([1, 4, 10], [1, 6, 10])]
+
+
+@pytest.fixture
+def sut() -> FleetMovement:
+    return FleetMovement()
+
+
+class TestStepTowards:
+    @pytest.mark.parametrize("speed", [1, 2, 3, 5])
+    def test_matches_courier_move(self, speed: int) -> None:
+        pairs = list(itertools.product(POSITIONS, POSITIONS))
+        couriers = [create_courier("courier", create_speed(speed), start) for start, _ in pairs]
+        for courier, (_, target) in zip(couriers, pairs, strict=True):
+            courier.move(target)
+
+        x, y = step_towards(
+            np.array([start.x for start, _ in pairs]),
+            np.array([start.y for start, _ in pairs]),
+            np.full(len(pairs), speed),
+            np.array([target.x for _, target in pairs]),
+            np.array([target.y for _, target in pairs]),
+        )
+
+        assert list(zip(x.tolist(), y.tolist(), strict=True)) == [(c.location.x, c.location.y) for c in couriers]
+
+
+class TestFleetMovement:
+    def test_move_nothing(self, sut: FleetMovement) -> None:
+        assert sut.move([]) == []
+
+    def test_move_couriers_towards_orders(self, sut: FleetMovement) -> None:
+        courier = create_courier("courier", create_speed(2), create_location(1, 1))
+        order = create_order(uuid.uuid4(), create_location(5, 5), create_volume(5))
+        order.assign(courier)
+        courier.take_order(order)
+
+        completed = sut.move([(courier, order)])
+
+        assert completed == []
+        assert courier.location == create_location(3, 1)
+        assert order.status == OrderStatusEnum.ASSIGNED
+
+    def test_complete_orders_on_arrival(self, sut: FleetMovement) -> None:
+        courier = create_courier("courier", create_speed(3), create_location(4, 4))
+        order = create_order(uuid.uuid4(), create_location(5, 5), create_volume(5))
+        order.assign(courier)
+        courier.take_order(order)
+
+        completed = sut.move([(courier, order)])
+
+        assert completed == [order]
+        assert courier.location == order.location
+        assert order.status == OrderStatusEnum.COMPLETED
+        assert courier.free_capacity == 10
+
+    def test_dont_complete_order_the_courier_does_not_hold(self, sut: FleetMovement) -> None:
+        courier = create_courier("courier", create_speed(3), create_location(4, 4))
+        order = create_order(uuid.uuid4(), create_location(5, 5), create_volume(5))
+        order.assign(courier)
+        order.clear_domain_events()
+
+        completed = sut.move([(courier, order)])
+
+        assert completed == []
+        assert courier.location == order.location
+        assert order.status == OrderStatusEnum.ASSIGNED
+        assert order.get_domain_events() == []
+
+    def test_dont_complete_order_if_courier_cannot_step(self, sut: FleetMovement, mocker: MockerFixture) -> None:
+        courier = create_courier("courier", create_speed(3), create_location(4, 4))
+        order = create_order(uuid.uuid4(), create_location(5, 5), create_volume(5))
+        order.assign(courier)
+        courier.take_order(order)
+        mocker.patch.object(Courier, "step_to", return_value=UnitResult.failure(Error("step", "step failed")))
+
+        completed = sut.move([(courier, order)])
+
+        assert completed == []
+        assert courier.location == create_location(4, 4)
+        assert order.status == OrderStatusEnum.ASSIGNED
+        assert courier.free_capacity == 0
@@ -0,0 +1,75 @@
+import copy
+import uuid
+
+import pytest
+from microarch.delivery.core.domain.model.order import OrderStatusEnum
+from microarch.delivery.core.domain.services.optimal_order_dispatcher import OptimalOrderDispatcher
+from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
+
+from python.constants import COURIER_NAME, COURIER_SPEED, ORDER_LOCATION, ORDER_VOLUME
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+
+class TestOptimalOrderDispatcher:
+    @pytest.fixture
+    def sut(self) -> OptimalOrderDispatcher:
+        return OptimalOrderDispatcher()
+
+    def test_dispatch_many_assigns_order_that_greedy_leaves_unassigned(self, sut: OptimalOrderDispatcher) -> None:
+        # У ближнего курьера свободна только машина, которая нужна большому заказу.
+        near_courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(1, 1))
+        near_courier.add_storage_place("car", create_volume(20))
+        near_courier.take_order(create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME))
+        far_courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(10, 10))
+        small_order = create_order(uuid.uuid4(), create_location(1, 2), create_volume(5))
+        big_order = create_order(uuid.uuid4(), create_location(1, 1), create_volume(15))
+        greedy_results = OrderDispatcher().dispatch_many(
+            copy.deepcopy([small_order, big_order]),
+            copy.deepcopy([near_courier, far_courier]),
+        )
+
+        results = sut.dispatch_many([small_order, big_order], [near_courier, far_courier])
+
+        assert [r.is_success for r in greedy_results] == [True, False]
+        assert [r.is_success for r in results] == [True, True]
+        assert results[0].value == far_courier
+        assert results[1].value == near_courier
+        assert near_courier.storage_places[1].order_id == big_order.id_
+        assert far_courier.storage_places[0].order_id == small_order.id_
+
+    def test_dispatch_many_minimizes_total_time(self, sut: OptimalOrderDispatcher) -> None:
+        courier_1 = create_courier(COURIER_NAME, create_speed(1), create_location(1, 1))
+        courier_2 = create_courier(COURIER_NAME, create_speed(1), create_location(10, 10))
+        order_1 = create_order(uuid.uuid4(), create_location(2, 2), ORDER_VOLUME)
+        order_2 = create_order(uuid.uuid4(), create_location(1, 1), ORDER_VOLUME)
+
+        results = sut.dispatch_many([order_1, order_2], [courier_1, courier_2])
+
+        assert [r.value for r in results] == [courier_2, courier_1]
+        assert order_1.courier_id == courier_2.id_
+        assert order_2.courier_id == courier_1.id_
+
+    def test_dispatch_many_puts_orders_into_suitable_storage_places(self, sut: OptimalOrderDispatcher) -> None:
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(1, 1))
+        courier.add_storage_place("car", create_volume(20))
+        small_order = create_order(uuid.uuid4(), ORDER_LOCATION, create_volume(5))
+        big_order = create_order(uuid.uuid4(), ORDER_LOCATION, create_volume(12))
+
+        results = sut.dispatch_many([small_order, big_order], [courier])
+
+        assert all(r.is_success for r in results)
+        assert [sp.order_id for sp in courier.storage_places] == [small_order.id_, big_order.id_]
+
+    def test_dispatch_many_get_errors(self, sut: OptimalOrderDispatcher) -> None:
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(1, 1))
+        assigned_order = create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME)
+        assigned_order.assign(courier)
+        too_big_order = create_order(uuid.uuid4(), ORDER_LOCATION, create_volume(50))
+
+        results = sut.dispatch_many([assigned_order, too_big_order], [courier])
+        empty_results = sut.dispatch_many([too_big_order], [])
+
+        assert results[0].error.code == "order.is.not.created"
+        assert results[1].error.code == "there.are.no.suitable.couriers"
+        assert too_big_order.status == OrderStatusEnum.CREATED
+        assert empty_results[0].error.code == "list.of.courier.is.empty"
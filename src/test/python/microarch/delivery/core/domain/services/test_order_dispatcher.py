@@ -1,8 +1,15 @@
+import copy
+import uuid
+from collections.abc import AsyncIterator
+
 import pytest
+from microarch.delivery.core.domain.model.courier import Courier
+from microarch.delivery.core.domain.model.order import OrderStatusEnum
+from microarch.delivery.core.domain.services.courier_ranking import TieBreak
 from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
 
 from python.constants import BASKET_ID, COURIER_LOCATION, COURIER_NAME, COURIER_SPEED, ORDER_LOCATION, ORDER_VOLUME
-from python.helpers import create_courier, create_order, create_speed
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
 
 
 class TestOrderDispatcher:
@@ -46,8 +53,129 @@ class TestOrderDispatcher:
 
         result = sut.dispatch(order, couriers=[courier_1, courier_2])
 
+        # Курьеры одинаковы во всем, кроме идентификатора, поэтому побеждает меньший идентификатор.
+        expected, other = sorted([courier_1, courier_2])
         assert result.is_success
-        assert result.value == courier_2
-        assert courier_2.storage_places[0].order_id == order.id_
-        assert courier_1.storage_places[0].order_id is None
-        assert order.courier_id == courier_2.id_
+        assert result.value == expected
+        assert expected.storage_places[0].order_id == order.id_
+        assert other.storage_places[0].order_id is None
+        assert order.courier_id == expected.id_
+
+    def test_dispatch_order_prefers_least_loaded_courier(self, sut: OrderDispatcher) -> None:
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        loaded_courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        loaded_courier.add_storage_place("car", create_volume(20))
+        loaded_courier.take_order(create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME))
+        free_courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+
+        result = sut.dispatch(order, couriers=[free_courier, loaded_courier])
+
+        assert result.value == free_courier
+
+    def test_dispatch_order_with_highest_speed_tie_break(self) -> None:
+        sut = OrderDispatcher(tie_break=[TieBreak.HIGHEST_SPEED])
+        order = create_order(BASKET_ID, create_location(5, 1), ORDER_VOLUME)
+        slow_courier = create_courier(COURIER_NAME, create_speed(1), create_location(3, 1))
+        fast_courier = create_courier(COURIER_NAME, create_speed(2), create_location(1, 1))
+
+        result = sut.dispatch(order, couriers=[slow_courier, fast_courier])
+
+        assert result.value == fast_courier
+
+    def test_dispatch_order_does_not_depend_on_couriers_order(self, sut: OrderDispatcher) -> None:
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION) for _ in range(5)]
+        results = []
+
+        for shift in range(len(couriers)):
+            order = create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME)
+            shifted = copy.deepcopy(couriers[shift:] + couriers[:shift])
+            results.append(sut.dispatch(order, couriers=shifted).value)
+
+        assert len(set(results)) == 1
+
+    def test_dispatch_order_from_lazy_iterable(self, sut: OrderDispatcher) -> None:
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        couriers = [create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)]
+
+        result = sut.dispatch(order, couriers=(courier for courier in couriers))
+        empty_result = sut.dispatch(create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME), couriers=iter([]))
+
+        assert result.value == couriers[0]
+        assert empty_result.error.code == "list.of.courier.is.empty"
+
+    async def test_dispatch_stream(self, sut: OrderDispatcher) -> None:
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        far_courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(10, 10))
+        near_courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(2, 2))
+
+        async def stream() -> AsyncIterator[Courier]:
+            for courier in (far_courier, near_courier):
+                yield courier
+
+        result = await sut.dispatch_stream(order, stream())
+
+        assert result.value == near_courier
+        assert order.courier_id == near_courier.id_
+
+    async def test_dispatch_stream_get_error_if_stream_is_empty(self, sut: OrderDispatcher) -> None:
+        async def stream() -> AsyncIterator[Courier]:
+            couriers: tuple[Courier, ...] = ()
+            for courier in couriers:
+                yield courier
+
+        result = await sut.dispatch_stream(create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME), stream())
+
+        assert result.error.code == "list.of.courier.is.empty"
+
+    def test_dispatch_many_returns_result_per_order(self, sut: OrderDispatcher) -> None:
+        created_order = create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME)
+        assigned_order = create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME)
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        other_courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        assigned_order.assign(other_courier)
+
+        results = sut.dispatch_many([created_order, assigned_order], couriers=[courier])
+
+        assert len(results) == 2
+        assert results[0].is_success
+        assert results[0].value == courier
+        assert results[1].is_failure
+        assert results[1].error.code == "order.is.not.created"
+
+    def test_dispatch_many_get_error_if_list_of_courier_is_empty(self, sut: OrderDispatcher) -> None:
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+
+        results = sut.dispatch_many([order], couriers=[])
+
+        assert results[0].is_failure
+        assert results[0].error.code == "list.of.courier.is.empty"
+
+    def test_dispatch_many_takes_into_account_occupied_storage_places(self, sut: OrderDispatcher) -> None:
+        orders = [create_order(uuid.uuid4(), ORDER_LOCATION, ORDER_VOLUME) for _ in range(3)]
+        near_courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(1, 2))
+        far_courier = create_courier(COURIER_NAME, COURIER_SPEED, create_location(9, 9))
+
+        results = sut.dispatch_many(orders, couriers=[near_courier, far_courier])
+
+        assert [result.is_success for result in results] == [True, True, False]
+        assert results[0].value == near_courier
+        assert results[1].value == far_courier
+        assert results[2].error.code == "there.are.no.suitable.couriers"
+        assert orders[2].status == OrderStatusEnum.CREATED
+
+    def test_dispatch_many_is_equal_to_sequential_dispatch(self, sut: OrderDispatcher) -> None:
+        coords = [(x, y) for x in range(1, 11, 3) for y in range(1, 11, 2)]
+        orders = [create_order(uuid.uuid4(), create_location(x, y), create_volume(x)) for x, y in coords]
+        couriers = [
+            create_courier(COURIER_NAME, create_speed(x % 3 + 1), create_location(11 - y, x)) for x, y in coords[::2]
+        ]
+        for courier in couriers[::3]:
+            courier.add_storage_place("bag", create_volume(5))
+        expected_orders, expected_couriers = copy.deepcopy((orders, couriers))
+        expected_results = [sut.dispatch(order, expected_couriers) for order in expected_orders]
+
+        results = sut.dispatch_many(orders, couriers)
+
+        assert [r.is_success for r in results] == [r.is_success for r in expected_results]
+        assert [r.value.id_ for r in results if r.is_success] == [r.value.id_ for r in expected_results if r.is_success]
+        assert [o.courier_id for o in orders] == [o.courier_id for o in expected_orders]
@@ -0,0 +1,68 @@
+import copy
+import uuid
+
+import pytest
+from microarch.delivery.core.domain.services.order_dispatcher import OrderDispatcher
+from microarch.delivery.core.domain.services.vectorized_order_dispatcher import VectorizedOrderDispatcher
+
+from python.constants import BASKET_ID, COURIER_LOCATION, COURIER_NAME, COURIER_SPEED, ORDER_LOCATION, ORDER_VOLUME
+from python.helpers import create_courier, create_location, create_order, create_speed, create_volume
+
+
+class TestVectorizedOrderDispatcher:
+    @pytest.fixture
+    def sut(self) -> VectorizedOrderDispatcher:
+        return VectorizedOrderDispatcher()
+
+    def test_get_error_if_order_is_not_created(self, sut: VectorizedOrderDispatcher) -> None:
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        order.assign(courier)
+
+        result = sut.dispatch(order, couriers=[courier])
+
+        assert result.error.code == "order.is.not.created"
+
+    def test_get_error_if_list_of_courier_is_empty(self, sut: VectorizedOrderDispatcher) -> None:
+        result = sut.dispatch(create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME), couriers=[])
+
+        assert result.error.code == "list.of.courier.is.empty"
+
+    def test_get_error_if_there_are_no_suitable_courier(self, sut: VectorizedOrderDispatcher) -> None:
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+
+        result = sut.dispatch(create_order(BASKET_ID, ORDER_LOCATION, create_volume(50)), couriers=[courier])
+
+        assert result.error.code == "there.are.no.suitable.couriers"
+
+    def test_dispatch_order(self, sut: VectorizedOrderDispatcher) -> None:
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        courier_1 = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        courier_2 = create_courier(COURIER_NAME, create_speed(2), COURIER_LOCATION)
+
+        result = sut.dispatch(order, couriers=[courier_1, courier_2])
+
+        expected = min(courier_1, courier_2)
+        assert result.value == expected
+        assert expected.storage_places[0].order_id == order.id_
+        assert order.courier_id == expected.id_
+
+    def test_dispatch_many_is_equal_to_order_dispatcher(self, sut: VectorizedOrderDispatcher) -> None:
+        orders = [
+            create_order(uuid.uuid4(), create_location(i % 10 + 1, i * 7 % 10 + 1), create_volume(i % 15 + 1))
+            for i in range(60)
+        ]
+        couriers = [
+            create_courier(COURIER_NAME, create_speed(i % 3 + 1), create_location(i * 3 % 10 + 1, i % 10 + 1))
+            for i in range(40)
+        ]
+        for courier in couriers[::4]:
+            courier.add_storage_place("car", create_volume(15))
+        expected_orders, expected_couriers = copy.deepcopy((orders, couriers))
+        expected = [OrderDispatcher().dispatch(order, expected_couriers) for order in expected_orders]
+
+        results = sut.dispatch_many(orders, couriers)
+
+        assert [r.error.code if r.is_failure else r.value.id_ for r in results] == [
+            r.error.code if r.is_failure else r.value.id_ for r in expected
+        ]
@@ -0,0 +1,78 @@
+import typing
+
+import pytest
+from microarch.delivery.adapters.out.postgres.courier_repository import SqlAlchemyCourierRepository
+from microarch.delivery.adapters.out.postgres.order_repository import SqlAlchemyOrderRepository
+from microarch.delivery.core.domain.model.order import OrderStatusEnum
+from microarch.delivery.core.domain.uow import DeliveryUnitOfWork
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from python.constants import BASKET_ID, COURIER_LOCATION, COURIER_NAME, COURIER_SPEED, ORDER_LOCATION, ORDER_VOLUME
+from python.helpers import create_courier, create_order
+
+if typing.TYPE_CHECKING:
+    import uuid
+
+
+class TestDeliveryUnitOfWork:
+    async def test_commit_writes_new_courier_before_its_orders(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        # Arrange
+        courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        order = create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME)
+        order.assign(courier)
+        courier.take_order(order)
+
+        # Act
+        async with DeliveryUnitOfWork(session_factory) as uow:
+            # Новые агрегаты, созданные в единице работы и еще не записанные в БД.
+            uow._couriers_identity_map.add(courier)
+            uow._orders_identity_map.add(order)
+            await uow.commit()
+
+        # Assert
+        async with session_factory() as session:
+            loaded_order = await SqlAlchemyOrderRepository(session).get_by_id(BASKET_ID)
+            loaded_courier = await SqlAlchemyCourierRepository(session).get_by_id(
+                typing.cast("uuid.UUID", courier.id_),
+            )
+        assert loaded_order is not None
+        assert loaded_order.status == OrderStatusEnum.ASSIGNED
+        assert loaded_order.courier_id == courier.id_
+        assert loaded_courier is not None
+        assert [sp.order_id for sp in loaded_courier.storage_places] == [BASKET_ID]
+        assert courier.get_changes() == order.get_changes() == {}
+        assert order.get_domain_events() == []
+
+    async def test_failed_commit_keeps_changes_and_events(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        mocker: MockerFixture,
+    ) -> None:
+        # Arrange
+        saved_courier = create_courier(COURIER_NAME, COURIER_SPEED, COURIER_LOCATION)
+        async with session_factory() as session:
+            await SqlAlchemyCourierRepository(session).save(saved_courier)
+            await SqlAlchemyOrderRepository(session).save(create_order(BASKET_ID, ORDER_LOCATION, ORDER_VOLUME))
+            await session.commit()
+
+        async with DeliveryUnitOfWork(session_factory) as uow:
+            courier = await uow.couriers.get_by_id(typing.cast("uuid.UUID", saved_courier.id_))
+            assert courier is not None
+            order = await uow.orders.get_by_id(BASKET_ID)
+            assert order is not None
+            order.assign(courier)
+            courier.take_order(order)
+            mocker.patch.object(uow.session, "commit", side_effect=RuntimeError("connection lost"))
+
+            # Act
+            with pytest.raises(RuntimeError, match="connection lost"):
+                await uow.commit()
+
+        # Assert
+        assert order.get_changes() != {}
+        assert len(order.get_domain_events()) == 1
+        assert courier.storage_places[0].get_changes() != {}
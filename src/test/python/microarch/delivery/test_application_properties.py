@@ -0,0 +1,41 @@
+import typing
+
+import pydantic
+import pytest
+from microarch.delivery.application_properties import DispatcherProperties
+
+
+class TestDispatcherProperties:
+    def test_defaults_are_valid(self) -> None:
+        properties = DispatcherProperties()
+
+        assert properties.min_batch_size <= properties.max_batch_size
+        assert 0 < properties.min_poll_interval <= properties.max_poll_interval
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            {"min_batch_size": 0},
+            {"max_batch_size": 0},
+            {"min_poll_interval": 0},
+            {"max_poll_interval": 0},
+            {"candidates_per_order": 0},
+        ],
+    )
+    def test_rejects_out_of_bounds_values(self, values: dict[str, typing.Any]) -> None:
+        with pytest.raises(pydantic.ValidationError):
+            DispatcherProperties(**values)
+
+    @pytest.mark.parametrize(
+        ("values", "message"),
+        [
+            ({"min_batch_size": 10, "max_batch_size": 5}, "max_batch_size 5 is less than min_batch_size 10"),
+            (
+                {"min_poll_interval": 2, "max_poll_interval": 1},
+                "max_poll_interval 1.0 is less than min_poll_interval 2.0",
+            ),
+        ],
+    )
+    def test_rejects_max_less_than_min(self, values: dict[str, typing.Any], message: str) -> None:
+        with pytest.raises(pydantic.ValidationError, match=message):
+            DispatcherProperties(**values)
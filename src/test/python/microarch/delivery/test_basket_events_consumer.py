@@ -0,0 +1,199 @@
+import json
+import logging
+import typing
+import uuid
+
+import pytest
+from libs.errs import Error
+from microarch.delivery.application_properties import KafkaConsumerProperties
+from microarch.delivery.basket_events_consumer import (
+    BASKET_CONFIRMED_EVENT_TYPE,
+    BasketEventsConsumer,
+    TopicPartition,
+    parse_basket_confirmed,
+)
+from microarch.delivery.core.application.create_orders import (
+    CreateOrderCommand,
+    CreateOrdersHandler,
+    CreateOrdersResult,
+)
+
+from python.helpers import StubHandler
+
+TOPIC = "baskets.events"
+PROPERTIES = KafkaConsumerProperties(max_poll_records=3, poll_timeout_ms=0)
+
+
+class FakeRecord(typing.NamedTuple):
+    offset: int
+    value: bytes | None
+
+
+class FakeKafkaBroker:
+    # Топик в памяти и консьюмер одной группы: позиция чтения и закоммиченные смещения по партициям.
+
+    def __init__(self, partitions: int = 2) -> None:
+        self.logs: dict[TopicPartition, list[bytes | None]] = {
+            TopicPartition(TOPIC, partition): [] for partition in range(partitions)
+        }
+        self.positions = dict.fromkeys(self.logs, 0)
+        self.committed = dict.fromkeys(self.logs, 0)
+
+    def send(self, partition: int, value: bytes | None) -> None:
+        self.logs[TopicPartition(TOPIC, partition)].append(value)
+
+    async def getmany(
+        self,
+        timeout_ms: int = 0,  # noqa: ARG002 - сообщения в памяти доступны сразу
+        max_records: int | None = None,
+    ) -> dict[TopicPartition, list[FakeRecord]]:
+        records: dict[TopicPartition, list[FakeRecord]] = {}
+        budget = max_records or sum(len(log) for log in self.logs.values())
+        for partition, log in self.logs.items():
+            position = self.positions[partition]
+            batch = [FakeRecord(offset, log[offset]) for offset in range(position, min(len(log), position + budget))]
+            if batch:
+                records[partition] = batch
+                self.positions[partition] += len(batch)
+                budget -= len(batch)
+        return records
+
+    async def commit(self, offsets: typing.Mapping[TopicPartition, int]) -> None:
+        self.committed.update(offsets)
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self.positions[partition] = offset
+
+
+class RecordingHandler(StubHandler[CreateOrdersResult]):
+    # Запоминает закоммиченные смещения на момент каждого вызова.
+
+    def __init__(self, broker: FakeKafkaBroker, *results: CreateOrdersResult | Exception) -> None:
+        super().__init__(*results, CreateOrdersResult(received=1, created=1, duplicates=0, rejected=[]))
+        self.committed_before_handle: list[dict[TopicPartition, int]] = []
+        self._broker = broker
+
+    async def handle(self, commands: typing.Sequence[CreateOrderCommand]) -> CreateOrdersResult:
+        self.committed_before_handle.append(dict(self._broker.committed))
+        return await super().handle(commands)
+
+
+def basket_confirmed(basket_id: uuid.UUID | None = None, event_type: str = BASKET_CONFIRMED_EVENT_TYPE) -> bytes:
+    return json.dumps(
+        {
+            "eventId": str(uuid.uuid4()),
+            "eventType": event_type,
+            "occurredAt": "2024-01-01T12:00:00Z",
+            "basketId": str(basket_id or uuid.uuid4()),
+            "address": {"country": "Россия", "city": "Москва", "street": "Тверская", "house": "1", "apartment": "2"},
+            "items": [],
+            "deliveryPeriod": {"from": 9, "to": 12},
+            "volume": 5,
+        },
+    ).encode()
+
+
+def create_consumer(broker: FakeKafkaBroker, handler: RecordingHandler) -> BasketEventsConsumer:
+    return BasketEventsConsumer(broker, typing.cast("CreateOrdersHandler", handler), PROPERTIES)
+
+
+class TestParseBasketConfirmed:
+    def test_parse(self) -> None:
+        basket_id = uuid.uuid4()
+
+        command = parse_basket_confirmed(basket_confirmed(basket_id))
+
+        assert command is not None
+        assert command.basket_id == basket_id
+        assert command.street == "Тверская"
+        assert command.volume == 5
+
+    def test_other_event_types_are_skipped(self) -> None:
+        assert parse_basket_confirmed(basket_confirmed(event_type="BasketCancelledIntegrationEvent")) is None
+
+    @pytest.mark.parametrize("value", [None, b"not json", b"[]", b'{"eventType": "BasketConfirmedIntegrationEvent"}'])
+    def test_invalid_message(self, value: bytes | None) -> None:
+        with pytest.raises(ValueError, match="Invalid basket event"):
+            parse_basket_confirmed(value)
+
+
+class TestBasketEventsConsumer:
+    async def test_batch_is_committed_after_handling(self) -> None:
+        # Arrange
+        broker = FakeKafkaBroker()
+        broker.send(0, basket_confirmed())
+        broker.send(0, basket_confirmed(event_type="BasketCancelledIntegrationEvent"))
+        broker.send(1, b"not json")
+        handler = RecordingHandler(broker)
+        sut = create_consumer(broker, handler)
+
+        # Act
+        assert await sut.run_once() == 0
+
+        # Assert
+        assert [len(commands) for (commands,) in handler.calls] == [1]
+        assert handler.committed_before_handle == [{TopicPartition(TOPIC, 0): 0, TopicPartition(TOPIC, 1): 0}]
+        assert broker.committed == {TopicPartition(TOPIC, 0): 2, TopicPartition(TOPIC, 1): 1}
+        assert sut.metrics.messages == 3
+        assert sut.metrics.orders_created == 1
+        assert sut.metrics.messages_rejected == 1
+
+    async def test_batches_are_limited_by_max_poll_records(self) -> None:
+        broker = FakeKafkaBroker(partitions=1)
+        for _ in range(5):
+            broker.send(0, basket_confirmed())
+        handler = RecordingHandler(broker)
+        sut = create_consumer(broker, handler)
+
+        await sut.run_once()
+        await sut.run_once()
+
+        assert [len(commands) for (commands,) in handler.calls] == [3, 2]
+        assert broker.committed == {TopicPartition(TOPIC, 0): 5}
+
+    async def test_failed_batch_is_not_committed_and_read_again(self) -> None:
+        # Arrange
+        broker = FakeKafkaBroker()
+        broker.send(0, basket_confirmed())
+        broker.send(1, basket_confirmed())
+        handler = RecordingHandler(broker, RuntimeError("db is down"))
+        sut = create_consumer(broker, handler)
+
+        # Act
+        await sut.run_once()
+        committed_after_failure = dict(broker.committed)
+        await sut.run_once()
+
+        # Assert
+        assert committed_after_failure == {TopicPartition(TOPIC, 0): 0, TopicPartition(TOPIC, 1): 0}
+        assert [len(commands) for (commands,) in handler.calls] == [2, 2]
+        assert broker.committed == {TopicPartition(TOPIC, 0): 1, TopicPartition(TOPIC, 1): 1}
+        assert sut.metrics.errors == 1
+
+    async def test_rejected_orders_are_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        # Arrange
+        broker = FakeKafkaBroker(partitions=1)
+        basket_id = uuid.uuid4()
+        broker.send(0, basket_confirmed(basket_id))
+
+        command = CreateOrderCommand(uuid.uuid4(), basket_id, "Тверская", 5)
+        error = Error("street.is.unknown", "The geo service does not know the street")
+        sut = create_consumer(broker, RecordingHandler(broker, CreateOrdersResult(1, 0, 0, [(command, error)])))
+
+        # Act
+        with caplog.at_level(logging.WARNING):
+            await sut.run_once()
+
+        # Assert
+        assert f"Basket {basket_id} rejected: street.is.unknown" in caplog.text
+        assert sut.metrics.messages_rejected == 1
+        assert broker.committed == {TopicPartition(TOPIC, 0): 1}
+
+    async def test_empty_poll(self) -> None:
+        broker = FakeKafkaBroker()
+        handler = RecordingHandler(broker)
+        sut = create_consumer(broker, handler)
+
+        assert await sut.run_once() == 0
+        assert handler.calls == []
+        assert sut.metrics.batches == 0
@@ -0,0 +1,103 @@
+import asyncio
+import datetime
+import typing
+
+import pytest
+from microarch.delivery.application_properties import DispatcherProperties
+from microarch.delivery.core.application.assign_orders import AssignOrdersHandler, AssignOrdersResult
+from microarch.delivery.dispatch_worker import AdaptiveBatchPolicy, DispatchWorker
+
+from python.helpers import StubHandler
+
+PROPERTIES = DispatcherProperties(min_batch_size=1, max_batch_size=8, min_poll_interval=0.1, max_poll_interval=1.0)
+LAG = datetime.timedelta(seconds=3)
+
+
+@pytest.fixture
+def sut() -> AdaptiveBatchPolicy:
+    return AdaptiveBatchPolicy(PROPERTIES)
+
+
+class TestAdaptiveBatchPolicy:
+    def test_starts_with_min_batch_and_interval(self, sut: AdaptiveBatchPolicy) -> None:
+        assert sut.batch_size == PROPERTIES.min_batch_size
+        assert sut.poll_interval == PROPERTIES.min_poll_interval
+
+    def test_grows_batch_under_backlog_up_to_max(self, sut: AdaptiveBatchPolicy) -> None:
+        sizes = []
+        for _ in range(5):
+            sut.on_batch(AssignOrdersResult(claimed=sut.batch_size, assigned=sut.batch_size, lag=LAG))
+            sizes.append(sut.batch_size)
+
+        assert sizes == [2, 4, 8, 8, 8]
+        assert sut.poll_interval == PROPERTIES.min_poll_interval
+
+    def test_backs_off_when_idle_up_to_max(self, sut: AdaptiveBatchPolicy) -> None:
+        intervals = []
+        for _ in range(5):
+            sut.on_batch(AssignOrdersResult(claimed=0, assigned=0, lag=None))
+            intervals.append(sut.poll_interval)
+
+        assert intervals == [0.2, 0.4, 0.8, 1.0, 1.0]
+        assert sut.batch_size == PROPERTIES.min_batch_size
+
+    def test_shrinks_batch_when_idle(self, sut: AdaptiveBatchPolicy) -> None:
+        sut.batch_size = 8
+
+        sut.on_batch(AssignOrdersResult(claimed=0, assigned=0, lag=None))
+
+        assert sut.batch_size == 4
+
+    def test_backs_off_when_orders_cannot_be_assigned(self, sut: AdaptiveBatchPolicy) -> None:
+        sut.on_batch(AssignOrdersResult(claimed=1, assigned=0, lag=LAG))
+
+        assert sut.poll_interval == 0.2
+        assert sut.batch_size == 1
+
+    def test_resets_interval_after_partial_batch(self, sut: AdaptiveBatchPolicy) -> None:
+        sut.batch_size, sut.poll_interval = 4, 1.0
+
+        sut.on_batch(AssignOrdersResult(claimed=2, assigned=2, lag=LAG))
+
+        assert sut.batch_size == 4
+        assert sut.poll_interval == PROPERTIES.min_poll_interval
+
+
+class TestDispatchWorker:
+    async def test_run_once_records_metrics_and_adapts_batch(self) -> None:
+        handler = StubHandler(
+            AssignOrdersResult(claimed=1, assigned=1, lag=LAG),
+            AssignOrdersResult(claimed=2, assigned=1, lag=LAG),
+        )
+        worker = DispatchWorker(typing.cast("AssignOrdersHandler", handler), PROPERTIES)
+
+        await worker.run_once()
+        await worker.run_once()
+
+        assert handler.calls == [(1,), (2,)]
+        assert worker.metrics.batches == 2
+        assert worker.metrics.orders_claimed == 3
+        assert worker.metrics.orders_assigned == 2
+        assert worker.metrics.lag == LAG
+        assert worker.metrics.throughput > 0
+
+    async def test_run_once_backs_off_on_error(self) -> None:
+        handler = StubHandler[AssignOrdersResult](RuntimeError("db is down"))
+        worker = DispatchWorker(typing.cast("AssignOrdersHandler", handler), PROPERTIES)
+
+        assert await worker.run_once() == 0.2
+
+        assert worker.metrics.errors == 1
+        assert worker.metrics.batches == 0
+        assert worker.policy.poll_interval == 0.2
+
+    async def test_run_until_stopped(self) -> None:
+        handler = StubHandler(AssignOrdersResult(claimed=0, assigned=0, lag=None))
+        worker = DispatchWorker(typing.cast("AssignOrdersHandler", handler), PROPERTIES)
+
+        task = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.05)
+        worker.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert worker.metrics.batches >= 1
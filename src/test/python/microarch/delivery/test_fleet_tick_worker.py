@@ -0,0 +1,46 @@
+import asyncio
+import typing
+
+from microarch.delivery.application_properties import FleetProperties
+from microarch.delivery.core.application.move_couriers import MoveCouriersHandler, MoveCouriersResult
+from microarch.delivery.fleet_tick_worker import FleetTickWorker
+
+from python.helpers import StubHandler
+
+PROPERTIES = FleetProperties(tick_interval=0.01)
+
+
+class TestFleetTickWorker:
+    async def test_run_once_records_metrics(self) -> None:
+        worker = FleetTickWorker(
+            typing.cast("MoveCouriersHandler", StubHandler(MoveCouriersResult(moved=3, completed=1))),
+            PROPERTIES,
+        )
+
+        await worker.run_once()
+
+        assert worker.metrics.ticks == 1
+        assert worker.metrics.couriers_moved == 3
+        assert worker.metrics.orders_completed == 1
+
+    async def test_run_once_counts_errors(self) -> None:
+        worker = FleetTickWorker(
+            typing.cast("MoveCouriersHandler", StubHandler(RuntimeError("db is down"))),
+            PROPERTIES,
+        )
+
+        await worker.run_once()
+
+        assert worker.metrics.errors == 1
+        assert worker.metrics.ticks == 0
+
+    async def test_run_ticks_until_stopped(self) -> None:
+        handler = StubHandler[MoveCouriersResult](MoveCouriersResult(moved=0, completed=0))
+        worker = FleetTickWorker(typing.cast("MoveCouriersHandler", handler), PROPERTIES)
+
+        task = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.05)
+        worker.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert len(handler.calls) > 1
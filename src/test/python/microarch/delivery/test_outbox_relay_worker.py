@@ -0,0 +1,64 @@
+import asyncio
+import datetime
+import typing
+
+from microarch.delivery.application_properties import OutboxProperties
+from microarch.delivery.core.application.relay_outbox import RelayOutboxHandler, RelayOutboxResult
+from microarch.delivery.outbox_relay_worker import OutboxRelayWorker
+
+from python.helpers import StubHandler
+
+PROPERTIES = OutboxProperties(batch_size=10, poll_interval=0.01)
+
+
+def batch(published: int, latency: float = 0.0) -> RelayOutboxResult:
+    return RelayOutboxResult(
+        published=published,
+        max_latency=datetime.timedelta(seconds=latency),
+        total_latency=datetime.timedelta(seconds=latency * published),
+    )
+
+
+def create_worker(handler: StubHandler[RelayOutboxResult]) -> OutboxRelayWorker:
+    return OutboxRelayWorker(typing.cast("RelayOutboxHandler", handler), PROPERTIES)
+
+
+class TestOutboxRelayWorker:
+    async def test_run_once_records_metrics(self) -> None:
+        handler = StubHandler(batch(4, latency=0.5), batch(2, latency=2.0))
+        worker = create_worker(handler)
+
+        await worker.run_once()
+        await worker.run_once()
+
+        assert handler.calls == [(PROPERTIES.batch_size,)] * 2
+        assert worker.metrics.batches == 2
+        assert worker.metrics.events_published == 6
+        assert worker.metrics.last_max_latency == datetime.timedelta(seconds=2)
+        assert worker.metrics.mean_latency == datetime.timedelta(seconds=1)
+        assert worker.metrics.throughput > 0
+
+    async def test_run_once_counts_errors(self) -> None:
+        worker = create_worker(StubHandler(RuntimeError("db is down")))
+
+        assert await worker.run_once() == PROPERTIES.poll_interval
+        assert worker.metrics.errors == 1
+        assert worker.metrics.batches == 0
+
+    async def test_full_batches_are_relayed_without_waiting(self) -> None:
+        # Пауза заведомо больше таймаута теста: если после полной пачки цикл ждет, тест упадет по таймауту.
+        handler = StubHandler(batch(10), batch(10), batch(3))
+        worker = OutboxRelayWorker(
+            typing.cast("RelayOutboxHandler", handler),
+            OutboxProperties(batch_size=PROPERTIES.batch_size, poll_interval=60),
+        )
+        task = asyncio.create_task(worker.run())
+
+        async with asyncio.timeout(5):
+            while len(handler.calls) < 3:  # noqa: ASYNC110
+                await asyncio.sleep(0)
+        worker.stop()
+        await task
+
+        assert worker.metrics.batches == 3
+        assert worker.metrics.events_published == 23
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+
+import pytest
+from microarch.delivery.periodic_worker import PeriodicWorker, WorkerMetrics
+
+from python.helpers import StubHandler
+
+
+class CountingWorker(PeriodicWorker[WorkerMetrics]):
+    _failure_message = "Counting step failed"
+
+    def __init__(self, handler: StubHandler[float]) -> None:
+        super().__init__(WorkerMetrics())
+        self.handler = handler
+
+    async def _step(self) -> float:
+        return await self.handler.handle()
+
+    def _pause_after_error(self) -> float:
+        return 60.0
+
+
+class TestPeriodicWorker:
+    async def test_run_once_logs_and_counts_errors(self, caplog: pytest.LogCaptureFixture) -> None:
+        worker = CountingWorker(StubHandler(RuntimeError("db is down")))
+
+        with caplog.at_level(logging.ERROR):
+            pause = await worker.run_once()
+
+        assert pause == 60.0
+        assert worker.metrics.errors == 1
+        assert "Counting step failed" in caplog.text
+
+    async def test_stop_interrupts_pause(self) -> None:
+        # Пауза заведомо больше таймаута теста: если `stop` не прерывает ожидание, тест упадет по таймауту.
+        handler = StubHandler[float](0.0, 0.0, 60.0)
+        worker = CountingWorker(handler)
+        task = asyncio.create_task(worker.run())
+
+        async with asyncio.timeout(5):
+            while len(handler.calls) < 3:  # noqa: ASYNC110
+                await asyncio.sleep(0)
+            worker.stop()
+            await task
+
+        assert len(handler.calls) == 3